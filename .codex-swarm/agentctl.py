@@ -8,20 +8,31 @@ workflows (readiness checks, safe tasks.json updates, and git hygiene).
 from __future__ import annotations
 
 import argparse
+import contextlib
+import cProfile
 import hashlib
+import heapq
 import importlib.util
+import io
 import json
 import os
 import re
+import socket
+import statistics
 import subprocess
 import sys
+import time
+import traceback
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn, Protocol, TypedDict, TypeGuard, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from types import ModuleType
+
+_IMPORT_STARTED = time.perf_counter()
 
 JsonDict = dict[str, object]
 TaskRecord = dict[str, object]
@@ -35,6 +46,35 @@ class PrContext(TypedDict):
     pr_meta: JsonDict
 
 
+class TimingSpan(TypedDict):
+    category: str
+    name: str
+    start: float
+    duration: float
+    args: JsonDict
+
+
+class LintContext(TypedDict):
+    dep_state: DependencyState
+    known_agents: set[str]
+    verify_tags: set[str]
+    statuses: dict[str, str]
+
+
+class WriteBatch(TypedDict):
+    tasks: TaskList | None
+    save: Callable[[TaskList], None] | None
+    dirty: set[str]
+    save_calls: int
+    export_calls: int
+    export_quiet: bool
+    lint: bool
+
+
+LintBatch = list[tuple[str, TaskRecord]]
+TaskLintRule = Callable[[LintContext, LintBatch], list[str]]
+
+
 # Backend capability interfaces for optional features (checked via supports_* helpers).
 class BackendTaskListWrite(Protocol):
     def list_tasks(self) -> TaskList: ...
@@ -42,6 +82,10 @@ class BackendTaskListWrite(Protocol):
     def write_task(self, task: TaskRecord) -> None: ...
 
 
+class BackendListTaskHeaders(Protocol):
+    def list_task_headers(self) -> TaskList: ...
+
+
 class BackendWriteTasks(Protocol):
     def write_tasks(self, tasks: TaskList) -> None: ...
 
@@ -50,6 +94,10 @@ class BackendWriteTask(Protocol):
     def write_task(self, task: TaskRecord) -> None: ...
 
 
+class BackendImportTasks(Protocol):
+    def import_tasks(self, tasks: TaskList, *, on_written: Callable[[TaskRecord], None] | None = None) -> None: ...
+
+
 class BackendExportTasks(Protocol):
     def export_tasks_json(self, path: Path) -> None: ...
 
@@ -74,6 +122,28 @@ class BackendTouchTaskDocMetadata(Protocol):
     def touch_task_doc_metadata(self, task_id: str, *, updated_by: str | None = None) -> None: ...
 
 
+class BackendGetTask(Protocol):
+    def get_task(self, task_id: str) -> TaskRecord | None: ...
+
+
+class BackendCompareAndWriteTask(Protocol):
+    def compare_and_write_task(self, task: TaskRecord, *, expected_digest: str | None) -> str: ...
+
+
+class BackendQueryTasks(Protocol):
+    def query_tasks(
+        self,
+        *,
+        status: list[str] | None = None,
+        owner: list[str] | None = None,
+        tag: list[str] | None = None,
+        text: str | None = None,
+        regex: bool = False,
+    ) -> TaskList: ...
+
+    def get_tasks(self, task_ids: list[str]) -> TaskList: ...
+
+
 class BackendNormalizeTasks(Protocol):
     def normalize_tasks(self) -> int: ...
 
@@ -89,11 +159,27 @@ class BackendSyncTasks(Protocol):
     ) -> None: ...
 
 
+class BackendResetCaches(Protocol):
+    def reset_caches(self) -> None: ...
+
+
+class BackendFlushOutbox(Protocol):
+    def flush_outbox(self) -> dict[str, int]: ...
+
+
+class BackendChangeStamp(Protocol):
+    def change_stamp(self) -> str: ...
+
+
 # Duck-typing helpers to gate backend features without hard dependencies.
 def supports_task_list_write(backend: object) -> TypeGuard[BackendTaskListWrite]:
     return callable(getattr(backend, "list_tasks", None)) and callable(getattr(backend, "write_task", None))
 
 
+def supports_list_task_headers(backend: object) -> TypeGuard[BackendListTaskHeaders]:
+    return callable(getattr(backend, "list_task_headers", None))
+
+
 def supports_write_tasks(backend: object) -> TypeGuard[BackendWriteTasks]:
     return callable(getattr(backend, "write_tasks", None))
 
@@ -102,6 +188,10 @@ def supports_write_task(backend: object) -> TypeGuard[BackendWriteTask]:
     return callable(getattr(backend, "write_task", None))
 
 
+def supports_import_tasks(backend: object) -> TypeGuard[BackendImportTasks]:
+    return callable(getattr(backend, "import_tasks", None))
+
+
 def supports_export_tasks(backend: object) -> TypeGuard[BackendExportTasks]:
     return callable(getattr(backend, "export_tasks_json", None))
 
@@ -126,6 +216,18 @@ def supports_touch_task_doc_metadata(backend: object) -> TypeGuard[BackendTouchT
     return callable(getattr(backend, "touch_task_doc_metadata", None))
 
 
+def supports_get_task(backend: object) -> TypeGuard[BackendGetTask]:
+    return callable(getattr(backend, "get_task", None))
+
+
+def supports_compare_and_write_task(backend: object) -> TypeGuard[BackendCompareAndWriteTask]:
+    return callable(getattr(backend, "compare_and_write_task", None))
+
+
+def supports_query_tasks(backend: object) -> TypeGuard[BackendQueryTasks]:
+    return callable(getattr(backend, "query_tasks", None)) and callable(getattr(backend, "get_tasks", None))
+
+
 def supports_normalize_tasks(backend: object) -> TypeGuard[BackendNormalizeTasks]:
     return callable(getattr(backend, "normalize_tasks", None))
 
@@ -134,10 +236,30 @@ def supports_sync_tasks(backend: object) -> TypeGuard[BackendSyncTasks]:
     return callable(getattr(backend, "sync", None))
 
 
+def supports_reset_caches(backend: object) -> TypeGuard[BackendResetCaches]:
+    return callable(getattr(backend, "reset_caches", None))
+
+
+def supports_flush_outbox(backend: object) -> TypeGuard[BackendFlushOutbox]:
+    return callable(getattr(backend, "flush_outbox", None))
+
+
+def supports_change_stamp(backend: object) -> TypeGuard[BackendChangeStamp]:
+    return callable(getattr(backend, "change_stamp", None))
+
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT = SCRIPT_DIR.parent
 SWARM_DIR = ROOT / ".codex-swarm"
 SWARM_CONFIG_PATH = SWARM_DIR / "config.json"
+LOCKS_DIR = SWARM_DIR / ".locks"
+CACHE_DIR = SWARM_DIR / ".cache"
+LINT_STATE_PATH = CACHE_DIR / "lint-state.json"
+LINT_STATE_VERSION = 1
+# Tasks an interrupted `task migrate` already wrote: a scope header line, then one {"id", "digest"} line per task.
+MIGRATE_CHECKPOINT_PATH = CACHE_DIR / "migrate-checkpoint.jsonl"
+MIGRATE_BATCH_SIZE = 50
+DEFAULT_LOCK_TIMEOUT_SECONDS = 10.0
 
 ALLOWED_WORKFLOW_MODES: set[str] = {"direct", "branch_pr"}
 DEFAULT_WORKFLOW_MODE = "direct"
@@ -212,6 +334,48 @@ FRAMEWORK_LAST_UPDATE_KEY = "last_update"
 FRAMEWORK_STALE_DAYS = 10
 
 
+# `agentctl serve` protocol: newline-delimited JSON-RPC 2.0 over a Unix socket. agentctl_client.py, which must
+# stay importable without agentctl.py, carries the same values.
+SERVER_SOCKET_ENV = "CODEXSWARM_SERVER_SOCKET"
+SERVER_DISABLE_ENV = "CODEXSWARM_NO_SERVER"
+SERVER_SOCKET_PATH = Path(os.environ.get(SERVER_SOCKET_ENV, "").strip() or SCRIPT_DIR / ".cache" / "agentctl.sock")
+# The server refused the request without running it (its code or config changed); run it locally instead.
+SERVER_STALE_ERROR = -32001
+AGENTCTL_CLIENT_PATH = SCRIPT_DIR / "agentctl_client.py"
+_AGENTCTL_CLIENT: ModuleType | None = None
+
+
+def load_agentctl_client() -> ModuleType | None:
+    """Load agentctl_client.py, the stdlib-only thin client; None when it is not installed next to agentctl.py."""
+    global _AGENTCTL_CLIENT
+    if _AGENTCTL_CLIENT is not None:
+        return _AGENTCTL_CLIENT
+    if not AGENTCTL_CLIENT_PATH.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location("codex_swarm_agentctl_client", AGENTCTL_CLIENT_PATH)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _AGENTCTL_CLIENT = module
+    return module
+
+
+def forward_to_server(argv: list[str]) -> int | None:
+    """Relay the command to a running `agentctl serve`; None means run it in this process."""
+    if os.environ.get(SERVER_DISABLE_ENV, "").strip() == "1" or not SERVER_SOCKET_PATH.exists():
+        return None
+    client = load_agentctl_client()
+    if client is None:
+        return None
+    return cast(Callable[[list[str]], int | None], client.forward_to_server)(argv)
+
+
+# Forward before config and backend loading so a served command skips that start-up work.
+if __name__ == "__main__" and (_SERVED_EXIT_CODE := forward_to_server(sys.argv[1:])) is not None:
+    raise SystemExit(_SERVED_EXIT_CODE)
+
+
 def load_env_file(path: Path) -> None:
     if not path.exists():
         return
@@ -234,6 +398,143 @@ def load_env_file(path: Path) -> None:
         os.environ[key] = value
 
 
+# Spans recorded under --timings; None (the default) keeps every timing_span() a no-op.
+_TIMING_SPANS: list[TimingSpan] | None = None
+
+
+@contextlib.contextmanager
+def timing_span(category: str, name: str, **details: object) -> Iterator[JsonDict]:
+    # Yields the span args so callers can attach details only known once the work is done.
+    spans = _TIMING_SPANS
+    if spans is None:
+        yield details
+        return
+    start = time.perf_counter()
+    try:
+        yield details
+    finally:
+        duration = time.perf_counter() - start
+        spans.append({"category": category, "name": name, "start": start, "duration": duration, "args": details})
+
+
+def subprocess_span_name(cmd: list[str]) -> tuple[str, str]:
+    if cmd and cmd[0] == "git":
+        return "git", " ".join(cmd[:2])
+    if len(cmd) > 1 and cmd[1].endswith("agentctl.py"):
+        return "subprocess", "agentctl"
+    return "subprocess", Path(cmd[0]).name if cmd else "?"
+
+
+class TimedBackend:
+    """Backend proxy that records a span per method call; only installed under --timings."""
+
+    def __init__(self, backend: object) -> None:
+        self._backend = backend
+
+    @property
+    def wrapped(self) -> object:
+        return self._backend
+
+    def __getattr__(self, name: str) -> object:
+        attr = getattr(self._backend, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args: object, **kwargs: object) -> object:
+            with timing_span("backend", f"{type(self._backend).__name__}.{name}"):
+                return attr(*args, **kwargs)
+
+        return call
+
+
+def report_timings(spans: list[TimingSpan], *, trace_path: Path | None) -> None:
+    if trace_path is not None:
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round((span["start"] - _IMPORT_STARTED) * 1_000_000),
+                "dur": round(span["duration"] * 1_000_000),
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {key: str(value) for key, value in span["args"].items()},
+            }
+            for span in spans
+        ]
+        trace_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}) + "\n", encoding="utf-8")
+        print(f"TIMING: wrote {len(events)} trace events to {trace_path}", file=sys.stderr)
+        return
+    totals: dict[tuple[str, str], list[float]] = {}
+    for span in spans:
+        totals.setdefault((span["category"], span["name"]), []).append(span["duration"])
+    print("TIMING: category   total_ms    max_ms  count  name", file=sys.stderr)
+    for (category, name), durations in sorted(totals.items(), key=lambda item: -sum(item[1])):
+        total_ms, max_ms = sum(durations) * 1000, max(durations) * 1000
+        print(f"TIMING: {category:<10}{total_ms:9.1f}{max_ms:10.1f}{len(durations):7d}  {name}", file=sys.stderr)
+    report_subprocess_summary(spans)
+    report_write_batch_summary(spans)
+
+
+def report_write_batch_summary(spans: list[TimingSpan]) -> None:
+    """Summarize deferred_task_writes() flushes: dirty tasks and the save/export/lint passes they avoided."""
+    for span in spans:
+        if span["category"] != "batch":
+            continue
+        details = " ".join(f"{key}={value}" for key, value in span["args"].items())
+        print(f"TIMING: write batch {details} ms={span['duration'] * 1000:.1f}", file=sys.stderr)
+
+
+def report_subprocess_summary(spans: list[TimingSpan]) -> None:
+    """Summarize run() invocations: forks per subcommand, memo hits, and repeated identical calls."""
+    calls = [span for span in spans if span["category"] in {"git", "subprocess"} and "argv" in span["args"]]
+    if not calls:
+        return
+    forks = [span for span in calls if not span["args"].get("memoized")]
+    print(
+        f"TIMING: subprocesses forks={len(forks)} memo_hits={len(calls) - len(forks)} "
+        f"total_ms={sum(span['duration'] for span in forks) * 1000:.1f}",
+        file=sys.stderr,
+    )
+    repeats: dict[tuple[str, str], int] = {}
+    for span in calls:
+        key = (str(span["args"]["argv"]), str(span["args"].get("cwd", "")))
+        repeats[key] = repeats.get(key, 0) + 1
+    for (argv, cwd), count in sorted(repeats.items(), key=lambda item: -item[1]):
+        if count > 1:
+            print(f"TIMING: duplicate x{count}: {argv} (cwd={cwd})", file=sys.stderr)
+
+
+# True while `agentctl serve` runs a request in this process.
+_SERVING = False
+# Parser built once by `agentctl serve`; its only config-derived defaults are covered by the server fingerprint.
+_SERVER_PARSER: argparse.ArgumentParser | None = None
+# Opt-in (CODEXSWARM_GIT_MEMO=1) cache of read-only git results, keyed by argv and cwd.
+# Any other run() call (including nested agentctl) clears it, since it may have moved HEAD, refs or config.
+_READ_ONLY_GIT_COMMANDS = frozenset(
+    {"rev-parse", "for-each-ref", "show-ref", "rev-list", "merge-base", "diff", "status", "log", "show", "ls-files"}
+)
+_GIT_MEMO: dict[tuple[tuple[str, ...], str], subprocess.CompletedProcess[str]] | None = (
+    {} if os.environ.get("CODEXSWARM_GIT_MEMO", "").strip() == "1" else None
+)
+
+
+def is_read_only_git(cmd: list[str]) -> bool:
+    if len(cmd) < 2 or cmd[0] != "git":
+        return False
+    if cmd[1] in _READ_ONLY_GIT_COMMANDS or is_memoizable_git(cmd):
+        return True
+    return cmd[1] == "worktree" and cmd[2:3] == ["list"]
+
+
+def is_memoizable_git(cmd: list[str]) -> bool:
+    if len(cmd) < 2 or cmd[0] != "git":
+        return False
+    if cmd[1] in {"rev-parse", "for-each-ref"}:
+        return True
+    return cmd[1] == "config" and "--get" in cmd[2:]
+
+
 # Wrapper to standardize subprocess calls (text mode + captured output).
 def run(
     cmd: list[str],
@@ -241,15 +542,43 @@ def run(
     cwd: Path = ROOT,
     check: bool = True,
     env: dict[str, str] | None = None,
+    capture: bool = True,
 ) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        cmd,
-        cwd=str(cwd),
-        text=True,
-        capture_output=True,
-        check=check,
-        env=env,
-    )
+    category, name = subprocess_span_name(cmd)
+    memo = _GIT_MEMO
+    memo_key = (tuple(cmd), str(cwd))
+    if memo is not None and env is None and capture and is_memoizable_git(cmd):
+        cached = memo.get(memo_key)
+        if cached is None:
+            with timing_span(category, name, argv=" ".join(cmd), cwd=str(cwd)):
+                cached = subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=True, check=False)
+            memo[memo_key] = cached
+        else:
+            with timing_span(category, name, argv=" ".join(cmd), cwd=str(cwd), memoized=True):
+                pass
+        if check and cached.returncode != 0:
+            raise subprocess.CalledProcessError(cached.returncode, cmd, output=cached.stdout, stderr=cached.stderr)
+        return cached
+    if memo and not is_read_only_git(cmd):
+        memo.clear()
+    if not capture and _SERVING:
+        # A served request has no terminal: capture the child and replay its output into the response.
+        with timing_span(category, name, argv=" ".join(cmd), cwd=str(cwd)):
+            result = subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=True, check=False, env=env)
+        sys.stdout.write(result.stdout or "")
+        sys.stderr.write(result.stderr or "")
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, cmd)
+        return result
+    with timing_span(category, name, argv=" ".join(cmd), cwd=str(cwd)):
+        return subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            text=True,
+            capture_output=capture,
+            check=check,
+            env=env,
+        )
 
 
 def merge_env(overrides: dict[str, str] | None) -> dict[str, str] | None:
@@ -274,13 +603,21 @@ def error_context() -> JsonDict:
     return {"cwd": str(Path.cwd().resolve()), "argv": sys.argv[1:]}
 
 
+class CommandExit(SystemExit):
+    """SystemExit raised by die(); keeps the message for in-process callers that do not own stderr."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(code)
+        self.message = message
+
+
 def die(message: str, code: int = 1) -> NoReturn:
     if GLOBAL_JSON:
         payload = {"error": {"code": code, "message": message, "context": error_context()}}
         print(json.dumps(payload, ensure_ascii=False), file=sys.stdout)
     else:
         print(message, file=sys.stderr)
-    raise SystemExit(code)
+    raise CommandExit(code, message)
 
 
 def git_toplevel(*, cwd: Path = ROOT) -> Path:
@@ -517,8 +854,20 @@ def require_tasks_json_write_context(*, cwd: Path = ROOT, force: bool = False) -
 _SLUG_RE = re.compile(r"[^a-z0-9]+")
 # In-memory caches avoid repeated backend reads and dependency recomputation.
 _TASK_CACHE: TaskList | None = None
+# Store session: the first full backend read fills _TASK_CACHE and the digests of what the backend stores,
+# so readiness, mutation, printing and export share one list and every save keeps a compare-and-swap
+# baseline. _TASK_CACHE_SYNCED stays true while the list mirrors the store exactly (safe to export).
+_TASK_STORED_DIGESTS: dict[str, str] | None = None
+_TASK_CACHE_SYNCED = False
+_TASK_HEADER_CACHE: TaskList | None = None
+_AGENTS_INDEX_CACHE: set[str] | None = None
 _TASK_INDEX_CACHE: tuple[str, TaskIndex, list[str]] | None = None
 _TASK_DEP_CACHE: tuple[str, DependencyState, list[str]] | None = None
+# Point writes made without a store session: task id -> (digest before the first write, stored copy), so the
+# tasks.json export can splice these tasks into the existing snapshot instead of re-listing the backend.
+_TASK_POINT_WRITES: dict[str, tuple[str, TaskRecord]] = {}
+# Active deferred_task_writes() batch; None means saves and exports run immediately.
+_WRITE_BATCH: WriteBatch | None = None
 GLOBAL_QUIET = False
 GLOBAL_VERBOSE = False
 GLOBAL_JSON = False
@@ -629,7 +978,7 @@ def hook_commit_msg_check(message_path: Path) -> None:
         if not commit_subject_mentions_task(task_id, subject):
             die(commit_subject_missing_error([task_id], subject), code=2)
         return
-    tasks, _ = load_task_store()
+    tasks = load_task_headers()
     suffixes = collect_task_suffixes(tasks)
     if not suffixes:
         die("No task IDs available to validate commit subject; run agentctl or uninstall hooks.", code=2)
@@ -759,7 +1108,7 @@ def hook_is_managed(path: Path) -> bool:
 
 
 def load_task_index() -> tuple[TaskList, TaskIndex, list[str], str]:
-    tasks, _ = load_task_store()
+    tasks = load_task_headers()
     key = tasks_cache_key(tasks)
     global _TASK_INDEX_CACHE
     if _TASK_INDEX_CACHE and _TASK_INDEX_CACHE[0] == key:
@@ -789,7 +1138,8 @@ def require_structured_comment(body: str, *, prefix: str, min_chars: int) -> Non
 
 def load_json(path: Path) -> JsonDict:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        with timing_span("io", "read json", path=path):
+            data = json.loads(path.read_text(encoding="utf-8"))
     except FileNotFoundError:
         die(f"Missing file: {path}")
     except json.JSONDecodeError as exc:
@@ -1030,14 +1380,19 @@ def backend_instance() -> object | None:
     if not backend_enabled():
         return None
     if _BACKEND_INSTANCE is not None:
+        if _TIMING_SPANS is not None and not isinstance(_BACKEND_INSTANCE, TimedBackend):
+            # Under `agentctl serve` the instance outlives the command that created it.
+            _BACKEND_INSTANCE = TimedBackend(_BACKEND_INSTANCE)
         return _BACKEND_INSTANCE
     backend_cls = cast(Callable[..., object] | None, BACKEND_CLASS)
     if backend_cls is None:
         return None
-    try:
-        _BACKEND_INSTANCE = backend_cls(backend_settings())
-    except TypeError:
-        _BACKEND_INSTANCE = backend_cls()
+    with timing_span("backend", "init", backend=backend_cls.__name__):
+        try:
+            instance = backend_cls(backend_settings())
+        except TypeError:
+            instance = backend_cls()
+    _BACKEND_INSTANCE = TimedBackend(instance) if _TIMING_SPANS is not None else instance
     return _BACKEND_INSTANCE
 
 
@@ -1258,7 +1613,60 @@ def now_iso_utc() -> str:
 
 
 def write_json(path: Path, data: JsonDict) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    with timing_span("io", "write json", path=path):
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def lock_timeout_seconds() -> float:
+    raw = os.environ.get("CODEXSWARM_LOCK_TIMEOUT", "").strip()
+    if not raw:
+        return DEFAULT_LOCK_TIMEOUT_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        die(f"Invalid CODEXSWARM_LOCK_TIMEOUT: {raw!r} (expected seconds)", code=2)
+
+
+def lock_name_for_path(path: Path) -> str:
+    try:
+        rel = path.resolve().relative_to(ROOT)
+    except ValueError:
+        rel = Path(hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:16]) / path.name
+    return "__".join(rel.parts)
+
+
+def local_backend_module() -> ModuleType:
+    local_path = SWARM_DIR / "backends" / "local" / "backend.py"
+    if not local_path.exists():
+        die(f"Local backend module not found: {local_path}", code=2)
+    return cast("ModuleType", load_backend_module("local", local_path))
+
+
+@contextlib.contextmanager
+def file_lock(name: str, *, timeout: float | None = None) -> Iterator[None]:
+    """Hold the local backend's advisory lock on .codex-swarm/.locks/<name>.lock, dying on timeout."""
+    local_module = local_backend_module()
+    lock_timeout_error = cast(type[TimeoutError], local_module.LockTimeoutError)
+    lock = cast(Callable[..., contextlib.AbstractContextManager[None]], local_module.file_lock)
+    lock_path = LOCKS_DIR / f"{name}.lock"
+    wait = lock_timeout_seconds() if timeout is None else timeout
+    with contextlib.ExitStack() as stack:
+        try:
+            stack.enter_context(lock(lock_path, timeout=wait))
+        except lock_timeout_error as exc:
+            die(
+                "\n".join(
+                    [
+                        f"Timed out after {wait:g}s waiting for lock {lock_path.relative_to(ROOT)}",
+                        f"Held by: {getattr(exc, 'holder', 'unknown holder')}",
+                        "Fix:",
+                        "  1) Wait for the other agentctl process to finish and retry",
+                        "  2) Raise CODEXSWARM_LOCK_TIMEOUT if writes are legitimately slow",
+                    ]
+                ),
+                code=2,
+            )
+        yield
 
 
 def canonical_tasks_payload(tasks: TaskList) -> str:
@@ -1287,11 +1695,12 @@ def update_tasks_meta(data: JsonDict) -> None:
     data[TASKS_META_KEY] = meta
 
 
-def write_tasks_json(data: JsonDict) -> None:
+def write_tasks_json(data: JsonDict, *, changed_ids: set[str] | None = None) -> None:
     update_tasks_meta(data)
-    write_json(TASKS_PATH, data)
+    with file_lock(lock_name_for_path(TASKS_PATH)):
+        write_json(TASKS_PATH, data)
     if GLOBAL_LINT or AUTO_LINT_ON_WRITE:
-        result = lint_tasks_json()
+        result = lint_tasks_json(data, changed_ids=changed_ids, verify_checksum=False)
         if result["errors"]:
             for message in result["errors"]:
                 print(f"❌ {message}", file=sys.stderr)
@@ -1300,9 +1709,10 @@ def write_tasks_json(data: JsonDict) -> None:
 
 def write_tasks_json_to_path(path: Path, data: JsonDict) -> None:
     update_tasks_meta(data)
-    write_json(path, data)
+    with file_lock(lock_name_for_path(path)):
+        write_json(path, data)
     if (GLOBAL_LINT or AUTO_LINT_ON_WRITE) and path.resolve() == TASKS_PATH.resolve():
-        result = lint_tasks_json()
+        result = lint_tasks_json(data, verify_checksum=False)
         if result["errors"]:
             for message in result["errors"]:
                 print(f"❌ {message}", file=sys.stderr)
@@ -1355,56 +1765,318 @@ def load_tasks() -> TaskList:
     return ensure_task_list(tasks, label="tasks.json tasks")
 
 
+def die_task_conflict(detail: str) -> NoReturn:
+    die(
+        "\n".join(
+            [
+                f"Concurrent task update detected: {detail}",
+                "Fix:",
+                "  1) Re-run the command so it applies on top of the latest task state",
+            ]
+        ),
+        code=2,
+    )
+
+
+def report_backend_scan_stats(backend: object, *, label: str) -> None:
+    if not GLOBAL_VERBOSE:
+        return
+    stats = getattr(backend, "last_scan_stats", None)
+    if not isinstance(stats, dict) or not stats:
+        return
+    parts = [
+        f"{key.removesuffix('_ms')}={value:.1f}ms" if key.endswith("_ms") else f"{key}={value}"
+        for key, value in stats.items()
+    ]
+    print(f"TIMING: {label} {' '.join(parts)}", file=sys.stderr)
+
+
+def load_task_headers() -> TaskList:
+    """Tasks for read-only callers: `doc` may be missing when the backend can list without reading docs."""
+    global _TASK_HEADER_CACHE
+    if _TASK_CACHE is not None:
+        return _TASK_CACHE
+    if _TASK_HEADER_CACHE is not None:
+        return _TASK_HEADER_CACHE
+    backend = backend_instance()
+    if backend is None or not supports_list_task_headers(backend):
+        tasks, _ = load_task_store()
+        return tasks
+    _TASK_HEADER_CACHE = ensure_task_list(backend.list_task_headers(), label="backend tasks")
+    report_backend_scan_stats(backend, label="list_task_headers")
+    return _TASK_HEADER_CACHE
+
+
 def load_task_store() -> tuple[TaskList, Callable[[TaskList], None]]:
+    batch = _WRITE_BATCH
+    if batch is None:
+        return open_task_store()
+    tasks = batch["tasks"]
+    if tasks is None or batch["save"] is None:
+        tasks, batch["save"] = open_task_store()
+        batch["tasks"] = tasks
+    # Later reads in the same batch see pending (unsaved) edits.
+    return tasks, defer_task_save
+
+
+def defer_task_save(updated_tasks: TaskList) -> None:
+    batch = _WRITE_BATCH
+    if batch is None:
+        die("Deferred task save used outside of a write batch", code=2)
+    batch["tasks"] = updated_tasks
+    batch["save_calls"] += 1
+
+
+def note_dirty_tasks(task_ids: set[str]) -> None:
+    if _WRITE_BATCH is not None:
+        _WRITE_BATCH["dirty"] |= task_ids
+
+
+@contextlib.contextmanager
+def deferred_task_writes(*, lint: bool = False) -> Iterator[None]:
+    """Coalesce task store saves and tasks.json exports until the outermost block exits.
+
+    Nested blocks join the outer batch. lint=True ends the batch with one full lint of tasks.json.
+    Call flush_task_writes() before anything that reads the store or tasks.json from outside the batch
+    (git commits, backend doc writes); an exception inside the block discards the pending writes.
+    """
+    global _WRITE_BATCH
+    if _WRITE_BATCH is not None:
+        _WRITE_BATCH["lint"] = _WRITE_BATCH["lint"] or lint
+        yield
+        return
+    _WRITE_BATCH = {
+        "tasks": None,
+        "save": None,
+        "dirty": set(),
+        "save_calls": 0,
+        "export_calls": 0,
+        "export_quiet": True,
+        "lint": lint,
+    }
+    try:
+        yield
+        flush_task_writes()
+    finally:
+        _WRITE_BATCH = None
+
+
+def flush_task_writes() -> None:
+    """Commit point: run the pending save, export and lint of the active batch once (no-op without one)."""
+    batch = _WRITE_BATCH
+    if batch is None:
+        return
+    save_calls, export_calls, lint = batch["save_calls"], batch["export_calls"], batch["lint"]
+    if not (save_calls or export_calls or lint):
+        return
+    local = backend_instance() is None
+    saving = bool(save_calls) and batch["save"] is not None and batch["tasks"] is not None
+    # Without a backend the save writes (and lints) tasks.json itself, which is the exported snapshot;
+    # with lint requested save_local runs that write lint over every task instead of the changed ones.
+    exporting = bool(export_calls) and not (local and saving)
+    linting = lint and not (local and saving)
+    with timing_span("batch", "flush") as span_args:
+        if saving and batch["save"] is not None and batch["tasks"] is not None:
+            batch["save"](batch["tasks"])
+        batch["save_calls"] = batch["export_calls"] = 0
+        batch["lint"] = False
+        if exporting:
+            _export_tasks_snapshot(None, quiet=batch["export_quiet"])
+        if linting:
+            result = lint_tasks_json()
+            if result["errors"]:
+                for message in result["errors"]:
+                    print(f"❌ {message}", file=sys.stderr)
+                raise SystemExit(2)
+        if lint:
+            print(f"✅ {TASKS_PATH_REL} OK")
+        span_args.update(
+            {
+                "dirty": len(batch["dirty"]),
+                "saves_skipped": max(save_calls - 1, 0),
+                "exports_skipped": export_calls - int(exporting),
+                "lints_skipped": int(lint and not linting),
+            }
+        )
+
+
+def open_task_store() -> tuple[TaskList, Callable[[TaskList], None]]:
     # Backends are optional; fall back to local tasks.json when absent.
     backend = backend_instance()
     if backend is None:
         data = load_json(TASKS_PATH)
         tasks = ensure_task_list(data.get("tasks", []), label="tasks.json tasks")
+        baseline_checksum = compute_tasks_checksum(tasks)
 
         def save_local(updated_tasks: TaskList) -> None:
-            data["tasks"] = updated_tasks
-            write_tasks_json(data)
+            nonlocal baseline_checksum
+            with file_lock(lock_name_for_path(TASKS_PATH)):
+                current = ensure_task_list(load_json(TASKS_PATH).get("tasks", []), label="tasks.json tasks")
+                if compute_tasks_checksum(current) != baseline_checksum:
+                    die_task_conflict(f"{TASKS_PATH.relative_to(ROOT)} changed since it was read")
+                data["tasks"] = updated_tasks
+                changed = changed_task_ids(current, updated_tasks)
+                note_dirty_tasks(changed)
+                full_lint = _WRITE_BATCH is not None and _WRITE_BATCH["lint"]
+                write_tasks_json(data, changed_ids=None if full_lint else changed)
+                baseline_checksum = compute_tasks_checksum(updated_tasks)
 
         return tasks, save_local
 
     if not supports_task_list_write(backend):
         die("Configured backend must implement list_tasks() and write_task()", code=2)
-    global _TASK_CACHE
-    tasks = _TASK_CACHE if _TASK_CACHE is not None else backend.list_tasks()
-    if not isinstance(tasks, list):
-        die("Backend list_tasks() must return a list of tasks", code=2)
-    tasks = ensure_task_list(tasks, label="backend tasks")
-    tasks_by_id = {str(task.get("id") or ""): task for task in tasks}
-    tasks_digest_by_id = {task_id: task_digest(task) for task_id, task in tasks_by_id.items() if task_id}
+    global _TASK_CACHE, _TASK_STORED_DIGESTS, _TASK_CACHE_SYNCED
+    if _TASK_CACHE is None or _TASK_STORED_DIGESTS is None:
+        listed = backend.list_tasks()
+        report_backend_scan_stats(backend, label="list_tasks")
+        if not isinstance(listed, list):
+            die("Backend list_tasks() must return a list of tasks", code=2)
+        _TASK_CACHE = ensure_task_list(listed, label="backend tasks")
+        _TASK_STORED_DIGESTS = {
+            str(task.get("id") or "").strip(): task_digest(task) for task in _TASK_CACHE if task.get("id")
+        }
+        _TASK_CACHE_SYNCED = True
+    tasks = _TASK_CACHE
+    stored_digest_by_id = _TASK_STORED_DIGESTS
 
     def save_backend(updated_tasks: TaskList) -> None:
-        global _TASK_CACHE
+        global _TASK_CACHE, _TASK_HEADER_CACHE, _TASK_INDEX_CACHE, _TASK_DEP_CACHE, _TASK_CACHE_SYNCED
+        # Anything that no longer matches the stored copy is written, including edits made in place by
+        # earlier callers of the same session.
         changed: TaskList = []
         for task in updated_tasks:
             task_id = str(task.get("id") or "").strip()
-            if not task_id:
-                continue
-            existing_digest = tasks_digest_by_id.get(task_id)
-            new_digest = task_digest(task)
-            if existing_digest is not None and existing_digest == new_digest:
-                continue
-            tasks_by_id[task_id] = task
-            tasks_digest_by_id[task_id] = new_digest
-            changed.append(task)
+            if task_id and stored_digest_by_id.get(task_id) != task_digest(task):
+                changed.append(task)
+        note_dirty_tasks({str(task.get("id") or "").strip() for task in changed})
         if changed:
-            if supports_write_tasks(backend):
-                backend.write_tasks(changed)
+            if supports_compare_and_write_task(backend):
+                for task in changed:
+                    task_id = str(task.get("id") or "").strip()
+                    try:
+                        stored = backend.compare_and_write_task(task, expected_digest=stored_digest_by_id.get(task_id))
+                    except TimeoutError as exc:
+                        die(str(exc), code=2)
+                    except RuntimeError as exc:
+                        die_task_conflict(str(exc))
+                    stored_digest_by_id[task_id] = stored
+                    if stored != task_digest(task):
+                        # The backend normalised the task (doc metadata, field order); mirror its copy.
+                        refreshed = backend.get_task(task_id) if supports_get_task(backend) else None
+                        if refreshed is None:
+                            _TASK_CACHE_SYNCED = False
+                        else:
+                            task.clear()
+                            task.update(refreshed)
             else:
+                if supports_write_tasks(backend):
+                    backend.write_tasks(changed)
+                else:
+                    for task in changed:
+                        backend.write_task(task)
                 for task in changed:
-                    backend.write_task(task)
+                    stored_digest_by_id[str(task.get("id") or "").strip()] = task_digest(task)
+                _TASK_CACHE_SYNCED = False
+        if updated_tasks is not _TASK_CACHE:
+            _TASK_CACHE_SYNCED = False
         _TASK_CACHE = updated_tasks
+        _TASK_HEADER_CACHE = None
         _TASK_INDEX_CACHE = None
         _TASK_DEP_CACHE = None
 
     return tasks, save_backend
 
 
+def point_read_backend() -> BackendGetTask | None:
+    """Backend for single-task reads, or None when the caller must go through the full store.
+
+    An open store session or write batch already holds the list (and pending edits), so point reads are
+    only used before either exists.
+    """
+    backend = backend_instance()
+    if backend is None or _TASK_CACHE is not None or _WRITE_BATCH is not None:
+        return None
+    return backend if supports_get_task(backend) else None
+
+
+def load_task_for_update(task_id: str) -> tuple[TaskRecord, Callable[[TaskRecord], None]]:
+    """One task plus a save for it: a point read and write when the backend supports them.
+
+    Falls back to load_task_store() (every task) without a backend, inside a session or batch, or when the
+    backend cannot read a single task.
+    """
+    reader = point_read_backend()
+    backend = backend_instance()
+    if reader is None or not supports_write_task(backend):
+        tasks, save = load_task_store()
+        target = _ensure_task_object(tasks, task_id)
+        return target, lambda _task: save(tasks)
+    task = reader.get_task(task_id)
+    if task is None:
+        die(f"Unknown task id: {task_id}")
+    target = ensure_task_list([task], label="backend task")[0]
+    expected_digest = task_digest(target)
+
+    def save_point(updated: TaskRecord) -> None:
+        global _TASK_HEADER_CACHE, _TASK_INDEX_CACHE, _TASK_DEP_CACHE
+        nonlocal expected_digest
+        if task_digest(updated) == expected_digest:
+            return
+        if supports_compare_and_write_task(backend):
+            try:
+                stored = backend.compare_and_write_task(updated, expected_digest=expected_digest)
+            except TimeoutError as exc:
+                die(str(exc), code=2)
+            except RuntimeError as exc:
+                die_task_conflict(str(exc))
+            if stored != task_digest(updated):
+                refreshed = reader.get_task(task_id)
+                if refreshed is not None:
+                    updated.clear()
+                    updated.update(refreshed)
+            mirrored = stored == task_digest(updated)
+        else:
+            backend.write_task(updated)
+            stored = task_digest(updated)
+            mirrored = False
+        note_dirty_tasks({task_id})
+        # An empty baseline never matches a snapshot entry: when the stored copy is not known exactly
+        # (no compare-and-swap, or no re-read), the export falls back to a full one.
+        previous = _TASK_POINT_WRITES.get(task_id)
+        baseline = previous[0] if previous else expected_digest
+        _TASK_POINT_WRITES[task_id] = (baseline if mirrored else "", updated)
+        expected_digest = stored
+        # Keep an already listed header set current in place; the index and dependency state derive from it.
+        if _TASK_HEADER_CACHE is not None:
+            _TASK_HEADER_CACHE = [updated if task.get("id") == task_id else task for task in _TASK_HEADER_CACHE]
+        _TASK_INDEX_CACHE = None
+        _TASK_DEP_CACHE = None
+
+    return target, save_point
+
+
+def load_task_dependencies(task: TaskRecord) -> tuple[DependencyState, list[str]]:
+    """Dependency state and warnings for one task.
+
+    With a point-read backend and nothing listed yet, only the task's direct dependencies are read, so the
+    cost follows the number of dependencies rather than the size of the store.
+    """
+    backend = point_read_backend()
+    if backend is None or _TASK_HEADER_CACHE is not None:
+        _, tasks_by_id, index_warnings, key = load_task_index()
+        dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+        return dep_state, index_warnings + dep_warnings
+    task_id = str(task.get("id") or "").strip()
+    depends_on, _ = normalize_depends_on(task.get("depends_on"))
+    subset: TaskIndex = {task_id: task}
+    for dep_id in depends_on:
+        dep_task = backend.get_task(dep_id) if dep_id not in subset else None
+        if dep_task is not None:
+            subset[dep_id] = dep_task
+    dep_state, warnings = compute_dependency_state(subset)
+    return {task_id: dep_state[task_id]}, warnings
+
+
 def _format_list_short(items: list[str], *, max_items: int = 3) -> str:
     if len(items) <= max_items:
         return ", ".join(items)
@@ -1462,28 +2134,61 @@ def format_task_line(task: TaskRecord, dep_state: DependencyState | None = None)
     return line
 
 
+def filter_tasks(
+    tasks: TaskList, *, status: list[str] | None, owner: list[str] | None, tag: list[str] | None
+) -> TaskList:
+    if status:
+        want = {s.strip().upper() for s in status}
+        tasks = [t for t in tasks if str(t.get("status") or "TODO").strip().upper() in want]
+    if owner:
+        want_owner = {o.strip().upper() for o in owner}
+        tasks = [t for t in tasks if str(t.get("owner") or "").strip().upper() in want_owner]
+    if tag:
+        want_tag = {t.strip() for t in tag}
+        tasks = [t for t in tasks if any(item in want_tag for item in coerce_str_list(t.get("tags")))]
+    return tasks
+
+
+def query_tasks_pushdown(
+    *,
+    status: list[str] | None,
+    owner: list[str] | None,
+    tag: list[str] | None,
+    text: str | None = None,
+    regex: bool = False,
+) -> tuple[TaskList, DependencyState, list[str]] | None:
+    """Let a backend with indexes filter, then load only the matched tasks' dependencies.
+
+    Returns None when the backend cannot filter (callers fall back to the full in-memory scan).
+    """
+    backend = backend_instance()
+    if backend is None or not supports_query_tasks(backend):
+        return None
+    matches = ensure_task_list(
+        backend.query_tasks(status=status, owner=owner, tag=tag, text=text, regex=regex), label="backend tasks"
+    )
+    subset: TaskIndex = {str(task.get("id") or ""): task for task in matches}
+    dep_ids = {dep for task in matches for dep in coerce_str_list(task.get("depends_on")) if dep not in subset}
+    if dep_ids:
+        for task in ensure_task_list(backend.get_tasks(sorted(dep_ids)), label="backend tasks"):
+            subset.setdefault(str(task.get("id") or ""), task)
+    dep_state, dep_warnings = compute_dependency_state(subset)
+    return matches, dep_state, dep_warnings
+
+
 def cmd_task_list(args: argparse.Namespace) -> None:
-    tasks, tasks_by_id, warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = warnings + dep_warnings
+    pushed = query_tasks_pushdown(status=args.status, owner=args.owner, tag=args.tag)
+    if pushed is not None:
+        tasks_sorted, dep_state, warnings = pushed
+    else:
+        _, tasks_by_id, warnings, key = load_task_index()
+        dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+        warnings = warnings + dep_warnings
+        tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
+        tasks_sorted = filter_tasks(tasks_sorted, status=args.status, owner=args.owner, tag=args.tag)
     if warnings and not args.quiet:
         for warning in warnings:
             print(f"⚠️ {warning}")
-    tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    if args.status:
-        want = {s.strip().upper() for s in args.status}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in want]
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
     for task in tasks_sorted:
         print(format_task_line(task, dep_state=dep_state))
     if not args.quiet:
@@ -1497,29 +2202,20 @@ def cmd_task_list(args: argparse.Namespace) -> None:
 
 
 def cmd_task_next(args: argparse.Namespace) -> None:
-    tasks, tasks_by_id, warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = warnings + dep_warnings
+    statuses = list(args.status or ["TODO"])
+    pushed = query_tasks_pushdown(status=statuses, owner=args.owner, tag=args.tag)
+    if pushed is not None:
+        tasks_sorted, dep_state, warnings = pushed
+    else:
+        _, tasks_by_id, warnings, key = load_task_index()
+        dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+        warnings = warnings + dep_warnings
+        tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
+        tasks_sorted = filter_tasks(tasks_sorted, status=statuses, owner=args.owner, tag=args.tag)
     if warnings and not args.quiet:
         for warning in warnings:
             print(f"⚠️ {warning}")
 
-    tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    statuses = {s.strip().upper() for s in (args.status or ["TODO"])}
-    tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in statuses]
-
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
-
     ready_tasks: TaskList = []
     for task in tasks_sorted:
         task_id = str(task.get("id") or "").strip()
@@ -1528,14 +2224,483 @@ def cmd_task_next(args: argparse.Namespace) -> None:
         incomplete = info.get("incomplete") or []
         if missing or incomplete:
             continue
-        ready_tasks.append(task)
+        ready_tasks.append(task)
+
+    if args.limit is not None and args.limit >= 0:
+        ready_tasks = ready_tasks[: args.limit]
+    for task in ready_tasks:
+        print(format_task_line(task, dep_state=dep_state))
+    if not args.quiet:
+        print(f"Ready: {len(ready_tasks)} / {len(tasks_sorted)}")
+
+
+# Ordering of `priority` values for scheduling; values not listed rank with "normal".
+PRIORITY_RANKS = {"high": 3, "med": 2, "medium": 2, "normal": 2, "low": 1}
+# In-progress tasks an agent may hold when its JSON sets no "wip_limit".
+DEFAULT_WIP_LIMIT = 1
+
+
+def task_created_at(task_id: str) -> datetime | None:
+    """Creation time encoded in the YYYYMMDDHHMM prefix of a task id."""
+    stamp = task_id.partition("-")[0]
+    if len(stamp) != 12 or not stamp.isdigit():
+        return None
+    try:
+        return datetime.strptime(stamp, "%Y%m%d%H%M").replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def open_dependency_graph(tasks_by_id: TaskIndex) -> tuple[list[str], dict[str, list[str]]]:
+    """Topological order (dependencies first) and dependents of the tasks that are not DONE.
+
+    Only edges between open tasks count; tasks on a dependency cycle are left out of the order.
+    """
+    open_ids = {task_id for task_id, task in tasks_by_id.items() if str(task.get("status") or "TODO") != "DONE"}
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in open_ids}
+    blockers: dict[str, int] = dict.fromkeys(open_ids, 0)
+    for task_id in open_ids:
+        depends_on, _ = normalize_depends_on(tasks_by_id[task_id].get("depends_on"))
+        for dep_id in set(depends_on):
+            if dep_id in open_ids and dep_id != task_id:
+                dependents[dep_id].append(task_id)
+                blockers[task_id] += 1
+    order = sorted(task_id for task_id, count in blockers.items() if count == 0)
+    for task_id in order:
+        for dependent in dependents[task_id]:
+            blockers[dependent] -= 1
+            if blockers[dependent] == 0:
+                order.append(dependent)
+    return order, dependents
+
+
+def critical_path_lengths(
+    order: list[str], dependents: dict[str, list[str]], *, weight: Callable[[str], float] | None = None
+) -> tuple[dict[str, float], dict[str, str]]:
+    """Longest weighted chain of open work starting at each task (itself included), and its next link.
+
+    weight defaults to 1 per task, so a length is the number of tasks on the chain.
+    """
+    lengths: dict[str, float] = {}
+    successor: dict[str, str] = {}
+    for task_id in reversed(order):
+        best = 0.0
+        for dependent in dependents[task_id]:
+            length = lengths.get(dependent, 0.0)
+            if length > best or (length == best and dependent < successor.get(task_id, dependent)):
+                best = length
+                successor[task_id] = dependent
+        lengths[task_id] = best + (weight(task_id) if weight is not None else 1.0)
+    return lengths, successor
+
+
+def load_agent_wip_limits() -> dict[str, int]:
+    """Per-agent "wip_limit" from the agent JSONs; agents without one get DEFAULT_WIP_LIMIT."""
+    limits: dict[str, int] = {}
+    if AGENTS_DIR.exists():
+        for path in sorted(AGENTS_DIR.glob("*.json")):
+            data = load_json(path)
+            agent_id = str(data.get("id") or "").strip().upper()
+            raw = data.get("wip_limit")
+            if agent_id:
+                limits[agent_id] = raw if isinstance(raw, int) and raw >= 0 else DEFAULT_WIP_LIMIT
+    return limits
+
+
+def cmd_task_schedule(args: argparse.Namespace) -> None:
+    if args.workers < 1:
+        die("--workers must be >= 1", code=2)
+    _, tasks_by_id, warnings, key = load_task_index()
+    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+    warnings = warnings + dep_warnings
+    if warnings and not args.quiet:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
+    order, dependents = open_dependency_graph(tasks_by_id)
+    path_lengths, _ = critical_path_lengths(order, dependents)
+    limits = load_agent_wip_limits()
+    in_progress: dict[str, int] = {}
+    for task in tasks_by_id.values():
+        if str(task.get("status") or "") == "DOING":
+            owner = str(task.get("owner") or "").strip().upper()
+            in_progress[owner] = in_progress.get(owner, 0) + 1
+
+    now = datetime.now(UTC)
+    candidates = filter_tasks(list(tasks_by_id.values()), status=["TODO"], owner=args.owner, tag=args.tag)
+    # Min-heap on (-priority, -critical path, -age, id): most urgent, most blocking, oldest first.
+    heap: list[tuple[int, float, float, str]] = []
+    for task in candidates:
+        task_id = str(task.get("id") or "").strip()
+        info = dep_state.get(task_id) or {}
+        if info.get("missing") or info.get("incomplete"):
+            continue
+        rank = PRIORITY_RANKS.get(str(task.get("priority") or "").strip().lower(), PRIORITY_RANKS["normal"])
+        created = task_created_at(task_id)
+        age_days = (now - created).total_seconds() / 86400 if created else 0.0
+        heap.append((-rank, -path_lengths.get(task_id, 1.0), -age_days, task_id))
+    heapq.heapify(heap)
+    ready_count = len(heap)
+
+    assigned: list[tuple[str, str, tuple[int, float, float, str]]] = []
+    deferred: list[tuple[str, str]] = []
+    while heap and len(assigned) < args.workers:
+        entry = heapq.heappop(heap)
+        task_id = entry[3]
+        owner = str(tasks_by_id[task_id].get("owner") or "").strip().upper()
+        limit = limits.get(owner, DEFAULT_WIP_LIMIT)
+        if in_progress.get(owner, 0) >= limit:
+            deferred.append((task_id, f"{owner or '(no owner)'} at WIP limit {limit}"))
+            continue
+        in_progress[owner] = in_progress.get(owner, 0) + 1
+        assigned.append((task_id, owner, entry))
+
+    for slot, (task_id, owner, (neg_rank, neg_path, neg_age, _)) in enumerate(assigned, start=1):
+        line = format_task_line(tasks_by_id[task_id], dep_state=dep_state)
+        print(f"{slot}. {owner or '-'}: {line} [rank={-neg_rank} path={-neg_path:g} age={-neg_age:.1f}d]")
+    if not args.quiet:
+        for task_id, reason in deferred:
+            print(f"⏸️ {task_id}: {reason}")
+        print(f"Scheduled: {len(assigned)} / {ready_count} ready (workers={args.workers})")
+
+
+# Estimated hours for a task when no DONE task has a resolvable commit time.
+DEFAULT_PLAN_TASK_HOURS = 1.0
+_COMMIT_HASH_RE = re.compile(r"[0-9a-f]{7,40}")
+
+
+def git_commit_times(hashes: list[str], *, cwd: Path = ROOT) -> dict[str, int]:
+    """Committer timestamps for the given commit hashes from one `git log --no-walk` call.
+
+    Hashes git does not know are left out.
+    """
+    revs = sorted({value.lower() for value in hashes if _COMMIT_HASH_RE.fullmatch(value.lower())})
+    if not revs:
+        return {}
+    result = run(
+        ["git", "log", "--no-walk=unsorted", "--ignore-missing", "--format=%H %ct", *revs], cwd=cwd, check=False
+    )
+    if result.returncode != 0:
+        return {}
+    by_full: dict[str, int] = {}
+    for line in (result.stdout or "").splitlines():
+        full, _, stamp = line.partition(" ")
+        if stamp.strip().isdigit():
+            by_full[full] = int(stamp)
+    times: dict[str, int] = {}
+    for rev in revs:
+        if rev in by_full:
+            times[rev] = by_full[rev]
+            continue
+        # Abbreviated hash: git printed the full one.
+        match = next((full for full in by_full if full.startswith(rev)), None)
+        if match is not None:
+            times[rev] = by_full[match]
+    return times
+
+
+def task_commit_hash(task: TaskRecord) -> str:
+    commit = task.get("commit")
+    return str(commit.get("hash") or "").strip().lower() if isinstance(commit, dict) else ""
+
+
+def historical_task_hours(tasks_by_id: TaskIndex) -> dict[str, float]:
+    """Hours from creation (id timestamp) to commit for DONE tasks whose commit git can resolve."""
+    done = [task for task in tasks_by_id.values() if str(task.get("status") or "") == "DONE"]
+    commit_times = load_commit_times([task_commit_hash(task) for task in done])
+    hours: dict[str, float] = {}
+    for task in done:
+        task_id = str(task.get("id") or "")
+        created = task_created_at(task_id)
+        committed = commit_times.get(task_commit_hash(task))
+        if created is None or committed is None:
+            continue
+        elapsed = (committed - created.timestamp()) / 3600
+        if elapsed > 0:
+            hours[task_id] = elapsed
+    return hours
+
+
+def estimate_task_hours(tasks_by_id: TaskIndex, task_ids: list[str], history: dict[str, float]) -> dict[str, float]:
+    """Median historical hours of the task owner's DONE tasks, else of all DONE tasks, else the default."""
+    by_owner: dict[str, list[float]] = {}
+    for task_id, hours in history.items():
+        owner = str(tasks_by_id[task_id].get("owner") or "").strip().upper()
+        by_owner.setdefault(owner, []).append(hours)
+    overall = statistics.median(history.values()) if history else DEFAULT_PLAN_TASK_HOURS
+    medians = {owner: statistics.median(values) for owner, values in by_owner.items()}
+    return {
+        task_id: medians.get(str(tasks_by_id[task_id].get("owner") or "").strip().upper(), overall)
+        for task_id in task_ids
+    }
+
+
+def list_schedule(
+    order: list[str],
+    dependents: dict[str, list[str]],
+    hours: dict[str, float],
+    priority: dict[str, float],
+    *,
+    workers: int,
+) -> list[list[tuple[str, float, float]]]:
+    """Non-preemptive list scheduling: whenever a worker is free it takes the ready task with the highest priority.
+
+    Returns one lane of (task id, start, finish) per worker. Tasks on a dependency cycle are never scheduled.
+    """
+    blockers: dict[str, int] = dict.fromkeys(order, 0)
+    for task_id in order:
+        for dependent in dependents[task_id]:
+            blockers[dependent] += 1
+    ready = [(-priority[task_id], task_id) for task_id in order if blockers[task_id] == 0]
+    heapq.heapify(ready)
+    free = list(range(workers))
+    running: list[tuple[float, int, str]] = []
+    lanes: list[list[tuple[str, float, float]]] = [[] for _ in range(workers)]
+    now = 0.0
+    while ready or running:
+        while ready and free:
+            _, task_id = heapq.heappop(ready)
+            worker = heapq.heappop(free)
+            finish = now + hours[task_id]
+            lanes[worker].append((task_id, now, finish))
+            heapq.heappush(running, (finish, worker, task_id))
+        if not running:
+            break
+        now, worker, task_id = heapq.heappop(running)
+        heapq.heappush(free, worker)
+        for dependent in dependents[task_id]:
+            blockers[dependent] -= 1
+            if blockers[dependent] == 0:
+                heapq.heappush(ready, (-priority[dependent], dependent))
+    return lanes
+
+
+def lanes_makespan(lanes: list[list[tuple[str, float, float]]]) -> float:
+    return max((lane[-1][2] for lane in lanes if lane), default=0.0)
+
+
+def cmd_task_plan(args: argparse.Namespace) -> None:
+    if args.workers < 1:
+        die("--workers must be >= 1", code=2)
+    _, tasks_by_id, warnings, key = load_task_index()
+    _, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+    warnings = warnings + dep_warnings
+    if warnings and not args.quiet:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
+    order, dependents = open_dependency_graph(tasks_by_id)
+    open_count = len(dependents)
+    if not open_count:
+        print("No open tasks to plan.")
+        return
+    history = historical_task_hours(tasks_by_id)
+    hours = estimate_task_hours(tasks_by_id, order, history)
+    path_hours, successor = critical_path_lengths(order, dependents, weight=hours.__getitem__)
+    total = sum(hours.values())
+    critical = max(path_hours.values(), default=0.0)
+    # Longest remaining chain first; DOING tasks already hold a worker, so they go ahead of everything.
+    priority = {
+        task_id: path_hours[task_id] + (total if str(tasks_by_id[task_id].get("status") or "") == "DOING" else 0.0)
+        for task_id in order
+    }
+    lanes = list_schedule(order, dependents, hours, priority, workers=args.workers)
+    makespan = lanes_makespan(lanes)
+
+    print(f"Open tasks: {open_count} ({len(order)} schedulable), workers: {args.workers}")
+    print(f"Estimated makespan: {makespan:.1f}h (critical path {critical:.1f}h, total work {total:.1f}h)")
+    if not args.quiet:
+        source = f"{len(history)} DONE task(s) with a resolvable commit" if history else "no history"
+        print(f"Durations: median creation-to-commit hours per owner ({source}; default {DEFAULT_PLAN_TASK_HOURS:g}h)")
+    for index, lane in enumerate(lanes, start=1):
+        steps = " -> ".join(f"{task_id} {start:.1f}-{finish:.1f}h" for task_id, start, finish in lane)
+        print(f"Lane {index}: {steps or '(idle)'}")
+    if order:
+        chain = [min(order, key=lambda task_id: (-path_hours[task_id], task_id))]
+        while chain[-1] in successor:
+            chain.append(successor[chain[-1]])
+        links = " -> ".join(f"{task_id} ({hours[task_id]:.1f}h)" for task_id in chain)
+        print(f"Bottleneck chain ({critical:.1f}h): {links}")
+    if args.workers > 1 and not args.quiet:
+        spans = [
+            lanes_makespan(list_schedule(order, dependents, hours, priority, workers=count))
+            for count in range(1, args.workers + 1)
+        ]
+        sizing = ", ".join(f"{count}={span:.1f}h" for count, span in enumerate(spans, start=1))
+        print(f"Makespan by workers: {sizing}")
+        enough = spans.index(min(spans)) + 1
+        if enough < args.workers or makespan <= critical:
+            print(f"Workers beyond {enough} do not shorten the plan.")
+        else:
+            print(f"More than {args.workers} workers may still help (the critical path bounds it at {critical:.1f}h).")
+    if len(order) < open_count:
+        print(f"⚠️ {open_count - len(order)} open task(s) on dependency cycles were not scheduled")
+
+
+COMMIT_TIMES_CACHE_PATH = CACHE_DIR / "commit-times.json"
+COMMIT_TIMES_CACHE_VERSION = 1
+# Status commits are `<emoji> <suffix> [<suffix>...] <comment>`; the emoji says which transition they record.
+STATUS_COMMIT_EMOJIS = {START_COMMIT_EMOJI: "DOING", "⛔": "BLOCKED", FINISH_COMMIT_EMOJI: "DONE"}
+
+
+def load_commit_times(hashes: list[str]) -> dict[str, int]:
+    """git_commit_times() behind .codex-swarm/.cache/commit-times.json, keyed by the requested hash set.
+
+    An unchanged hash set costs no git call; otherwise only hashes without a cached time are resolved.
+    """
+    revs = sorted({value.lower() for value in hashes if _COMMIT_HASH_RE.fullmatch(value.lower())})
+    key = hashlib.sha256("\n".join(revs).encode("utf-8")).hexdigest()
+    cached: dict[str, int] = {}
+    try:
+        state = json.loads(COMMIT_TIMES_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        state = None
+    if isinstance(state, dict) and state.get("version") == COMMIT_TIMES_CACHE_VERSION:
+        raw_times = state.get("times")
+        if isinstance(raw_times, dict):
+            cached = {str(rev): value for rev, value in raw_times.items() if isinstance(value, int)}
+        if state.get("key") == key:
+            return {rev: cached[rev] for rev in revs if rev in cached}
+    times = {rev: cached[rev] for rev in revs if rev in cached}
+    times.update(git_commit_times([rev for rev in revs if rev not in times]))
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(COMMIT_TIMES_CACHE_PATH, {"version": COMMIT_TIMES_CACHE_VERSION, "key": key, "times": times})
+    return times
+
+
+def git_status_commit_events(
+    task_ids: list[str], *, since: float, cwd: Path = ROOT
+) -> dict[str, list[tuple[int, str]]]:
+    """Status transitions (DOING/BLOCKED/DONE) per task from status commit subjects since a unix time, oldest first."""
+    by_suffix = {task_suffix(task_id): task_id for task_id in task_ids}
+    since_iso = datetime.fromtimestamp(since, UTC).isoformat()
+    result = run(["git", "log", "--reverse", f"--since={since_iso}", "--format=%ct%x1f%s"], cwd=cwd, check=False)
+    events: dict[str, list[tuple[int, str]]] = {}
+    if result.returncode != 0:
+        return events
+    for line in (result.stdout or "").splitlines():
+        stamp, _, subject = line.partition("\x1f")
+        tokens = subject.split()
+        status = STATUS_COMMIT_EMOJIS.get(tokens[0]) if tokens else None
+        if status is None or not stamp.isdigit():
+            continue
+        for token in tokens[1:]:
+            task_id = by_suffix.get(token)
+            if task_id is None:
+                break
+            events.setdefault(task_id, []).append((int(stamp), status))
+    return events
+
+
+def format_duration(seconds: float) -> str:
+    hours = seconds / 3600
+    if hours < 1:
+        return f"{seconds / 60:.0f}m"
+    return f"{hours:.1f}h" if hours < 48 else f"{hours / 24:.1f}d"
+
+
+def summarize_durations(label: str, values: list[float]) -> str:
+    if not values:
+        return f"{label}: n=0"
+    ordered = sorted(values)
+    p85 = ordered[max(0, -(-len(ordered) * 85 // 100) - 1)]
+    return (
+        f"{label}: n={len(ordered)} median={format_duration(statistics.median(ordered))} "
+        f"p85={format_duration(p85)} max={format_duration(ordered[-1])}"
+    )
 
-    if args.limit is not None and args.limit >= 0:
-        ready_tasks = ready_tasks[: args.limit]
-    for task in ready_tasks:
-        print(format_task_line(task, dep_state=dep_state))
+
+def cmd_task_stats(args: argparse.Namespace) -> None:
+    if args.days < 1:
+        die("--days must be >= 1", code=2)
+    _, tasks_by_id, warnings, _ = load_task_index()
+    if warnings and not args.quiet:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
+    tasks = filter_tasks(list(tasks_by_id.values()), status=None, owner=args.owner, tag=args.tag)
+    created = {
+        str(task.get("id")): created_at.timestamp()
+        for task in tasks
+        if (created_at := task_created_at(str(task.get("id") or ""))) is not None
+    }
+    if not created:
+        print("No tasks with a timestamped id.")
+        return
+    now = time.time()
+    events = git_status_commit_events(sorted(created), since=min(created.values()))
+    commit_times = load_commit_times([task_commit_hash(task) for task in tasks if task.get("status") == "DONE"])
+
+    lead: list[float] = []
+    cycle: list[float] = []
+    blocked: dict[str, float] = {}
+    intervals: list[tuple[float, float]] = []
+    done_at: dict[str, float] = {}
+    for task in tasks:
+        task_id = str(task.get("id") or "")
+        if task_id not in created:
+            continue
+        status = str(task.get("status") or "TODO")
+        history = events.get(task_id, [])
+        finished: float | None = None
+        if status == "DONE":
+            closes = [stamp for stamp, kind in history if kind == "DONE"]
+            committed = commit_times.get(task_commit_hash(task))
+            finished = float(closes[-1]) if closes else float(committed) if committed is not None else None
+        started = next((float(stamp) for stamp, kind in history if kind == "DOING"), None)
+        if finished is not None:
+            done_at[task_id] = finished
+            lead.append(max(0.0, finished - created[task_id]))
+            if started is not None:
+                cycle.append(max(0.0, finished - started))
+        if started is not None and (finished is not None or status in {"DOING", "BLOCKED"}):
+            intervals.append((started, finished if finished is not None else now))
+        elif status in {"DOING", "BLOCKED"}:
+            # In progress without a start commit (set via task update, or started before the log window):
+            # the current status still proves it is WIP today.
+            intervals.append((now, now))
+        blocked_since: float | None = None
+        total_blocked = 0.0
+        for stamp, kind in history:
+            if kind == "BLOCKED":
+                blocked_since = blocked_since if blocked_since is not None else float(stamp)
+            elif blocked_since is not None:
+                total_blocked += stamp - blocked_since
+                blocked_since = None
+        if blocked_since is not None and status == "BLOCKED":
+            total_blocked += now - blocked_since
+        if total_blocked > 0:
+            blocked[task_id] = total_blocked
+
+    counts: dict[str, int] = {}
+    for task in tasks:
+        status = str(task.get("status") or "TODO").strip().upper()
+        counts[status] = counts.get(status, 0) + 1
+    print(f"Tasks: {len(tasks)} ({', '.join(f'{key}={counts[key]}' for key in sorted(counts))})")
+    print(summarize_durations("Lead time (created -> done)", lead))
+    print(summarize_durations("Cycle time (DOING -> done)", cycle))
+    print(summarize_durations("Blocked time", list(blocked.values())))
+
+    window_start = now - args.days * 86400
+    throughput: dict[str, list[int]] = {}
+    for task_id, finished in done_at.items():
+        owner = str(tasks_by_id[task_id].get("owner") or "").strip().upper() or "-"
+        entry = throughput.setdefault(owner, [0, 0])
+        entry[1] += 1
+        if finished >= window_start:
+            entry[0] += 1
+    print(f"Throughput by owner (done in the last {args.days}d / all time):")
+    for owner, (recent, total) in sorted(throughput.items(), key=lambda item: (-item[1][0], -item[1][1], item[0])):
+        print(f"  {owner}: {recent} / {total}")
+
+    print(f"WIP by day (tasks in progress during the day, last {args.days}d):")
+    today = datetime.fromtimestamp(now, UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    for offset in range(args.days - 1, -1, -1):
+        day_start = (today - timedelta(days=offset)).timestamp()
+        active = sum(1 for start, end in intervals if start < day_start + 86400 and end >= day_start)
+        print(f"  {datetime.fromtimestamp(day_start, UTC).date().isoformat()}: {active}")
     if not args.quiet:
-        print(f"Ready: {len(ready_tasks)} / {len(tasks_sorted)}")
+        print(
+            f"Coverage: {len(done_at)} of {counts.get('DONE', 0)} DONE task(s) have a done time, "
+            f"{len(cycle)} a start commit (`{START_COMMIT_EMOJI} <suffix> ...`)"
+        )
 
 
 def _task_text_blob(task: TaskRecord) -> str:
@@ -1572,38 +2737,31 @@ def cmd_task_search(args: argparse.Namespace) -> None:
     if not query:
         die("Query must be non-empty", code=2)
 
-    _, tasks_by_id, warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = warnings + dep_warnings
-    if warnings and not args.quiet:
-        for warning in warnings:
-            print(f"⚠️ {warning}")
-
-    tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    if args.status:
-        want = {s.strip().upper() for s in args.status}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in want]
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
-
     if args.regex:
         try:
             pattern = re.compile(query, flags=re.IGNORECASE)
         except re.error as exc:
             die(f"Invalid regex: {exc}", code=2)
-        matches = [t for t in tasks_sorted if pattern.search(_task_text_blob(t) or "")]
+
+    pushed = query_tasks_pushdown(
+        status=args.status, owner=args.owner, tag=args.tag, text=query, regex=bool(args.regex)
+    )
+    if pushed is not None:
+        matches, dep_state, warnings = pushed
     else:
-        q = query.lower()
-        matches = [t for t in tasks_sorted if q in (_task_text_blob(t) or "").lower()]
+        _, tasks_by_id, warnings, key = load_task_index()
+        dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+        warnings = warnings + dep_warnings
+        tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
+        tasks_sorted = filter_tasks(tasks_sorted, status=args.status, owner=args.owner, tag=args.tag)
+        if args.regex:
+            matches = [t for t in tasks_sorted if pattern.search(_task_text_blob(t) or "")]
+        else:
+            q = query.lower()
+            matches = [t for t in tasks_sorted if q in (_task_text_blob(t) or "").lower()]
+    if warnings and not args.quiet:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
 
     if args.limit is not None and args.limit >= 0:
         matches = matches[: args.limit]
@@ -1619,7 +2777,7 @@ def cmd_task_scaffold(args: argparse.Namespace) -> None:
     title = args.title
     task: TaskRecord | None = None
     if not title and not args.force:
-        tasks, _ = load_task_store()
+        tasks = load_task_headers()
         task = _ensure_task_object(tasks, task_id)
         title = str(task.get("title") or "").strip()
 
@@ -1798,13 +2956,61 @@ def cmd_task_doc_set(args: argparse.Namespace) -> None:
 
 
 def export_tasks_snapshot(out_path: Path | None = None, *, quiet: bool = False) -> None:
+    batch = _WRITE_BATCH
+    if batch is not None and out_path is None:
+        batch["export_calls"] += 1
+        batch["export_quiet"] = batch["export_quiet"] and quiet
+        return
+    _export_tasks_snapshot(out_path, quiet=quiet)
+
+
+def patch_tasks_snapshot(target_path: Path) -> bool:
+    """Splice the point-written tasks into the existing snapshot; False when a full export is needed.
+
+    Only a snapshot whose checksum still holds and whose entries for those tasks match their pre-write digests
+    is patched, so a stale or hand-edited tasks.json is re-exported rather than given a fresh checksum.
+    """
+    try:
+        data = json.loads(target_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    tasks = data.get("tasks") if isinstance(data, dict) else None
+    meta = data.get(TASKS_META_KEY) if isinstance(data, dict) else None
+    if not isinstance(tasks, list) or not isinstance(meta, dict) or not all(isinstance(t, dict) for t in tasks):
+        return False
+    if meta.get("checksum") != compute_tasks_checksum(tasks):
+        return False
+    positions = {str(task.get("id") or ""): index for index, task in enumerate(tasks)}
+    for task_id, (previous_digest, stored) in _TASK_POINT_WRITES.items():
+        index = positions.get(task_id)
+        if index is None or task_digest(tasks[index]) != previous_digest:
+            return False
+        tasks[index] = stored
+    update_tasks_meta(data)
+    write_json(target_path, data)
+    return True
+
+
+def _export_tasks_snapshot(out_path: Path | None, *, quiet: bool) -> None:
     target_path = out_path or _resolve_repo_relative_path(TASKS_PATH_REL, label="task export output")
     backend = backend_instance()
-    if backend is not None and supports_export_tasks(backend):
-        backend.export_tasks_json(target_path)
-    else:
-        tasks, _ = load_task_store()
-        write_tasks_json_to_path(target_path, {"tasks": tasks})
+    point_writes = backend is not None and _TASK_CACHE is None and out_path is None and bool(_TASK_POINT_WRITES)
+    with file_lock(lock_name_for_path(target_path)):
+        if point_writes and patch_tasks_snapshot(target_path):
+            # Only the point-written tasks changed; every other entry of the snapshot is already current.
+            pass
+        elif backend is not None and _TASK_CACHE is not None and _TASK_CACHE_SYNCED:
+            # Same payload as the backends' export_tasks_json(), built from the session instead of a re-list.
+            payload: JsonDict = {"tasks": sorted(_TASK_CACHE, key=lambda task: str(task.get("id") or ""))}
+            update_tasks_meta(payload)
+            write_json(target_path, payload)
+        elif backend is not None and supports_export_tasks(backend):
+            backend.export_tasks_json(target_path)
+        else:
+            tasks, _ = load_task_store()
+            write_tasks_json_to_path(target_path, {"tasks": tasks})
+    if out_path is None:
+        _TASK_POINT_WRITES.clear()
     if not quiet:
         print(f"✅ exported tasks to {target_path.relative_to(ROOT)}")
 
@@ -1839,12 +3045,35 @@ def cmd_task_normalize(args: argparse.Namespace) -> None:
             for task in normalized:
                 backend.write_task(task)
         count = len(normalized)
-    global _TASK_CACHE
+    global _TASK_CACHE, _TASK_HEADER_CACHE
     _TASK_CACHE = None
+    _TASK_HEADER_CACHE = None
     if not args.quiet:
         print(f"✅ normalized {count} task(s)")
 
 
+def load_migrate_checkpoint(scope: JsonDict) -> dict[str, str]:
+    """Task id -> digest written by an interrupted migrate of the same source into the same backend."""
+    try:
+        lines = MIGRATE_CHECKPOINT_PATH.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+    done: dict[str, str] = {}
+    for index, line in enumerate(lines):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            if index == 0:
+                return {}
+            continue  # a line torn by the interruption
+        if index == 0:
+            if not isinstance(entry, dict) or entry.get("scope") != scope:
+                return {}
+        elif isinstance(entry, dict) and entry.get("id"):
+            done[str(entry["id"])] = str(entry.get("digest") or "")
+    return done
+
+
 def cmd_task_migrate(args: argparse.Namespace) -> None:
     require_tasks_json_write_context(force=bool(args.force))
     backend = backend_instance()
@@ -1859,14 +3088,58 @@ def cmd_task_migrate(args: argparse.Namespace) -> None:
     source_path = _resolve_repo_relative_path(source_raw, label="task migrate source")
     data = load_json(source_path)
     tasks = ensure_task_list(data.get("tasks"), label="tasks.json tasks")
-    if supports_write_tasks(backend):
-        backend.write_tasks(tasks)
-    else:
-        backend_write_task = cast(BackendWriteTask, backend)
-        for task in tasks:
-            backend_write_task.write_task(task)
+    # Digest before writing: backends fill in doc metadata on the records they are given.
+    digests = lint_task_digests(tasks)
+    scope: JsonDict = {"source": str(source_path), "backend": str(BACKEND_CONFIG.get("id") or "")}
+    done = {} if args.restart else load_migrate_checkpoint(scope)
+    pending = [
+        task for task in tasks if done.get(str(task.get("id") or "")) != digests.get(str(task.get("id") or ""), "")
+    ]
+    skipped = len(tasks) - len(pending)
+    if skipped and not args.quiet:
+        print(f"ℹ️ resuming: {skipped} task(s) already migrated (--restart to migrate all)")
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with MIGRATE_CHECKPOINT_PATH.open("a" if done else "w", encoding="utf-8") as checkpoint:
+        if not done:
+            checkpoint.write(json.dumps({"scope": scope}, ensure_ascii=False) + "\n")
+
+        def record(batch: TaskList) -> None:
+            nonlocal written
+            # A backend that cannot reach its remote keeps the task in its local cache marked dirty; that task
+            # still has to be migrated on the next run.
+            sent = [task for task in batch if task.get("dirty") is not True]
+            for task in sent:
+                task_id = str(task.get("id") or "")
+                entry = {"id": task_id, "digest": digests.get(task_id, "")}
+                checkpoint.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+            previous = written
+            written += len(sent)
+            if not args.quiet and (written // MIGRATE_BATCH_SIZE > previous // MIGRATE_BATCH_SIZE):
+                print(f"ℹ️ migrated {written}/{len(pending)} task(s)", flush=True)
+
+        if supports_import_tasks(backend):
+            backend.import_tasks(pending, on_written=lambda task: record([task]))
+        elif supports_write_tasks(backend):
+            for start in range(0, len(pending), MIGRATE_BATCH_SIZE):
+                batch = pending[start : start + MIGRATE_BATCH_SIZE]
+                backend.write_tasks(batch)
+                record(batch)
+        else:
+            backend_write_task = cast(BackendWriteTask, backend)
+            for task in pending:
+                backend_write_task.write_task(task)
+                record([task])
+    if written < len(pending):
+        die(
+            f"Migrated {written} of {len(pending)} task(s); the rest could not reach the backend and were only "
+            "cached locally. Rerun `agentctl task migrate` to resume.",
+            code=1,
+        )
+    MIGRATE_CHECKPOINT_PATH.unlink(missing_ok=True)
     if not args.quiet:
-        print(f"✅ migrated {len(tasks)} task(s) into backend")
+        print(f"✅ migrated {written} task(s) into backend")
 
 
 def load_backend_module(backend_id: str, module_path: Path) -> object:
@@ -1891,12 +3164,20 @@ def cmd_sync(args: argparse.Namespace) -> None:
             code=2,
         )
     backend_id = str(BACKEND_CONFIG.get("id") or "").strip()
+    direction = args.direction or "push"
+    # `sync flush` is shorthand for `sync --direction flush`, unless "flush" is the configured backend's id.
+    if args.backend == "flush" and backend_id != "flush":
+        if args.direction not in {None, "flush"}:
+            die(f"`sync flush` conflicts with --direction {args.direction}", code=2)
+        args.backend, direction = None, "flush"
     if args.backend and backend_id and args.backend != backend_id:
         die(f"Configured backend is {backend_id!r}, not {args.backend!r}", code=2)
     if not supports_sync_tasks(backend):
         die("Configured backend does not support sync()", code=2)
+    if direction == "flush" and not supports_flush_outbox(backend):
+        die("Configured backend has no write outbox to flush", code=2)
     backend.sync(
-        direction=args.direction,
+        direction=direction,
         conflict=args.conflict,
         quiet=args.quiet,
         confirm=bool(getattr(args, "yes", False)),
@@ -2008,14 +3289,17 @@ def compute_dependency_state(tasks_by_id: TaskIndex) -> tuple[DependencyState, l
     return state, warnings
 
 
-def readiness(task_id: str) -> tuple[bool, list[str]]:
-    _, tasks_by_id, index_warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = index_warnings + dep_warnings
-
-    task = tasks_by_id.get(task_id)
-    if not task:
-        return False, [*warnings, f"Unknown task id: {task_id}"]
+def readiness(task_id: str, task: TaskRecord | None = None) -> tuple[bool, list[str]]:
+    # A caller that already holds the task lets load_task_dependencies() read just its dependencies.
+    if task is None:
+        _, tasks_by_id, index_warnings, key = load_task_index()
+        dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
+        warnings = index_warnings + dep_warnings
+        task = tasks_by_id.get(task_id)
+        if not task:
+            return False, [*warnings, f"Unknown task id: {task_id}"]
+    else:
+        dep_state, warnings = load_task_dependencies(task)
 
     info = dep_state.get(task_id) or {}
     missing = info.get("missing") or []
@@ -2531,6 +3815,8 @@ def commit_from_comment(
     quiet: bool,
     cwd: Path,
 ) -> dict[str, str]:
+    # Staging and guard checks must see the tasks.json/README writes of the current batch.
+    flush_task_writes()
     allow_prefixes = [a for a in (allow or []) if str(a or "").strip()]
     if auto_allow and not allow_prefixes:
         allow_prefixes = suggest_allow_prefixes(git_status_changed_paths(cwd=cwd), mode="files")
@@ -2557,15 +3843,14 @@ def commit_from_comment(
     )
 
     try:
-        subprocess.run(
+        run(
             ["git", "commit", "-m", message],
-            cwd=str(cwd),
-            text=True,
-            check=True,
+            cwd=cwd,
             env=build_hook_env(task_id=task_id, allow_tasks=allow_tasks, allow_base=allow_tasks),
+            capture=False,
         )
     except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "git commit failed")
+        die((exc.stderr or "").strip() or "git commit failed")
 
     commit_info = get_commit_info("HEAD", cwd=cwd)
     if not quiet:
@@ -2733,14 +4018,17 @@ def cmd_role(args: argparse.Namespace) -> None:
 
 
 def load_agents_index() -> set[str]:
-    if not AGENTS_DIR.exists():
-        return set()
+    global _AGENTS_INDEX_CACHE
+    if _AGENTS_INDEX_CACHE is not None:
+        return _AGENTS_INDEX_CACHE
     ids: set[str] = set()
-    for path in sorted(AGENTS_DIR.glob("*.json")):
-        data = load_json(path)
-        agent_id = str(data.get("id") or "").strip().upper()
-        if agent_id:
-            ids.add(agent_id)
+    if AGENTS_DIR.exists():
+        for path in sorted(AGENTS_DIR.glob("*.json")):
+            data = load_json(path)
+            agent_id = str(data.get("id") or "").strip().upper()
+            if agent_id:
+                ids.add(agent_id)
+    _AGENTS_INDEX_CACHE = ids
     return ids
 
 
@@ -2786,121 +4074,284 @@ def command_path(args: argparse.Namespace) -> str:
     return " ".join(p for p in parts if p) or "<unknown>"
 
 
-def lint_tasks_json() -> dict[str, list[str]]:
-    errors: list[str] = []
-    warnings: list[str] = []
+def _lint_blank(value: object) -> bool:
+    return not isinstance(value, str) or not value.strip()
 
-    data = load_json(TASKS_PATH)
-    tasks = data.get("tasks")
-    if not isinstance(tasks, list):
-        return {"errors": ["tasks.json must contain a top-level 'tasks' list"], "warnings": []}
 
-    meta = data.get(TASKS_META_KEY)
-    if not isinstance(meta, dict):
-        errors.append("tasks.json is missing a top-level 'meta' object (manual edits are not allowed)")
-    else:
-        expected = compute_tasks_checksum(tasks)
-        checksum = str(meta.get("checksum") or "")
-        algo = str(meta.get("checksum_algo") or "")
-        managed_by = str(meta.get("managed_by") or "")
-        if algo != "sha256":
-            errors.append("tasks.json meta.checksum_algo must be 'sha256'")
-        if managed_by != TASKS_META_MANAGED_BY:
-            errors.append("tasks.json meta.managed_by must be 'agentctl'")
-        if not checksum:
-            errors.append("tasks.json meta.checksum is missing/empty")
-        elif checksum != expected:
-            errors.append("tasks.json meta.checksum does not match tasks payload (manual edit?)")
-
-    tasks_by_id, index_warnings = index_tasks_by_id(tasks)
-    errors.extend(index_warnings)
+def _lint_bad_str_list(value: object) -> bool:
+    return value is not None and (not isinstance(value, list) or any(_lint_blank(item) for item in value))
 
-    dep_state, dep_warnings = compute_dependency_state(tasks_by_id)
-    errors.extend(dep_warnings)
 
-    known_agents = load_agents_index()
-    for task_id, task in tasks_by_id.items():
-        status = str(task.get("status") or "TODO").strip().upper()
-        if status not in ALLOWED_STATUSES:
-            errors.append(f"{task_id}: invalid status {status!r}")
-
-        title = task.get("title")
-        if not isinstance(title, str) or not title.strip():
-            errors.append(f"{task_id}: title must be a non-empty string")
-
-        description = task.get("description")
-        if description is not None and (not isinstance(description, str) or not description.strip()):
-            errors.append(f"{task_id}: description must be a non-empty string when present")
-
-        owner = task.get("owner")
-        if owner is not None and (not isinstance(owner, str) or not owner.strip()):
-            errors.append(f"{task_id}: owner must be a non-empty string when present")
-        owner_upper = str(owner or "").strip().upper()
-        if (
-            owner_upper
-            and known_agents
-            and owner_upper not in known_agents
-            and owner_upper not in {"HUMAN", "ORCHESTRATOR"}
-        ):
+def lint_rule_status(ctx: LintContext, batch: LintBatch) -> list[str]:
+    statuses = ctx["statuses"]
+    return [
+        f"{task_id}: invalid status {statuses[task_id]!r}"
+        for task_id, _ in batch
+        if statuses[task_id] not in ALLOWED_STATUSES
+    ]
+
+
+def lint_rule_title(_ctx: LintContext, batch: LintBatch) -> list[str]:
+    return [f"{task_id}: title must be a non-empty string" for task_id, task in batch if _lint_blank(task.get("title"))]
+
+
+def lint_rule_description(_ctx: LintContext, batch: LintBatch) -> list[str]:
+    return [
+        f"{task_id}: description must be a non-empty string when present"
+        for task_id, task in batch
+        if task.get("description") is not None and _lint_blank(task.get("description"))
+    ]
+
+
+def lint_rule_owner(ctx: LintContext, batch: LintBatch) -> list[str]:
+    errors = [
+        f"{task_id}: owner must be a non-empty string when present"
+        for task_id, task in batch
+        if task.get("owner") is not None and _lint_blank(task.get("owner"))
+    ]
+    known_agents = ctx["known_agents"]
+    if not known_agents:
+        return errors
+    allowed = known_agents | {"HUMAN", "ORCHESTRATOR"}
+    for task_id, task in batch:
+        owner_upper = str(task.get("owner") or "").strip().upper()
+        if owner_upper and owner_upper not in allowed:
             errors.append(f"{task_id}: owner {owner_upper!r} is not a known agent id")
+    return errors
 
-        tags = coerce_str_list(task.get("tags"))
-        verify = coerce_str_list(task.get("verify"))
-        if requires_verify(tags) and not verify:
-            errors.append(f"{task_id}: verify commands are required for tasks with code/backend/frontend tags")
 
-        tags_value = task.get("tags")
-        if tags_value is not None and (
-            not isinstance(tags_value, list) or any(not isinstance(tag, str) or not tag.strip() for tag in tags_value)
-        ):
-            errors.append(f"{task_id}: tags must be a list of non-empty strings")
+def lint_rule_tags(_ctx: LintContext, batch: LintBatch) -> list[str]:
+    return [
+        f"{task_id}: tags must be a list of non-empty strings"
+        for task_id, task in batch
+        if _lint_bad_str_list(task.get("tags"))
+    ]
 
-        comments = task.get("comments")
-        if comments is not None:
-            if not isinstance(comments, list):
-                errors.append(f"{task_id}: comments must be a list")
-            else:
-                for idx, comment in enumerate(comments):
-                    if not isinstance(comment, dict):
-                        errors.append(f"{task_id}: comments[{idx}] must be an object")
-                        continue
-                    author = comment.get("author")
-                    body = comment.get("body")
-                    if not isinstance(author, str) or not author.strip():
-                        errors.append(f"{task_id}: comments[{idx}].author must be a non-empty string")
-                    if not isinstance(body, str) or not body.strip():
-                        errors.append(f"{task_id}: comments[{idx}].body must be a non-empty string")
 
+def lint_rule_verify(ctx: LintContext, batch: LintBatch) -> list[str]:
+    verify_tags = ctx["verify_tags"]
+    errors: list[str] = []
+    for task_id, task in batch:
         verify_value = task.get("verify")
-        if verify_value is not None and (
-            not isinstance(verify_value, list)
-            or any(not isinstance(cmd, str) or not cmd.strip() for cmd in verify_value)
-        ):
+        if _lint_bad_str_list(verify_value):
             errors.append(f"{task_id}: verify must be a list of non-empty strings")
+        if coerce_str_list(verify_value):
+            continue
+        if verify_tags & {tag.lower() for tag in coerce_str_list(task.get("tags"))}:
+            errors.append(f"{task_id}: verify commands are required for tasks with code/backend/frontend tags")
+    return errors
+
+
+def lint_rule_comments(_ctx: LintContext, batch: LintBatch) -> list[str]:
+    errors: list[str] = []
+    for task_id, task in batch:
+        comments = task.get("comments")
+        if comments is None:
+            continue
+        if not isinstance(comments, list):
+            errors.append(f"{task_id}: comments must be a list")
+            continue
+        for idx, comment in enumerate(comments):
+            if not isinstance(comment, dict):
+                errors.append(f"{task_id}: comments[{idx}] must be an object")
+                continue
+            if _lint_blank(comment.get("author")):
+                errors.append(f"{task_id}: comments[{idx}].author must be a non-empty string")
+            if _lint_blank(comment.get("body")):
+                errors.append(f"{task_id}: comments[{idx}].body must be a non-empty string")
+    return errors
 
+
+def lint_rule_dependencies(ctx: LintContext, batch: LintBatch) -> list[str]:
+    statuses = ctx["statuses"]
+    dep_state = ctx["dep_state"]
+    errors: list[str] = []
+    for task_id, _ in batch:
+        status = statuses[task_id]
+        if status not in {"DOING", "DONE"}:
+            continue
         dep_info = dep_state.get(task_id) or {}
-        missing = dep_info.get("missing") or []
-        incomplete = dep_info.get("incomplete") or []
-        if status in {"DOING", "DONE"} and (missing or incomplete):
+        if dep_info.get("missing") or dep_info.get("incomplete"):
             errors.append(f"{task_id}: status {status} but dependencies are not satisfied")
+    return errors
 
-        if status == "DONE":
-            commit = task.get("commit")
-            if not isinstance(commit, dict):
-                errors.append(f"{task_id}: DONE tasks must include commit metadata")
-            else:
-                chash = str(commit.get("hash") or "").strip()
-                msg = str(commit.get("message") or "").strip()
-                if len(chash) < 7:
-                    errors.append(f"{task_id}: commit.hash must be a git hash")
-                if not msg:
-                    errors.append(f"{task_id}: commit.message must be non-empty")
 
-    return {"errors": sorted(set(errors)), "warnings": sorted(set(warnings))}
+def lint_rule_done_commit(ctx: LintContext, batch: LintBatch) -> list[str]:
+    statuses = ctx["statuses"]
+    errors: list[str] = []
+    for task_id, task in batch:
+        if statuses[task_id] != "DONE":
+            continue
+        commit = task.get("commit")
+        if not isinstance(commit, dict):
+            errors.append(f"{task_id}: DONE tasks must include commit metadata")
+            continue
+        if len(str(commit.get("hash") or "").strip()) < 7:
+            errors.append(f"{task_id}: commit.hash must be a git hash")
+        if not str(commit.get("message") or "").strip():
+            errors.append(f"{task_id}: commit.message must be non-empty")
+    return errors
+
+
+# Each rule checks one field across the whole batch; the order only affects evaluation, not the sorted output.
+TASK_LINT_RULES: tuple[TaskLintRule, ...] = (
+    lint_rule_status,
+    lint_rule_title,
+    lint_rule_description,
+    lint_rule_owner,
+    lint_rule_tags,
+    lint_rule_verify,
+    lint_rule_comments,
+    lint_rule_dependencies,
+    lint_rule_done_commit,
+)
+
+
+def lint_tasks_meta(meta: object, tasks: TaskList, *, verify_checksum: bool) -> list[str]:
+    if not isinstance(meta, dict):
+        return ["tasks.json is missing a top-level 'meta' object (manual edits are not allowed)"]
+    errors: list[str] = []
+    checksum = str(meta.get("checksum") or "")
+    if str(meta.get("checksum_algo") or "") != "sha256":
+        errors.append("tasks.json meta.checksum_algo must be 'sha256'")
+    if str(meta.get("managed_by") or "") != TASKS_META_MANAGED_BY:
+        errors.append("tasks.json meta.managed_by must be 'agentctl'")
+    if not checksum:
+        errors.append("tasks.json meta.checksum is missing/empty")
+    elif verify_checksum and checksum != compute_tasks_checksum(tasks):
+        errors.append("tasks.json meta.checksum does not match tasks payload (manual edit?)")
+    return errors
+
+
+def lint_scope_ids(tasks_by_id: TaskIndex, changed_ids: set[str]) -> set[str]:
+    """Return the changed tasks plus their direct dependents (whose dependency check depends on them)."""
+    scope = {task_id for task_id in changed_ids if task_id in tasks_by_id}
+    for task_id, task in tasks_by_id.items():
+        depends_on = task.get("depends_on")
+        if isinstance(depends_on, list) and any(
+            isinstance(dep, str) and dep.strip() in changed_ids for dep in depends_on
+        ):
+            scope.add(task_id)
+    return scope
+
+
+def dependency_closure(tasks_by_id: TaskIndex, roots: set[str]) -> TaskIndex:
+    """Return the roots and every task reachable from them through depends_on."""
+    closure: TaskIndex = {}
+    pending = list(roots)
+    while pending:
+        task_id = pending.pop()
+        task = tasks_by_id.get(task_id)
+        if task is None or task_id in closure:
+            continue
+        closure[task_id] = task
+        depends_on, _ = normalize_depends_on(task.get("depends_on"))
+        pending.extend(depends_on)
+    return closure
+
+
+def lint_tasks(tasks: TaskList, *, changed_ids: set[str] | None = None) -> dict[str, list[str]]:
+    """Run TASK_LINT_RULES over in-memory tasks.
+
+    With changed_ids only those tasks and their direct dependents are checked; dependency state and cycle
+    detection are computed over their depends_on closure, which contains every cycle a change can introduce.
+    """
+    tasks_by_id, errors = index_tasks_by_id(tasks)
+    if changed_ids is None:
+        batch = list(tasks_by_id.items())
+        dep_state, dep_warnings = compute_dependency_state(tasks_by_id)
+    else:
+        scope = lint_scope_ids(tasks_by_id, changed_ids)
+        batch = [(task_id, tasks_by_id[task_id]) for task_id in sorted(scope)]
+        dep_state, dep_warnings = compute_dependency_state(dependency_closure(tasks_by_id, scope))
+    errors.extend(dep_warnings)
+    ctx: LintContext = {
+        "dep_state": dep_state,
+        "known_agents": load_agents_index(),
+        "verify_tags": verify_required_tags(),
+        "statuses": {task_id: str(task.get("status") or "TODO").strip().upper() for task_id, task in batch},
+    }
+    for rule in TASK_LINT_RULES:
+        errors.extend(rule(ctx, batch))
+    return {"errors": sorted(set(errors)), "warnings": []}
+
+
+def lint_tasks_json(
+    data: JsonDict | None = None,
+    *,
+    changed_ids: set[str] | None = None,
+    verify_checksum: bool = True,
+) -> dict[str, list[str]]:
+    """Lint tasks.json, or an already-loaded payload when data is given (no file re-read).
+
+    Writers pass verify_checksum=False because update_tasks_meta has just computed the checksum from
+    the same payload.
+    """
+    scope = "all" if changed_ids is None else len(changed_ids)
+    with timing_span("lint", "tasks.json", changed=scope):
+        payload = load_json(TASKS_PATH) if data is None else data
+        tasks = payload.get("tasks")
+        if not isinstance(tasks, list):
+            return {"errors": ["tasks.json must contain a top-level 'tasks' list"], "warnings": []}
+        task_list = cast(TaskList, tasks)
+        meta_errors = lint_tasks_meta(payload.get(TASKS_META_KEY), task_list, verify_checksum=verify_checksum)
+        result = lint_tasks(task_list, changed_ids=changed_ids)
+        return {"errors": sorted({*meta_errors, *result["errors"]}), "warnings": result["warnings"]}
+
+
+def lint_task_digests(tasks: TaskList) -> dict[str, str]:
+    tasks_by_id, _ = index_tasks_by_id(tasks)
+    return {
+        task_id: hashlib.sha256(task_digest(task).encode("utf-8")).hexdigest() for task_id, task in tasks_by_id.items()
+    }
+
+
+def changed_task_ids(before: TaskList, after: TaskList) -> set[str]:
+    previous = lint_task_digests(before)
+    current = lint_task_digests(after)
+    changed = {task_id for task_id, digest in current.items() if previous.get(task_id) != digest}
+    return changed | (previous.keys() - current.keys())
+
+
+def lint_state_fingerprint() -> JsonDict:
+    # Anything besides the tasks that changes lint results invalidates the recorded digests.
+    return {
+        "version": LINT_STATE_VERSION,
+        "tasks_path": TASKS_PATH_REL,
+        "agents": sorted(load_agents_index()),
+        "verify_required_tags": sorted(verify_required_tags()),
+    }
+
+
+def load_lint_state() -> dict[str, str] | None:
+    try:
+        state = json.loads(LINT_STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(state, dict) or state.get("fingerprint") != lint_state_fingerprint():
+        return None
+    digests = state.get("digests")
+    if not isinstance(digests, dict):
+        return None
+    return {str(task_id): str(digest) for task_id, digest in digests.items()}
+
+
+def save_lint_state(digests: dict[str, str]) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(LINT_STATE_PATH, {"fingerprint": lint_state_fingerprint(), "digests": digests})
 
 
 def cmd_task_lint(args: argparse.Namespace) -> None:
-    result = lint_tasks_json()
+    data = load_json(TASKS_PATH)
+    tasks = data.get("tasks")
+    digests = lint_task_digests(cast(TaskList, tasks)) if isinstance(tasks, list) else {}
+    changed_ids: set[str] | None = None
+    if args.changed_only:
+        previous = load_lint_state()
+        if previous is not None:
+            changed_ids = {task_id for task_id, digest in digests.items() if previous.get(task_id) != digest}
+            changed_ids |= previous.keys() - digests.keys()
+    result = lint_tasks_json(data, changed_ids=changed_ids)
     if not args.quiet:
         for message in result["warnings"]:
             print(f"⚠️ {message}")
@@ -2908,7 +4359,11 @@ def cmd_task_lint(args: argparse.Namespace) -> None:
         for message in result["errors"]:
             print(f"❌ {message}", file=sys.stderr)
         raise SystemExit(2)
-    print(f"✅ {TASKS_PATH_REL} OK")
+    save_lint_state(digests)
+    if changed_ids is None:
+        print(f"✅ {TASKS_PATH_REL} OK")
+    else:
+        print(f"✅ {TASKS_PATH_REL} OK ({len(changed_ids)} task(s) changed since the last clean lint)")
 
 
 def cmd_ready(args: argparse.Namespace) -> None:
@@ -3074,19 +4529,18 @@ def cmd_commit(args: argparse.Namespace) -> None:
     )
 
     try:
-        subprocess.run(
+        run(
             ["git", "commit", "-m", message],
-            cwd=str(cwd),
-            text=True,
-            check=True,
+            cwd=cwd,
             env=build_hook_env(
                 task_id=task_id,
                 allow_tasks=bool(args.allow_tasks),
                 allow_base=bool(args.allow_tasks),
             ),
+            capture=False,
         )
     except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "git commit failed")
+        die((exc.stderr or "").strip() or "git commit failed")
     commit_info = get_commit_info("HEAD", cwd=cwd)
     if not args.quiet:
         print(f"✅ committed {commit_info['hash'][:12]} {commit_info['message']}")
@@ -3105,15 +4559,15 @@ def cmd_start(args: argparse.Namespace) -> None:
     if not args.force:
         prefix, min_chars = comment_rule("start")
         require_structured_comment(args.body, prefix=prefix, min_chars=min_chars)
+    # Load the task first: readiness and the final status line then only read its dependencies.
+    target, save = load_task_for_update(args.task_id)
     if not args.force:
-        ok, warnings = readiness(args.task_id)
+        ok, warnings = readiness(args.task_id, target)
         if not ok:
             for warning in warnings:
                 print(f"⚠️ {warning}")
             die(f"Task is not ready: {args.task_id} (use --force to override)", code=2)
 
-    tasks, save = load_task_store()
-    target = _ensure_task_object(tasks, args.task_id)
     current = str(target.get("status") or "").strip().upper() or "TODO"
     if not is_transition_allowed(current, "DOING") and not args.force:
         die(f"Refusing status transition {current} -> DOING (use --force to override)", code=2)
@@ -3132,7 +4586,7 @@ def cmd_start(args: argparse.Namespace) -> None:
     )
     comments.append({"author": args.author, "body": comment_body})
     target["comments"] = comments
-    save(tasks)
+    save(target)
     export_tasks_snapshot(quiet=bool(args.quiet))
     commit_info = None
     if getattr(args, "commit_from_comment", False):
@@ -3149,13 +4603,11 @@ def cmd_start(args: argparse.Namespace) -> None:
             cwd=Path.cwd().resolve(),
         )
     if not args.quiet:
-        _, tasks_by_id, _, key = load_task_index()
-        dep_state, _ = load_dependency_state_for(tasks_by_id, key=key)
-        task = tasks_by_id.get(args.task_id) or target
+        dep_state, _ = load_task_dependencies(target)
         suffix = ""
         if commit_info:
             suffix = f" (commit={commit_info.get('hash', '')[:12]})"
-        print(f"✅ started: {format_task_line(task, dep_state=dep_state)}{suffix}")
+        print(f"✅ started: {format_task_line(target, dep_state=dep_state)}{suffix}")
 
 
 def cmd_block(args: argparse.Namespace) -> None:
@@ -3171,8 +4623,7 @@ def cmd_block(args: argparse.Namespace) -> None:
     if not args.force:
         prefix, min_chars = comment_rule("blocked")
         require_structured_comment(args.body, prefix=prefix, min_chars=min_chars)
-    tasks, save = load_task_store()
-    target = _ensure_task_object(tasks, args.task_id)
+    target, save = load_task_for_update(args.task_id)
     current = str(target.get("status") or "").strip().upper() or "TODO"
     if not is_transition_allowed(current, "BLOCKED") and not args.force:
         die(f"Refusing status transition {current} -> BLOCKED (use --force to override)", code=2)
@@ -3187,7 +4638,7 @@ def cmd_block(args: argparse.Namespace) -> None:
         comments = []
     comments.append({"author": args.author, "body": comment_body})
     target["comments"] = comments
-    save(tasks)
+    save(target)
     export_tasks_snapshot(quiet=bool(args.quiet))
     commit_info = None
     if getattr(args, "commit_from_comment", False):
@@ -3204,26 +4655,23 @@ def cmd_block(args: argparse.Namespace) -> None:
             cwd=Path.cwd().resolve(),
         )
     if not args.quiet:
-        _, tasks_by_id, _, key = load_task_index()
-        dep_state, _ = load_dependency_state_for(tasks_by_id, key=key)
-        task = tasks_by_id.get(args.task_id) or target
+        dep_state, _ = load_task_dependencies(target)
         suffix = ""
         if commit_info:
             suffix = f" (commit={commit_info.get('hash', '')[:12]})"
-        print(f"✅ blocked: {format_task_line(task, dep_state=dep_state)}{suffix}")
+        print(f"✅ blocked: {format_task_line(target, dep_state=dep_state)}{suffix}")
 
 
 def cmd_task_comment(args: argparse.Namespace) -> None:
     require_tasks_json_write_context()
-    tasks, save = load_task_store()
-    target = _ensure_task_object(tasks, args.task_id)
+    target, save = load_task_for_update(args.task_id)
 
     comments = target.get("comments")
     if not isinstance(comments, list):
         comments = []
     comments.append({"author": args.author, "body": args.body})
     target["comments"] = comments
-    save(tasks)
+    save(target)
 
 
 def _ensure_task_object(container: object, task_id: str) -> TaskRecord:
@@ -3247,10 +4695,7 @@ def _generate_task_id_via_local_backend(
     length: int = 6,
     attempts: int = 1000,
 ) -> str:
-    local_path = SWARM_DIR / "backends" / "local" / "backend.py"
-    if not local_path.exists():
-        die(f"Local backend module not found: {local_path}", code=2)
-    module = load_backend_module("local", local_path)
+    module = local_backend_module()
     backend_cls = cast(Callable[..., object] | None, getattr(module, "LocalBackend", None))
     if backend_cls is None:
         die("LocalBackend class not found", code=2)
@@ -3371,8 +4816,7 @@ def cmd_task_new(args: argparse.Namespace) -> None:
 
 def cmd_task_update(args: argparse.Namespace) -> None:
     require_tasks_json_write_context()
-    tasks, save = load_task_store()
-    task = _ensure_task_object(tasks, args.task_id)
+    task, save = load_task_for_update(args.task_id)
 
     if args.title is not None:
         task["title"] = args.title
@@ -3409,7 +4853,7 @@ def cmd_task_update(args: argparse.Namespace) -> None:
     if requires_verify(tags_for_check) and not verify_for_check:
         die("verify commands are required for tasks with code/backend/frontend tags", code=2)
 
-    save(tasks)
+    save(task)
 
 
 def _scrub_value(value: object, find_text: str, replace_text: str) -> object:
@@ -3670,6 +5114,12 @@ def cmd_task_set_status(args: argparse.Namespace) -> None:
 
 
 def cmd_finish(args: argparse.Namespace) -> None:
+    # Save and export once at the end (or before the status commit) instead of after every step.
+    with deferred_task_writes():
+        _cmd_finish(args)
+
+
+def _cmd_finish(args: argparse.Namespace) -> None:
     raw_task_ids = args.task_id if isinstance(args.task_id, list) else [args.task_id]
     task_ids = normalize_task_ids(raw_task_ids)
     primary_task_id = task_ids[0] if task_ids else ""
@@ -4027,7 +5477,7 @@ def assert_no_diff_paths(*, base: str, branch: str, forbidden: list[str], cwd: P
 
 
 def task_title(task_id: str) -> str:
-    tasks, _ = load_task_store()
+    tasks = load_task_headers()
     tasks_by_id, _ = index_tasks_by_id(tasks)
     task = tasks_by_id.get(task_id)
     return str(task.get("title") or "").strip() if task else ""
@@ -4223,13 +5673,7 @@ def cmd_branch_remove(args: argparse.Namespace) -> None:
 
 
 def _run_agentctl_in_checkout(args: list[str], *, cwd: Path, quiet: bool) -> None:
-    proc = subprocess.run(
-        [sys.executable, ".codex-swarm/agentctl.py", *args],
-        cwd=str(cwd),
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    proc = run([sys.executable, ".codex-swarm/agentctl.py", *args], cwd=cwd, check=False)
     if proc.returncode != 0:
         out = (proc.stdout or "").strip()
         err = (proc.stderr or "").strip()
@@ -4379,7 +5823,7 @@ def cmd_cleanup_merged(args: argparse.Namespace) -> None:
     if not git_branch_exists(base):
         die(f"Unknown base branch: {base}", code=2)
 
-    tasks, _ = load_task_store()
+    tasks = load_task_headers()
     tasks_by_id, _ = index_tasks_by_id(tasks)
 
     candidates: list[dict[str, str]] = []
@@ -4758,7 +6202,8 @@ def pr_read_file_text(task_id: str, filename: str, *, branch: str | None) -> str
 
 
 def pr_write_meta(meta_path: Path, meta: JsonDict) -> None:
-    write_json(meta_path, meta)
+    with file_lock(lock_name_for_path(meta_path)):
+        write_json(meta_path, meta)
 
 
 def pr_ensure_skeleton(*, task_id: str, branch: str, author: str, base_branch: str) -> Path:
@@ -5097,8 +6542,14 @@ def cmd_pr_note(args: argparse.Namespace) -> None:
 
 
 def get_task_verify_commands_for(task_id: str) -> list[str]:
-    tasks, _ = load_task_store()
-    task = _ensure_task_object(tasks, task_id)
+    backend = point_read_backend() if _TASK_HEADER_CACHE is None else None
+    if backend is None:
+        task = _ensure_task_object(load_task_headers(), task_id)
+    else:
+        point_task = backend.get_task(task_id)
+        if point_task is None:
+            die(f"Unknown task id: {task_id}")
+        task = point_task
     verify = task.get("verify")
     if verify is None:
         return []
@@ -5140,7 +6591,8 @@ def run_verify_with_capture(
         if not quiet:
             print(f"$ {command}")
         timestamp = now_iso_utc()
-        proc = subprocess.run(command, cwd=str(cwd), shell=True, text=True, capture_output=True, check=False)
+        with timing_span("verify", command, task_id=task_id):
+            proc = subprocess.run(command, cwd=str(cwd), shell=True, text=True, capture_output=True, check=False)
         output = ""
         if proc.stdout:
             output += proc.stdout
@@ -5356,19 +6808,20 @@ def cmd_integrate(args: argparse.Namespace) -> None:
         else:
             verify_desc = "skipped"
         finish_body = f"Verified: Integrated via {strategy}; verify={verify_desc}; pr={pr_path.relative_to(ROOT)}."
-        cmd_finish(
-            argparse.Namespace(
-                task_id=task_id,
-                commit=merge_hash,
-                author="INTEGRATOR",
-                body=finish_body,
-                skip_verify=True,
-                quiet=bool(args.quiet),
-                force=False,
-                require_task_id_in_commit=True,
+        # The batch folds finish's save/export and the closing tasks.json lint into one commit point.
+        with deferred_task_writes(lint=True):
+            cmd_finish(
+                argparse.Namespace(
+                    task_id=task_id,
+                    commit=merge_hash,
+                    author="INTEGRATOR",
+                    body=finish_body,
+                    skip_verify=True,
+                    quiet=bool(args.quiet),
+                    force=False,
+                    require_task_id_in_commit=True,
+                )
             )
-        )
-        cmd_task_lint(argparse.Namespace(quiet=bool(args.quiet)))
 
         if not pr_path.exists():
             die(f"Missing PR artifact dir after merge: {pr_path}", code=2)
@@ -5411,6 +6864,206 @@ def cmd_integrate(args: argparse.Namespace) -> None:
             run(["git", "worktree", "remove", "--force", str(temp_path)], check=False)
 
 
+SERVER_READ_TIMEOUT_SECONDS = 10.0
+
+
+def reset_command_state() -> None:
+    """Forget per-command state before `agentctl serve` runs the next command in the same process.
+
+    The backend instance stays warm, and so do the task index and dependency caches: both are keyed by a
+    checksum of the task list and are only reused while the store content is unchanged.
+    """
+    global _TASK_CACHE, _TASK_STORED_DIGESTS, _TASK_CACHE_SYNCED, _TASK_HEADER_CACHE, _AGENTS_INDEX_CACHE
+    global _WRITE_BATCH, _GIT_MEMO, _IMPORT_STARTED, _BACKEND_INSTANCE
+    _TASK_CACHE = None
+    _TASK_STORED_DIGESTS = None
+    _TASK_CACHE_SYNCED = False
+    _TASK_HEADER_CACHE = None
+    _AGENTS_INDEX_CACHE = None
+    _WRITE_BATCH = None
+    _TASK_POINT_WRITES.clear()
+    _GIT_MEMO = {} if os.environ.get("CODEXSWARM_GIT_MEMO", "").strip() == "1" else None
+    # A served command pays no import or config load, so its startup span starts here.
+    _IMPORT_STARTED = time.perf_counter()
+    if isinstance(_BACKEND_INSTANCE, TimedBackend):
+        _BACKEND_INSTANCE = _BACKEND_INSTANCE.wrapped
+    backend = _BACKEND_INSTANCE
+    if backend is not None and supports_reset_caches(backend):
+        backend.reset_caches()
+
+
+def server_fingerprint() -> list[tuple[str, int]]:
+    """Modification times of the code and config a server loaded at start-up; any change makes it stale."""
+    paths = [Path(__file__).resolve(), SWARM_CONFIG_PATH, ROOT / ".env"]
+    paths.extend(Path(str(BACKEND_CONFIG[key])) for key in ("_config_path", "_module_path") if key in BACKEND_CONFIG)
+    stamps: list[tuple[str, int]] = []
+    for path in paths:
+        try:
+            stamps.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            stamps.append((str(path), 0))
+    return stamps
+
+
+def serve_run(argv: list[str], *, cwd: str, env: dict[str, str]) -> JsonDict:
+    """Run one command as `agentctl <argv>` would from cwd with env, capturing its output and exit code."""
+    global _SERVING
+    saved_env, saved_cwd = dict(os.environ), Path.cwd()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    try:
+        os.environ.clear()
+        os.environ.update(env)
+        # Nested agentctl processes (git hooks) must not call back into this busy server.
+        os.environ[SERVER_DISABLE_ENV] = "1"
+        load_env_file(ROOT / ".env")
+        os.chdir(cwd)
+        reset_command_state()
+        _SERVING = True
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                main(argv)
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    exit_code = exc.code
+                elif exc.code is not None:
+                    print(exc.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        _SERVING = False
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def rpc_result(request_id: object, result: JsonDict) -> JsonDict:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def rpc_error(request_id: object, code: int, message: str) -> JsonDict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def handle_rpc(request: object, *, fingerprint: list[tuple[str, int]], stats: JsonDict) -> tuple[JsonDict, bool]:
+    """Answer one JSON-RPC request; the flag asks the server to stop after replying."""
+    if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+        return rpc_error(None, -32600, "Invalid request"), False
+    request_id, method = request.get("id"), request["method"]
+    if method == "ping":
+        return rpc_result(request_id, stats), False
+    if method == "shutdown":
+        return rpc_result(request_id, {"stopping": True}), True
+    if method != "run":
+        return rpc_error(request_id, -32601, f"Method not found: {method}"), False
+    if server_fingerprint() != fingerprint:
+        return rpc_error(request_id, SERVER_STALE_ERROR, "agentctl code or config changed; server stopping"), True
+    params = request.get("params")
+    argv = params.get("argv") if isinstance(params, dict) else None
+    cwd = params.get("cwd") if isinstance(params, dict) else None
+    env = params.get("env") if isinstance(params, dict) else None
+    if (
+        not isinstance(argv, list)
+        or not all(isinstance(arg, str) for arg in argv)
+        or not isinstance(cwd, str)
+        or not isinstance(env, dict)
+        or not all(isinstance(key, str) and isinstance(value, str) for key, value in env.items())
+    ):
+        return rpc_error(request_id, -32602, "run expects params {argv: [str], cwd: str, env: {str: str}}"), False
+    stats["requests"] = cast(int, stats["requests"]) + 1
+    return rpc_result(request_id, serve_run(argv, cwd=cwd, env=env)), False
+
+
+def serve_connection(conn: socket.socket, *, fingerprint: list[tuple[str, int]], stats: JsonDict) -> bool:
+    conn.settimeout(SERVER_READ_TIMEOUT_SECONDS)
+    chunks: list[bytes] = []
+    try:
+        while chunk := conn.recv(65536):
+            chunks.append(chunk)
+    except OSError:
+        return False
+    try:
+        request = json.loads(b"".join(chunks))
+    except ValueError:
+        response, stop = rpc_error(None, -32700, "Parse error"), False
+    else:
+        response, stop = handle_rpc(request, fingerprint=fingerprint, stats=stats)
+    with contextlib.suppress(OSError):
+        conn.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+    return stop
+
+
+def server_call(method: str) -> JsonDict | None:
+    """Call a control method on the running server; None when nothing answers."""
+    client = load_agentctl_client()
+    if client is None:
+        die(f"agentctl serve needs {AGENTCTL_CLIENT_PATH.name} next to agentctl.py", code=2)
+    rpc_call = cast(Callable[[str], JsonDict | None], client.rpc_call)
+    try:
+        response = rpc_call(method)
+    except (OSError, ValueError):
+        return None
+    result = response.get("result") if response is not None else None
+    return cast(JsonDict, result) if isinstance(result, dict) else None
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    global _SERVER_PARSER
+    if not hasattr(socket, "AF_UNIX"):
+        die("agentctl serve requires Unix domain sockets", code=2)
+    path = SERVER_SOCKET_PATH
+    if args.status or args.stop:
+        result = server_call("ping" if args.status else "shutdown")
+        if result is None:
+            die(f"No agentctl server is listening on {path}", code=1)
+        if args.status:
+            print(f"pid={result.get('pid')} started_at={result.get('started_at')} requests={result.get('requests')}")
+        elif not args.quiet:
+            print(f"✅ stopped the server on {path}")
+        return
+    if server_call("ping") is not None:
+        die(f"An agentctl server is already listening on {path}", code=2)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous_umask = os.umask(0o177)
+    try:
+        listener.bind(str(path))
+    except OSError as exc:
+        listener.close()
+        die(f"Cannot listen on {path}: {exc} (set {SERVER_SOCKET_ENV} to a shorter path)", code=2)
+    finally:
+        os.umask(previous_umask)
+    listener.listen(64)
+    listener.settimeout(args.idle_timeout or None)
+    fingerprint = server_fingerprint()
+    _SERVER_PARSER = build_parser()
+    stats: JsonDict = {"pid": os.getpid(), "started_at": now_iso_utc(), "requests": 0}
+    if not args.quiet:
+        print(f"✅ serving on {path} (pid {os.getpid()})", flush=True)
+    try:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except TimeoutError:
+                break
+            with conn:
+                if serve_connection(conn, fingerprint=fingerprint, stats=stats):
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+    if not args.quiet:
+        print(f"✅ server stopped after {stats['requests']} request(s)")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="agentctl", description="TokenSpot agent workflow helper")
     sub = parser.add_subparsers(dest="cmd", required=True)
@@ -5467,6 +7120,21 @@ def build_parser() -> argparse.ArgumentParser:
     p_upgrade.add_argument("--quiet", action="store_true", help="Minimal output")
     p_upgrade.set_defaults(func=cmd_upgrade)
 
+    p_serve = sub.add_parser(
+        "serve", help="Serve agentctl commands over a Unix socket with the backend and task caches kept warm"
+    )
+    serve_mode = p_serve.add_mutually_exclusive_group()
+    serve_mode.add_argument("--status", action="store_true", help="Print the running server's pid and request count")
+    serve_mode.add_argument("--stop", action="store_true", help="Stop the running server")
+    p_serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0.0,
+        help="Exit after this many seconds without a request (default: 0, never)",
+    )
+    p_serve.add_argument("--quiet", action="store_true", help="Minimal output")
+    p_serve.set_defaults(func=cmd_serve)
+
     p_work = sub.add_parser("work", help="One-command helpers to start a task checkout")
     work_sub = p_work.add_subparsers(dest="work_cmd", required=True)
 
@@ -5746,6 +7414,11 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_lint = task_sub.add_parser("lint", help="Validate tasks.json (schema, deps, checksum)")
     p_lint.add_argument("--quiet", action="store_true", help="Suppress warnings")
+    p_lint.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only lint tasks whose content changed since the last clean lint (full lint when no state exists)",
+    )
     p_lint.set_defaults(func=cmd_task_lint)
 
     p_new = task_sub.add_parser("new", help="Create a task with an auto-generated ID")
@@ -5824,6 +7497,31 @@ def build_parser() -> argparse.ArgumentParser:
     p_next.add_argument("--quiet", action="store_true", help="Suppress warnings")
     p_next.set_defaults(func=cmd_task_next)
 
+    p_schedule = task_sub.add_parser(
+        "schedule", help="Assign ready TODO tasks to parallel agents by priority, critical path and age"
+    )
+    p_schedule.add_argument("--workers", type=int, default=1, help="Number of parallel agent slots (default: 1)")
+    p_schedule.add_argument("--owner", action="append", help="Filter by owner (repeatable)")
+    p_schedule.add_argument("--tag", action="append", help="Filter by tag (repeatable)")
+    p_schedule.add_argument("--quiet", action="store_true", help="Suppress warnings and deferred tasks")
+    p_schedule.set_defaults(func=cmd_task_schedule)
+
+    p_plan = task_sub.add_parser(
+        "plan", help="Simulate open tasks on N parallel workers: makespan, lanes and bottleneck chain"
+    )
+    p_plan.add_argument("--workers", type=int, default=1, help="Number of parallel workers (default: 1)")
+    p_plan.add_argument("--quiet", action="store_true", help="Suppress warnings and sizing details")
+    p_plan.set_defaults(func=cmd_task_plan)
+
+    p_stats = task_sub.add_parser(
+        "stats", help="Lead/cycle/blocked time, throughput per owner and WIP by day from task ids and git history"
+    )
+    p_stats.add_argument("--days", type=int, default=14, help="Window for throughput and WIP (default: 14)")
+    p_stats.add_argument("--owner", action="append", help="Filter by owner (repeatable)")
+    p_stats.add_argument("--tag", action="append", help="Filter by tag (repeatable)")
+    p_stats.add_argument("--quiet", action="store_true", help="Suppress warnings and the coverage line")
+    p_stats.set_defaults(func=cmd_task_stats)
+
     p_show = task_sub.add_parser("show", help="Show a single task from tasks.json")
     p_show.add_argument("task_id")
     p_show.add_argument("--last-comments", type=int, default=5, help="How many latest comments to print")
@@ -5882,6 +7580,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_migrate.add_argument("--source", default=TASKS_PATH_REL, help="Source tasks.json path (repo-relative)")
     p_migrate.add_argument("--quiet", action="store_true", help="Minimal output")
     p_migrate.add_argument("--force", action="store_true", help="Bypass base-branch checks")
+    p_migrate.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint of an interrupted run and migrate every task"
+    )
     p_migrate.set_defaults(func=cmd_task_migrate)
 
     p_comment = task_sub.add_parser("comment", help="Append a comment to a task")
@@ -6015,8 +7716,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_finish.set_defaults(require_task_id_in_commit=True, func=cmd_finish)
 
     p_sync = sub.add_parser("sync", help="Sync tasks with a backend")
-    p_sync.add_argument("backend", nargs="?", help="Backend id (e.g., redmine)")
-    p_sync.add_argument("--direction", default="push", choices=["push", "pull"], help="Sync direction")
+    p_sync.add_argument("backend", nargs="?", help="Backend id (e.g., redmine), or `flush` for --direction flush")
+    p_sync.add_argument(
+        "--direction",
+        choices=["push", "pull", "flush"],
+        help="Sync direction (default: push); flush drains the backend's queued writes",
+    )
     p_sync.add_argument(
         "--conflict",
         default="diff",
@@ -6030,10 +7735,19 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def extract_global_flags(argv: list[str]) -> tuple[dict[str, bool], list[str]]:
-    flags = {"quiet": False, "verbose": False, "json": False, "lint": False}
+def extract_global_flags(argv: list[str]) -> tuple[dict[str, bool | str], list[str]]:
+    flags: dict[str, bool | str] = {
+        "quiet": False,
+        "verbose": False,
+        "json": False,
+        "lint": False,
+        "timings": False,
+        "timings_path": "",
+        "cprofile": "",
+    }
     remaining: list[str] = []
-    for arg in argv:
+    args = iter(argv)
+    for arg in args:
         if arg == "--quiet":
             flags["quiet"] = True
             continue
@@ -6046,13 +7760,23 @@ def extract_global_flags(argv: list[str]) -> tuple[dict[str, bool], list[str]]:
         if arg == "--lint":
             flags["lint"] = True
             continue
+        if arg == "--timings" or arg.startswith("--timings="):
+            flags["timings"] = True
+            flags["timings_path"] = arg.partition("=")[2]
+            continue
+        if arg == "--cprofile" or arg.startswith("--cprofile="):
+            path = arg.partition("=")[2] or next(args, "")
+            if not path:
+                die("--cprofile requires an output path (e.g. --cprofile agentctl.pstats)", code=2)
+            flags["cprofile"] = path
+            continue
         remaining.append(arg)
     if flags["verbose"]:
         flags["quiet"] = False
     return flags, remaining
 
 
-def apply_global_flags(args: argparse.Namespace, flags: dict[str, bool]) -> None:
+def apply_global_flags(args: argparse.Namespace, flags: dict[str, bool | str]) -> None:
     global GLOBAL_QUIET, GLOBAL_VERBOSE, GLOBAL_JSON, GLOBAL_LINT
     GLOBAL_QUIET = bool(flags.get("quiet"))
     GLOBAL_VERBOSE = bool(flags.get("verbose"))
@@ -6080,11 +7804,9 @@ def maybe_lint_tasks_json() -> None:
         raise SystemExit(2)
 
 
-def main(argv: list[str] | None = None) -> None:
+def run_cli(flags: dict[str, bool | str], filtered: list[str]) -> None:
     maybe_pin_base_branch(cwd=ROOT)
-    raw_argv = list(argv) if argv is not None else sys.argv[1:]
-    flags, filtered = extract_global_flags(raw_argv)
-    parser = build_parser()
+    parser = _SERVER_PARSER if _SERVING and _SERVER_PARSER is not None else build_parser()
     args = parser.parse_args(filtered)
     apply_global_flags(args, flags)
     maybe_lint_tasks_json()
@@ -6094,7 +7816,8 @@ def main(argv: list[str] | None = None) -> None:
         raise SystemExit(2)
     suppressed = GLOBAL_JSON or GLOBAL_QUIET or bool(getattr(args, "quiet", False))
     try:
-        func(args)
+        with timing_span("command", command_path(args)):
+            func(args)
     except SystemExit as exc:
         code = 0 if exc.code is None else exc.code
         if code == 0 and not suppressed:
@@ -6104,5 +7827,37 @@ def main(argv: list[str] | None = None) -> None:
         print(f"✅ {command_path(args)} OK")
 
 
+def main(argv: list[str] | None = None) -> None:
+    global _TIMING_SPANS
+    raw_argv = list(argv) if argv is not None else sys.argv[1:]
+    flags, filtered = extract_global_flags(raw_argv)
+    spans: list[TimingSpan] | None = None
+    if flags["timings"]:
+        spans = _TIMING_SPANS = []
+        spans.append(
+            {
+                "category": "startup",
+                "name": "import + config",
+                "start": _IMPORT_STARTED,
+                "duration": time.perf_counter() - _IMPORT_STARTED,
+                "args": {},
+            }
+        )
+    profiler = cProfile.Profile() if flags["cprofile"] else None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        run_cli(flags, filtered)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(str(flags["cprofile"]))
+            print(f"TIMING: wrote cProfile stats to {flags['cprofile']}", file=sys.stderr)
+        if spans is not None:
+            _TIMING_SPANS = None
+            trace_path = str(flags["timings_path"])
+            report_timings(spans, trace_path=Path(trace_path) if trace_path else None)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Thin client for `agentctl serve`.
+
+Forwards a command to the running server over its Unix socket and relays the output and exit code, so
+the command skips interpreter-heavy start-up (compiling agentctl.py, loading config and the backend).
+Without a server it execs agentctl.py with the same arguments. Beyond what the interpreter loads at
+start-up it only imports json and socket.
+
+    python .codex-swarm/agentctl_client.py task list
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+
+SWARM_DIR = os.path.dirname(os.path.abspath(__file__))  # noqa: PTH100, PTH120
+AGENTCTL = os.path.join(SWARM_DIR, "agentctl.py")  # noqa: PTH118
+# Newline-delimited JSON-RPC 2.0 over a Unix socket, one request per connection.
+SERVER_SOCKET_ENV = "CODEXSWARM_SERVER_SOCKET"
+SERVER_DISABLE_ENV = "CODEXSWARM_NO_SERVER"
+SERVER_SOCKET_PATH = os.environ.get(SERVER_SOCKET_ENV, "").strip() or os.path.join(  # noqa: PTH118
+    SWARM_DIR, ".cache", "agentctl.sock"
+)
+# The server refused the request without running it (its code or config changed); run it locally instead.
+SERVER_STALE_ERROR = -32001
+SERVER_TIMEOUT_ENV = "CODEXSWARM_SERVER_TIMEOUT"
+# Connecting to a live server is immediate; anything slower means it is wedged, so run the command locally.
+SERVER_CONNECT_TIMEOUT_SECONDS = 1.0
+# Upper bound on one served command, including the server's own lock waits.
+DEFAULT_SERVER_TIMEOUT_SECONDS = 300.0
+
+
+def server_timeout() -> float:
+    raw = os.environ.get(SERVER_TIMEOUT_ENV, "").strip()
+    try:
+        return max(0.1, float(raw)) if raw else DEFAULT_SERVER_TIMEOUT_SECONDS
+    except ValueError:
+        return DEFAULT_SERVER_TIMEOUT_SECONDS
+
+
+def rpc_call(method: str, params: dict[str, object] | None = None) -> dict[str, object] | None:
+    """Send one request and return the decoded response; None when no server accepts the connection.
+
+    Only a failed or timed-out connect returns None: once the request is sent the command may have run, so
+    transport errors after that point (including a response slower than CODEXSWARM_SERVER_TIMEOUT) raise
+    OSError or ValueError instead of inviting a local retry.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(SERVER_CONNECT_TIMEOUT_SECONDS)
+    try:
+        client.connect(SERVER_SOCKET_PATH)
+    except OSError:
+        client.close()
+        return None
+    client.settimeout(server_timeout())
+    request: dict[str, object] = {"jsonrpc": "2.0", "id": 1, "method": method}
+    if params is not None:
+        request["params"] = params
+    with client:
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        chunks: list[bytes] = []
+        while chunk := client.recv(65536):
+            chunks.append(chunk)
+    response = json.loads(b"".join(chunks))
+    if isinstance(response, dict):
+        return response
+    raise ValueError("malformed response")
+
+
+def forward_to_server(argv: list[str]) -> int | None:
+    """Run a command on a running `agentctl serve` and relay its output; None means run it in this process."""
+    if os.environ.get(SERVER_DISABLE_ENV, "").strip() == "1":
+        return None
+    command = next((arg for arg in argv if not arg.startswith("-")), "")
+    # serve manages the server itself, profiles belong to this process and `-` reads this process's stdin.
+    if command == "serve" or "-" in argv or any(arg.startswith("--cprofile") for arg in argv):
+        return None
+    params: dict[str, object] = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}  # noqa: PTH109
+    try:
+        response = rpc_call("run", params)
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"agentctl serve: request failed: {exc}\n")
+        return 2
+    if response is None:
+        return None
+    error = response.get("error")
+    if isinstance(error, dict):
+        if error.get("code") == SERVER_STALE_ERROR:
+            return None
+        sys.stderr.write(f"agentctl serve: {error.get('message')}\n")
+        return 2
+    result = response.get("result")
+    if not isinstance(result, dict):
+        sys.stderr.write("agentctl serve: malformed response\n")
+        return 2
+    sys.stdout.write(str(result.get("stdout") or ""))
+    sys.stderr.write(str(result.get("stderr") or ""))
+    exit_code = result.get("exit_code")
+    return exit_code if isinstance(exit_code, int) else 1
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    exit_code = forward_to_server(argv)
+    if exit_code is not None:
+        raise SystemExit(exit_code)
+    # Keep agentctl from trying the server a second time (a stale one may still be shutting down).
+    os.environ[SERVER_DISABLE_ENV] = "1"
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable, AGENTCTL, *argv])  # noqa: S606
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Event log backend package marker."""
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import secrets
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+    from types import ModuleType
+
+JsonDict = dict[str, object]
+TaskRecord = dict[str, object]
+TaskList = list[TaskRecord]
+
+DEFAULT_EVENTLOG_DIR = Path(".codex-swarm/eventlog")
+EVENTS_FILENAME = "events.jsonl"
+SNAPSHOT_FILENAME = "snapshot.json"
+SNAPSHOT_SCHEMA_VERSION = 1
+DEFAULT_SNAPSHOT_EVERY = 500
+# Fields with dedicated event types; everything else is recorded as a generic field-set.
+STATUS_FIELD = "status"
+COMMENTS_FIELD = "comments"
+
+
+def now_iso_utc() -> str:
+    return datetime.now(UTC).replace(microsecond=0).isoformat()
+
+
+def _load_local_backend_module() -> ModuleType:
+    local_path = Path(__file__).resolve().parents[1] / "local" / "backend.py"
+    spec = importlib.util.spec_from_file_location("local_backend", local_path)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load local backend from {local_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _coerce_int(value: object, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return default
+
+
+def apply_event(tasks: dict[str, TaskRecord], event: JsonDict) -> None:
+    """Fold one event into the materialised view (mutates tasks in place)."""
+    op = event.get("op")
+    task_id = str(event.get("id") or "")
+    if not task_id:
+        return
+    if op == "create":
+        task = event.get("task")
+        if isinstance(task, dict):
+            tasks[task_id] = dict(cast(TaskRecord, task))
+        return
+    current = tasks.get(task_id)
+    if current is None:
+        return
+    if op == "set":
+        fields = event.get("fields")
+        if isinstance(fields, dict):
+            current.update(cast(TaskRecord, fields))
+        unset = event.get("unset")
+        if isinstance(unset, list):
+            for key in unset:
+                current.pop(str(key), None)
+    elif op == "status":
+        current[STATUS_FIELD] = event.get("status")
+    elif op == "comment":
+        comments = current.get(COMMENTS_FIELD)
+        comments_list = list(comments) if isinstance(comments, list) else []
+        comments_list.append(event.get("comment"))
+        current[COMMENTS_FIELD] = comments_list
+
+
+def diff_task_events(existing: TaskRecord | None, task: TaskRecord) -> list[JsonDict]:
+    """Translate a full task write into the smallest list of events that reproduces it."""
+    task_id = str(task.get("id") or "")
+    if existing is None:
+        return [{"op": "create", "id": task_id, "task": task}]
+    events: list[JsonDict] = []
+    fields: JsonDict = {}
+    for key, value in task.items():
+        if existing.get(key) == value and key in existing:
+            continue
+        if key == STATUS_FIELD:
+            events.append({"op": "status", "id": task_id, "status": value})
+            continue
+        if key == COMMENTS_FIELD and isinstance(value, list):
+            old = existing.get(COMMENTS_FIELD)
+            old_list = old if isinstance(old, list) else []
+            if len(value) > len(old_list) and value[: len(old_list)] == old_list:
+                events.extend({"op": "comment", "id": task_id, "comment": item} for item in value[len(old_list) :])
+                continue
+        fields[key] = value
+    unset = sorted(key for key in existing if key not in task)
+    if fields or unset:
+        event: JsonDict = {"op": "set", "id": task_id, "fields": fields}
+        if unset:
+            event["unset"] = unset
+        events.append(event)
+    return events
+
+
+class EventLogBackend:
+    """Tasks stored as an append-only JSONL event log with periodic snapshots.
+
+    Reads rebuild the view from the latest snapshot plus the log tail; writes append
+    only the events that differ from the current view.
+    """
+
+    def __init__(self, settings: dict[str, object] | None = None) -> None:
+        settings = settings if isinstance(settings, dict) else {}
+        raw_dir = settings.get("dir")
+        self.root = Path(str(raw_dir)).resolve() if raw_dir else DEFAULT_EVENTLOG_DIR.resolve()
+        self.events_path = self.root / EVENTS_FILENAME
+        self.snapshot_path = self.root / SNAPSHOT_FILENAME
+        self.snapshot_every = max(1, _coerce_int(settings.get("snapshot_every"), DEFAULT_SNAPSHOT_EVERY))
+
+        local_module = _load_local_backend_module()
+        self._file_lock = cast("Callable[..., AbstractContextManager[None]]", local_module.file_lock)
+        self._task_digest = local_module.task_digest
+        self._validate_task_id = local_module.validate_task_id
+        self._task_conflict_error = cast(type[RuntimeError], local_module.TaskConflictError)
+        self._id_alphabet = str(getattr(local_module, "ID_ALPHABET", "0123456789ABCDEFGHJKMNPQRSTVWXYZ"))
+        self._doc_version = _coerce_int(getattr(local_module, "DOC_VERSION", 2), 2)
+        self._doc_updated_by = str(getattr(local_module, "DOC_UPDATED_BY", "agentctl"))
+        default_timeout = float(getattr(local_module, "DEFAULT_LOCK_TIMEOUT_SECONDS", 10.0))
+        raw_timeout = os.environ.get("CODEXSWARM_LOCK_TIMEOUT", "").strip() or str(settings.get("lock_timeout") or "")
+        try:
+            self.lock_timeout = float(raw_timeout) if raw_timeout.strip() else default_timeout
+        except ValueError:
+            self.lock_timeout = default_timeout
+
+        self._tasks: dict[str, TaskRecord] = {}
+        self._offset = 0
+        self._events_since_snapshot = 0
+        self._loaded = False
+
+    # Materialised view -------------------------------------------------
+
+    def _lock(self) -> AbstractContextManager[None]:
+        return self._file_lock(self.root / ".locks" / "events.lock", timeout=self.lock_timeout)
+
+    def _load_snapshot(self) -> None:
+        self._tasks = {}
+        self._offset = 0
+        self._events_since_snapshot = 0
+        if not self.snapshot_path.exists():
+            return
+        data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise TypeError(f"Invalid snapshot: {self.snapshot_path}")
+        tasks = data.get("tasks")
+        if isinstance(tasks, dict):
+            self._tasks = {str(k): dict(cast(TaskRecord, v)) for k, v in tasks.items() if isinstance(v, dict)}
+        self._offset = _coerce_int(data.get("offset"), 0)
+
+    def _refresh(self) -> None:
+        """Apply events appended since the last read (by this or any other process)."""
+        if not self._loaded:
+            self._load_snapshot()
+            self._loaded = True
+        if not self.events_path.exists():
+            return
+        size = self.events_path.stat().st_size
+        if size < self._offset:
+            # The log was replaced underneath us; start over from the snapshot.
+            self._load_snapshot()
+        if size == self._offset:
+            return
+        with self.events_path.open("rb") as fh:
+            fh.seek(self._offset)
+            chunk = fh.read(size - self._offset)
+        # A concurrent writer may be mid-line; only consume complete lines.
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if isinstance(event, dict):
+                apply_event(self._tasks, cast(JsonDict, event))
+                self._events_since_snapshot += 1
+        self._offset += end
+
+    def _append(self, events: list[JsonDict]) -> None:
+        if not events:
+            return
+        stamp = now_iso_utc()
+        payload = "".join(
+            json.dumps({"ts": stamp, **event}, ensure_ascii=False, separators=(",", ":")) + "\n" for event in events
+        ).encode("utf-8")
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.events_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        self._refresh()
+        if self._events_since_snapshot >= self.snapshot_every:
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        payload = {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "offset": self._offset,
+            "created_at": now_iso_utc(),
+            "tasks": self._tasks,
+        }
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.snapshot_path)
+        self._events_since_snapshot = 0
+
+    def _prepare_task(self, task: TaskRecord) -> tuple[str, TaskRecord]:
+        task_id = str(task.get("id") or "").strip()
+        if not task_id:
+            raise ValueError("Task id is required")
+        self._validate_task_id(task_id)
+        payload = dict(task)
+        existing = self._tasks.get(task_id) or {}
+        if "doc" not in payload and "doc" in existing:
+            payload["doc"] = existing["doc"]
+        for key in ("doc_version", "doc_updated_at", "doc_updated_by"):
+            if key not in payload and key in existing:
+                payload[key] = existing[key]
+        doc = payload.get("doc")
+        if existing and doc is not None and str(doc).strip() != str(existing.get("doc") or "").strip():
+            self._apply_doc_metadata(payload)
+        if not str(payload.get("doc") or "").strip():
+            payload.pop("doc", None)
+        if payload.get("doc_version") != self._doc_version or not payload.get("doc_updated_at"):
+            self._apply_doc_metadata(payload)
+        return task_id, payload
+
+    def _apply_doc_metadata(self, task: TaskRecord, *, updated_by: str | None = None) -> None:
+        task["doc_version"] = self._doc_version
+        task["doc_updated_at"] = now_iso_utc()
+        task["doc_updated_by"] = updated_by or self._doc_updated_by
+
+    # Backend protocol --------------------------------------------------
+
+    def generate_task_id(self, *, length: int = 6, attempts: int = 1000) -> str:
+        if length < 4:
+            raise ValueError("length must be >= 4")
+        self._refresh()
+        for _ in range(attempts):
+            timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M")
+            suffix = "".join(secrets.choice(self._id_alphabet) for _ in range(length))
+            task_id = f"{timestamp}-{suffix}"
+            if task_id not in self._tasks:
+                return task_id
+        raise RuntimeError("Failed to generate a unique task id")
+
+    def list_tasks(self) -> TaskList:
+        self._refresh()
+        # Deep copies: callers mutate nested lists (comments) before writing back, and the diff needs the original.
+        return [copy.deepcopy(self._tasks[task_id]) for task_id in sorted(self._tasks)]
+
+    def change_stamp(self) -> str:
+        """mtime and size of the event log and its snapshot; every write appends an event."""
+        parts: list[str] = []
+        for path in (self.events_path, self.snapshot_path):
+            try:
+                stat = path.stat()
+            except OSError:
+                parts.append("-")
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "|".join(parts)
+
+    def get_task(self, task_id: str) -> TaskRecord | None:
+        self._refresh()
+        task = self._tasks.get(task_id)
+        return copy.deepcopy(task) if task is not None else None
+
+    def get_task_doc(self, task_id: str) -> str:
+        task = self.get_task(task_id)
+        if task is None:
+            raise FileNotFoundError(f"Unknown task id: {task_id}")
+        return str(task.get("doc") or "")
+
+    def write_task(self, task: TaskRecord) -> None:
+        self.write_tasks([task])
+
+    def write_tasks(self, tasks: TaskList) -> None:
+        with self._lock():
+            self._refresh()
+            events: list[JsonDict] = []
+            for task in tasks:
+                task_id, payload = self._prepare_task(task)
+                events.extend(diff_task_events(self._tasks.get(task_id), payload))
+            self._append(events)
+
+    def compare_and_write_task(self, task: TaskRecord, *, expected_digest: str | None) -> str:
+        with self._lock():
+            self._refresh()
+            task_id, payload = self._prepare_task(task)
+            current = self._tasks.get(task_id)
+            if expected_digest is not None and (current is None or self._task_digest(current) != expected_digest):
+                raise self._task_conflict_error(f"{task_id} was modified by another writer")
+            self._append(diff_task_events(current, payload))
+            return str(self._task_digest(self._tasks.get(task_id) or {}))
+
+    def set_task_doc(self, task_id: str, doc: str) -> None:
+        with self._lock():
+            self._refresh()
+            if task_id not in self._tasks:
+                raise FileNotFoundError(f"Unknown task id: {task_id}")
+            fields: TaskRecord = {"doc": str(doc or "")}
+            self._apply_doc_metadata(fields)
+            self._append([{"op": "set", "id": task_id, "fields": fields}])
+
+    def touch_task_doc_metadata(self, task_id: str, *, updated_by: str | None = None) -> None:
+        with self._lock():
+            self._refresh()
+            if task_id not in self._tasks:
+                raise FileNotFoundError(f"Unknown task id: {task_id}")
+            fields: TaskRecord = {}
+            self._apply_doc_metadata(fields, updated_by=updated_by)
+            self._append([{"op": "set", "id": task_id, "fields": fields}])
+
+    def export_tasks_json(self, output_path: Path) -> None:
+        tasks = self.list_tasks()
+        payload: JsonDict = {"tasks": tasks}
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        payload["meta"] = {
+            "schema_version": 1,
+            "managed_by": "agentctl",
+            "checksum_algo": "sha256",
+            "checksum": hashlib.sha256(canonical).hexdigest(),
+        }
+        output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def normalize_tasks(self) -> int:
+        """Compact: write a fresh snapshot so cold reads skip the whole log."""
+        with self._lock():
+            self._refresh()
+            self._write_snapshot()
+            return len(self._tasks)
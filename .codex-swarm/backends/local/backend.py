@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
+import os
 import re
 import secrets
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
+
+if sys.platform != "win32":
+    import fcntl
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 FRONTMATTER_BOUNDARY = "---"
 DEFAULT_TASKS_DIR = Path(".codex-swarm/tasks")
@@ -20,6 +30,105 @@ DOC_SECTION_HEADER = "## Summary"
 AUTO_SUMMARY_HEADER = "## Changes Summary (auto)"
 DOC_VERSION = 2
 DOC_UPDATED_BY = "agentctl"
+DEFAULT_LOCK_TIMEOUT_SECONDS = 10.0
+# Below this many task directories a pool costs more than it saves.
+DEFAULT_PARALLEL_SCAN_THRESHOLD = 1024
+DEFAULT_SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# READMEs modified this recently are re-read on every scan instead of served from the parse cache: a rewrite
+# within the filesystem's timestamp granularity can leave inode, mtime and size all unchanged.
+SCAN_CACHE_RACY_NS = 2_000_000_000
+# Quotes are matched literally (no backslash escapes), mirroring how format_frontmatter output has always been read.
+_INLINE_STRUCTURE_RE = re.compile(r""""[^"]*"?|'[^']*'?|[\[\]{}(),]""")
+_INLINE_SPECIAL_CHARS = frozenset("\"'[]{}()")
+# str.splitlines() also breaks on these; texts containing them are normalized before offset scanning.
+_EXTRA_LINE_BREAKS_RE = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+class TaskConflictError(RuntimeError):
+    pass
+
+
+def task_digest(task: dict[str, object]) -> str:
+    # Must stay in sync with agentctl.task_digest(); load_task_store() passes these as CAS baselines.
+    return json.dumps(task, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _describe_lock_holder(lock_path: Path) -> str:
+    try:
+        holder = json.loads(lock_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return "unknown holder"
+    if not isinstance(holder, dict):
+        return "unknown holder"
+    return (
+        f"pid={holder.get('pid')} host={holder.get('host')} "
+        f"since={holder.get('acquired_at')} cmd={holder.get('command')!r}"
+    )
+
+
+# Per-thread re-entrancy counts for held locks: a second flock on a new fd would deadlock the same thread, while
+# other threads must still block on the flock like any other writer.
+_HELD_LOCKS = threading.local()
+
+
+def _held_locks() -> dict[Path, int]:
+    held = cast(dict[Path, int] | None, getattr(_HELD_LOCKS, "counts", None))
+    if held is None:
+        held = {}
+        _HELD_LOCKS.counts = held
+    return held
+
+
+class LockTimeoutError(TimeoutError):
+    def __init__(self, lock_path: Path, timeout: float, holder: str) -> None:
+        super().__init__(f"Timed out after {timeout:g}s waiting for lock {lock_path} (held by {holder})")
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self.holder = holder
+
+
+@contextlib.contextmanager
+def file_lock(lock_path: Path, *, timeout: float) -> Iterator[None]:
+    """Hold an advisory exclusive flock on lock_path, waiting at most timeout seconds (re-entrant per thread)."""
+    held = _held_locks()
+    if sys.platform == "win32" or held.get(lock_path):
+        held[lock_path] = held.get(lock_path, 0) + 1
+        try:
+            yield
+        finally:
+            held[lock_path] -= 1
+        return
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeoutError(lock_path, timeout, _describe_lock_holder(lock_path)) from None
+                time.sleep(delay)
+                delay = min(delay * 2, 0.2)
+        holder = {
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "command": " ".join(sys.argv[1:]),
+            "acquired_at": datetime.now(UTC).replace(microsecond=0).isoformat(),
+        }
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, json.dumps(holder).encode("utf-8"), 0)
+        held[lock_path] = 1
+        try:
+            yield
+        finally:
+            held[lock_path] = 0
+            os.ftruncate(fd, 0)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
 
 
 @dataclass
@@ -28,36 +137,22 @@ class FrontmatterDoc:
     body: str
 
 
-def _split_top_level(value: str, sep: str = ",") -> list[str]:
+def _split_top_level(value: str) -> list[str]:
+    if _INLINE_SPECIAL_CHARS.isdisjoint(value):
+        return [stripped for part in value.split(",") if (stripped := part.strip())]
     parts: list[str] = []
-    buf: list[str] = []
     depth = 0
-    quote: str | None = None
-    for ch in value:
-        if quote:
-            buf.append(ch)
-            if ch == quote:
-                quote = None
-            continue
-        if ch in ('"', "'"):
-            buf.append(ch)
-            quote = ch
-            continue
-        if ch in "[{(":
+    start = 0
+    for match in _INLINE_STRUCTURE_RE.finditer(value):
+        token = match.group()
+        if token in "[{(":  # noqa: S105
             depth += 1
-            buf.append(ch)
-            continue
-        if ch in "]})":
+        elif token in "]})":  # noqa: S105
             depth = max(0, depth - 1)
-            buf.append(ch)
-            continue
-        if ch == sep and depth == 0:
-            parts.append("".join(buf).strip())
-            buf = []
-            continue
-        buf.append(ch)
-    if buf:
-        parts.append("".join(buf).strip())
+        elif token == "," and depth == 0:  # noqa: S105
+            parts.append(value[start : match.start()].strip())
+            start = match.end()
+    parts.append(value[start:].strip())
     return [p for p in parts if p]
 
 
@@ -71,6 +166,15 @@ def _parse_scalar(value: str) -> object:
     raw = value.strip()
     if not raw:
         return ""
+    first = raw[0]
+    if first in ('"', "'") and raw[-1] == first and len(raw) >= 2:
+        # Without escapes json.loads() either returns the inner text or fails and falls back to it.
+        if first == "'" or "\\" not in raw:
+            return raw[1:-1]
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw[1:-1]
     lowered = raw.lower()
     if lowered == "true":
         return True
@@ -78,13 +182,6 @@ def _parse_scalar(value: str) -> object:
         return False
     if lowered in {"null", "none"}:
         return None
-    if raw[0] in ('"', "'") and raw[-1] == raw[0]:
-        if raw[0] == '"':
-            try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
-                return _strip_quotes(raw)
-        return _strip_quotes(raw)
     if raw.isdigit():
         return int(raw)
     return raw
@@ -122,33 +219,71 @@ def _parse_value(value: str) -> object:
     return _parse_scalar(raw)
 
 
+def _normalize_line_breaks(text: str) -> str:
+    # Same line structure as "\n".join(text.splitlines()) while keeping a trailing newline if there was one.
+    if _EXTRA_LINE_BREAKS_RE.search(text) is None:
+        return text
+    return "\n".join(text.splitlines()) + "\n"
+
+
+def _frontmatter_span(text: str) -> tuple[int, int, int] | None:
+    """Return (start, end, body_start) offsets of the frontmatter block, or None when there is none."""
+    first_end = text.find("\n")
+    if first_end == -1 or text[:first_end].strip() != FRONTMATTER_BOUNDARY:
+        return None
+    pos = first_end + 1
+    size = len(text)
+    while pos < size:
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = size
+        if text[pos:line_end].strip() == FRONTMATTER_BOUNDARY:
+            return first_end + 1, pos, line_end + 1
+        pos = line_end + 1
+    return None
+
+
 def parse_frontmatter(text: str) -> FrontmatterDoc:
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != FRONTMATTER_BOUNDARY:
+    scanned = _normalize_line_breaks(text)
+    span = _frontmatter_span(scanned)
+    if span is None:
         return FrontmatterDoc(frontmatter={}, body=text)
-    end_idx = None
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == FRONTMATTER_BOUNDARY:
-            end_idx = idx
+    start, end, body_start = span
+    frontmatter = _parse_frontmatter_lines(scanned[start:end].split("\n"))
+    body = scanned[body_start:]
+    if body.endswith("\n"):
+        body = body[:-1]
+    return FrontmatterDoc(frontmatter=frontmatter, body=body.lstrip("\n"))
+
+
+def _read_frontmatter_lines(handle: Iterable[str]) -> list[str]:
+    lines: list[str] = []
+    for index, line in enumerate(handle):
+        if line.strip() == FRONTMATTER_BOUNDARY:
+            if index:
+                return lines
+            continue
+        if not index:
             break
-    if end_idx is None:
-        return FrontmatterDoc(frontmatter={}, body=text)
-    frontmatter_lines = lines[1:end_idx]
-    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
-    frontmatter = _parse_frontmatter_lines(frontmatter_lines)
-    return FrontmatterDoc(frontmatter=frontmatter, body=body)
+        lines.append(line.rstrip("\n"))
+    return []
+
+
+def read_frontmatter(path: Path | str) -> dict[str, object]:
+    """Parse only the frontmatter of path, reading no further than its closing boundary."""
+    with open(path, encoding="utf-8") as handle:  # noqa: PTH123
+        return _parse_frontmatter_lines(_read_frontmatter_lines(handle))
 
 
 def _parse_frontmatter_lines(lines: Iterable[str]) -> dict[str, object]:
     data: dict[str, object] = {}
     current_list_key: str | None = None
     for raw_line in lines:
-        if not raw_line.strip():
+        stripped = raw_line.strip()
+        if not stripped or stripped[0] == "#":
             continue
-        if raw_line.lstrip().startswith("#"):
-            continue
-        if raw_line.startswith("  - ") and current_list_key:
-            item_text = raw_line.strip()[2:].strip()
+        if current_list_key and raw_line.startswith("  - "):
+            item_text = stripped[2:].strip()
             item: object
             if item_text.startswith("{") and item_text.endswith("}"):
                 item = _parse_inline_dict(item_text)
@@ -259,23 +394,64 @@ def validate_task_id(task_id: str, *, source: Path | None = None) -> None:
         raise ValueError(f"Invalid task id{hint}: {task_id}")
 
 
+def _find_header_line(text: str, header: str, start: int = 0) -> int:
+    """Return the offset of the first line at or after start whose stripped text equals header, or -1."""
+    pos = text.find(header, start)
+    while pos != -1:
+        line_start = text.rfind("\n", 0, pos) + 1
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = len(text)
+        if text[line_start:line_end].strip() == header:
+            return line_start
+        pos = text.find(header, pos + 1)
+    return -1
+
+
+def _doc_span(body: str) -> tuple[int, int] | None:
+    start = _find_header_line(body, DOC_SECTION_HEADER)
+    if start == -1:
+        return None
+    header_end = body.find("\n", start)
+    if header_end == -1:
+        return start, len(body)
+    end = _find_header_line(body, AUTO_SUMMARY_HEADER, header_end + 1)
+    return start, len(body) if end == -1 else end
+
+
 def extract_task_doc(body: str) -> str:
     if not body:
         return ""
-    lines = body.splitlines()
-    start_idx = None
-    for idx, line in enumerate(lines):
-        if line.strip() == DOC_SECTION_HEADER:
-            start_idx = idx
-            break
-    if start_idx is None:
+    body = _normalize_line_breaks(body)
+    span = _doc_span(body)
+    if span is None:
         return ""
-    end_idx = len(lines)
-    for idx in range(start_idx + 1, len(lines)):
-        if lines[idx].strip() == AUTO_SUMMARY_HEADER:
-            end_idx = idx
-            break
-    return "\n".join(lines[start_idx:end_idx]).rstrip()
+    return body[span[0] : span[1]].rstrip()
+
+
+def _read_task_readme(readme: str, *, include_doc: bool) -> str | list[str] | None:
+    """Read a README's full text, or just its frontmatter lines; None when it is missing. Does no parsing."""
+    try:
+        with open(readme, encoding="utf-8") as handle:  # noqa: PTH123
+            return handle.read() if include_doc else _read_frontmatter_lines(handle)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _parse_task_readme(raw: str | list[str]) -> tuple[dict[str, object], str]:
+    if isinstance(raw, list):
+        return _parse_frontmatter_lines(raw), ""
+    parsed = parse_frontmatter(raw)
+    return parsed.frontmatter, extract_task_doc(parsed.body) if parsed.frontmatter else ""
+
+
+def _copy_task_value(value: object) -> object:
+    # Frontmatter only holds dicts, lists and scalars; this is several times cheaper than copy.deepcopy.
+    if isinstance(value, dict):
+        return {key: _copy_task_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_task_value(item) for item in value]
+    return value
 
 
 def merge_task_doc(body: str, doc: str) -> str:
@@ -317,6 +493,26 @@ class LocalBackend:
             self.root = Path(str(raw_dir)).resolve()
         else:
             self.root = DEFAULT_TASKS_DIR.resolve()
+        raw_lock_dir = (settings or {}).get("lock_dir") if isinstance(settings, dict) else None
+        self.lock_dir = Path(str(raw_lock_dir)).resolve() if raw_lock_dir else self.root.parent / ".locks"
+        raw_timeout = os.environ.get("CODEXSWARM_LOCK_TIMEOUT", "").strip()
+        if not raw_timeout and isinstance(settings, dict):
+            raw_timeout = str(settings.get("lock_timeout") or "").strip()
+        try:
+            self.lock_timeout = float(raw_timeout) if raw_timeout else DEFAULT_LOCK_TIMEOUT_SECONDS
+        except ValueError:
+            self.lock_timeout = DEFAULT_LOCK_TIMEOUT_SECONDS
+        raw_workers = (settings or {}).get("scan_workers") if isinstance(settings, dict) else None
+        raw_threshold = (settings or {}).get("parallel_scan_threshold") if isinstance(settings, dict) else None
+        self.scan_workers = max(1, int(str(raw_workers))) if raw_workers else DEFAULT_SCAN_WORKERS
+        self.parallel_scan_threshold = (
+            int(str(raw_threshold)) if raw_threshold is not None else DEFAULT_PARALLEL_SCAN_THRESHOLD
+        )
+        # Per-phase figures of the most recent directory scan (agentctl prints them under --verbose).
+        self.last_scan_stats: dict[str, float] = {}
+        # README path -> ((inode, mtime_ns, size), parsed with doc, frontmatter, doc). Lets a long-lived
+        # process (`agentctl serve`) re-parse only the READMEs that changed since its previous scan.
+        self._scan_cache: dict[str, tuple[tuple[int, int, int], bool, dict[str, object], str]] = {}
 
     def task_dir(self, task_id: str) -> Path:
         return self.root / task_id
@@ -324,6 +520,9 @@ class LocalBackend:
     def task_readme_path(self, task_id: str) -> Path:
         return self.task_dir(task_id) / "README.md"
 
+    def task_lock(self, task_id: str) -> contextlib.AbstractContextManager[None]:
+        return file_lock(self.lock_dir / f"task-{task_id}.lock", timeout=self.lock_timeout)
+
     def generate_task_id(self, *, length: int = 6, attempts: int = 1000) -> str:
         if length < 4:
             raise ValueError("length must be >= 4")
@@ -336,29 +535,108 @@ class LocalBackend:
         raise RuntimeError("Failed to generate a unique task id")
 
     def list_tasks(self) -> list[dict[str, object]]:
+        return self._list_tasks(include_doc=True)
+
+    def change_stamp(self) -> str:
+        """Cheap fingerprint of the store (task READMEs, their newest mtime and total size); any write changes it."""
+        count = newest = total = 0
+        try:
+            with os.scandir(self.root) as entries:
+                names = [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return "missing"
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.root, name, "README.md"))  # noqa: PTH116, PTH118
+            except OSError:
+                continue
+            count += 1
+            newest = max(newest, stat.st_mtime_ns)
+            total += stat.st_size
+        return f"{count}:{newest}:{total}"
+
+    def list_task_headers(self) -> list[dict[str, object]]:
+        """List tasks from frontmatter alone; README bodies (and so `doc`) are never read."""
+        return self._list_tasks(include_doc=False)
+
+    def _scan_task_dirs(self) -> list[str]:
+        # DirEntry.is_dir() answers from d_type, so enumeration costs no per-entry stat on most filesystems.
+        with os.scandir(self.root) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+        names.sort()
+        return names
+
+    def _list_tasks(self, *, include_doc: bool) -> list[dict[str, object]]:
         if not self.root.exists():
             return []
+        started = time.perf_counter()
+        names = self._scan_task_dirs()
+        enumerated = time.perf_counter()
+        readmes = [os.path.join(self.root, name, "README.md") for name in names]  # noqa: PTH118
+        parsed: list[tuple[dict[str, object], str] | None] = [None] * len(readmes)
+        stamps: dict[int, tuple[int, int, int]] = {}
+        pending: list[int] = []
+        for index, readme in enumerate(readmes):
+            try:
+                stat = os.stat(readme)  # noqa: PTH116
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            entry = self._scan_cache.get(readme)
+            if entry is not None and entry[0] == stamp and (entry[1] or not include_doc):
+                parsed[index] = (entry[2], entry[3] if include_doc else "")
+                continue
+            stamps[index] = stamp
+            pending.append(index)
+        pending_readmes = [readmes[index] for index in pending]
+        workers = min(self.scan_workers, len(pending)) if len(pending) >= self.parallel_scan_threshold else 1
+        if workers > 1:
+            # Threads only do the file reads (which release the GIL); pool.map keeps input order.
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task-scan") as pool:
+                raw_readmes = list(
+                    pool.map(lambda readme: _read_task_readme(readme, include_doc=include_doc), pending_readmes)
+                )
+        else:
+            raw_readmes = [_read_task_readme(readme, include_doc=include_doc) for readme in pending_readmes]
+        loaded = time.perf_counter()
+        racy_after = time.time_ns() - SCAN_CACHE_RACY_NS
+        for index, raw in zip(pending, raw_readmes, strict=True):
+            if raw is None:
+                continue
+            frontmatter, doc = _parse_task_readme(raw)
+            parsed[index] = (frontmatter, doc)
+            stamp = stamps[index]
+            if stamp[1] < racy_after:
+                self._scan_cache[readmes[index]] = (stamp, include_doc, frontmatter, doc)
+            else:
+                self._scan_cache.pop(readmes[index], None)
+        if len(self._scan_cache) > len(readmes):
+            current = set(readmes)
+            self._scan_cache = {key: value for key, value in self._scan_cache.items() if key in current}
         tasks: list[dict[str, object]] = []
         seen_ids: set[str] = set()
-        for entry in sorted(self.root.iterdir()):
-            if not entry.is_dir():
-                continue
-            readme = entry / "README.md"
-            if not readme.exists():
+        for readme, item in zip(readmes, parsed, strict=True):
+            if item is None or not item[0]:
                 continue
-            parsed = parse_frontmatter(readme.read_text(encoding="utf-8"))
-            if parsed.frontmatter:
-                task = dict(parsed.frontmatter)
-                task_id = str(task.get("id") or "").strip()
-                if task_id:
-                    validate_task_id(task_id, source=readme)
-                    if task_id in seen_ids:
-                        raise ValueError(f"Duplicate task id in local backend: {task_id}")
-                    seen_ids.add(task_id)
-                doc = extract_task_doc(parsed.body)
-                if doc:
-                    task["doc"] = doc
-                tasks.append(task)
+            # Cached frontmatter is shared between scans, so every caller gets its own copy to mutate.
+            task = cast("dict[str, object]", _copy_task_value(item[0]))
+            task_id = str(task.get("id") or "").strip()
+            if task_id:
+                validate_task_id(task_id, source=Path(readme))
+                if task_id in seen_ids:
+                    raise ValueError(f"Duplicate task id in local backend: {task_id}")
+                seen_ids.add(task_id)
+            if item[1]:
+                task["doc"] = item[1]
+            tasks.append(task)
+        self.last_scan_stats = {
+            "dirs": len(names),
+            "cached": len(names) - len(pending),
+            "workers": workers,
+            "enumerate_ms": (enumerated - started) * 1000,
+            "read_ms": (loaded - enumerated) * 1000,
+            "parse_ms": (time.perf_counter() - loaded) * 1000,
+        }
         return tasks
 
     def get_task(self, task_id: str) -> dict[str, object] | None:
@@ -384,6 +662,25 @@ class LocalBackend:
         if not task_id:
             raise ValueError("Task id is required")
         validate_task_id(task_id)
+        with self.task_lock(task_id):
+            self._write_task_unlocked(task_id, task)
+
+    def compare_and_write_task(self, task: dict[str, object], *, expected_digest: str | None) -> str:
+        """Write task only if the stored copy still matches expected_digest; return the new stored digest."""
+        task_id = str(task.get("id") or "").strip()
+        if not task_id:
+            raise ValueError("Task id is required")
+        validate_task_id(task_id)
+        with self.task_lock(task_id):
+            if expected_digest is not None:
+                current = self.get_task(task_id)
+                if current is None or task_digest(current) != expected_digest:
+                    raise TaskConflictError(f"{task_id} was modified by another writer")
+            self._write_task_unlocked(task_id, task)
+            stored = self.get_task(task_id)
+        return task_digest(stored or {})
+
+    def _write_task_unlocked(self, task_id: str, task: dict[str, object]) -> None:
         task_payload = dict(task)
         doc = task_payload.pop("doc", None)
         readme = self.task_readme_path(task_id)
@@ -415,6 +712,10 @@ class LocalBackend:
         readme.write_text(content, encoding="utf-8")
 
     def set_task_doc(self, task_id: str, doc: str) -> None:
+        with self.task_lock(task_id):
+            self._set_task_doc_unlocked(task_id, doc)
+
+    def _set_task_doc_unlocked(self, task_id: str, doc: str) -> None:
         readme = self.task_readme_path(task_id)
         if not readme.exists():
             raise FileNotFoundError(f"Missing task README: {readme}")
@@ -433,6 +734,10 @@ class LocalBackend:
         readme.write_text(content, encoding="utf-8")
 
     def touch_task_doc_metadata(self, task_id: str, *, updated_by: str | None = None) -> None:
+        with self.task_lock(task_id):
+            self._touch_task_doc_metadata_unlocked(task_id, updated_by=updated_by)
+
+    def _touch_task_doc_metadata_unlocked(self, task_id: str, *, updated_by: str | None = None) -> None:
         readme = self.task_readme_path(task_id)
         if not readme.exists():
             raise FileNotFoundError(f"Missing task README: {readme}")
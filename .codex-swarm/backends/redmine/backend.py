@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import difflib
 import hashlib
 import importlib.util
@@ -9,6 +10,7 @@ import re
 import secrets
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -16,13 +18,44 @@ from urllib import error as urlerror
 from urllib import parse as urlparse
 from urllib import request as urlrequest
 
+if sys.platform != "win32":
+    import fcntl
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from types import ModuleType
 
 JsonDict = dict[str, object]
 TaskRecord = dict[str, object]
 TaskList = list[TaskRecord]
 
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[2] / ".cache" / "redmine-index.json"
+# Full re-list when the index is older than this; incremental refreshes in between.
+DEFAULT_INDEX_TTL_SECONDS = 86400.0
+# How long a "no issue for this task id" answer is trusted.
+DEFAULT_INDEX_NEGATIVE_TTL_SECONDS = 300.0
+# The issues API caps `limit` at 100.
+MAX_PAGE_SIZE = 100
+# Concurrent page requests once the first page has reported total_count.
+DEFAULT_FETCH_WORKERS = 4
+# Queued writes (settings.outbox): one {"task", "queued_at"} line per write_task, drained by flush_outbox().
+DEFAULT_OUTBOX_PATH = DEFAULT_INDEX_PATH.with_name("redmine-outbox.jsonl")
+# Task writes per second while draining the outbox.
+DEFAULT_FLUSH_RATE = 5.0
+# Failed writes of one queued task before it moves to the dead-letter file next to the outbox.
+DEFAULT_OUTBOX_MAX_ATTEMPTS = 5
+
+
+def _overlay_pending(tasks: TaskList, pending: dict[str, TaskRecord]) -> TaskList:
+    """Replace listed tasks by their queued versions and append queued tasks not listed yet."""
+    if not pending:
+        return tasks
+    # Queued writes are newer than what Redmine or the cache holds.
+    remaining = dict(pending)
+    merged = [remaining.pop(str(task.get("id")), task) for task in tasks]
+    return merged + list(remaining.values())
+
 
 def _ensure_task_list(value: object, *, label: str) -> TaskList:
     if not isinstance(value, list):
@@ -116,9 +149,26 @@ class RedmineBackend:
         )
         self.batch_size = _coerce_int(settings.get("batch_size"), 20)
         self.batch_pause = _coerce_float(settings.get("batch_pause"), 0.5)
+        self.page_size = max(1, min(MAX_PAGE_SIZE, _coerce_int(settings.get("page_size"), MAX_PAGE_SIZE)))
+        self.fetch_workers = max(1, _coerce_int(settings.get("fetch_workers"), DEFAULT_FETCH_WORKERS))
         self.owner_agent = env_owner or str(settings.get("owner_agent") or "").strip() or "REDMINE"
         cache_dir = settings.get("cache_dir")
         self._issue_cache: dict[str, JsonDict] = {}
+        index_path = str(settings.get("index_path") or "").strip()
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+        self.index_ttl = _coerce_float(settings.get("index_ttl"), DEFAULT_INDEX_TTL_SECONDS)
+        self.index_negative_ttl = _coerce_float(settings.get("index_negative_ttl"), DEFAULT_INDEX_NEGATIVE_TTL_SECONDS)
+        self._index_loaded = False
+        self._index_issues: dict[str, int] = {}
+        self._index_missing: dict[str, float] = {}
+        self._index_watermark = ""
+        self._index_listed_at = 0.0
+        self.outbox = bool(settings.get("outbox"))
+        outbox_path = str(settings.get("outbox_path") or "").strip()
+        self.outbox_path = Path(outbox_path) if outbox_path else DEFAULT_OUTBOX_PATH
+        self.flush_rate = _coerce_float(settings.get("flush_rate"), DEFAULT_FLUSH_RATE)
+        self.outbox_max_attempts = max(1, _coerce_int(settings.get("outbox_max_attempts"), DEFAULT_OUTBOX_MAX_ATTEMPTS))
+        self.dead_letter_path = self.outbox_path.with_name(f"{self.outbox_path.stem}.dead.jsonl")
 
         if not self.base_url or not self.api_key or not self.project_id:
             raise ValueError("Redmine backend requires url, api_key, and project_id")
@@ -134,6 +184,8 @@ class RedmineBackend:
         self.cache = None
         if cache_dir:
             self.cache = local_backend_cls({"dir": str(cache_dir)})
+        if self.outbox and not self.cache:
+            raise ValueError("Redmine outbox requires cache_dir (queued tasks are read back from the cache)")
 
         self._reverse_status_map: dict[int, str] = {}
         if isinstance(self.status_map, dict):
@@ -152,6 +204,7 @@ class RedmineBackend:
             if not self.cache:
                 raise
             existing_ids = {str(task.get("id") or "") for task in self.cache.list_tasks() if isinstance(task, dict)}
+        existing_ids |= self._pending_tasks().keys()
         return self._generate_task_id_from_existing(existing_ids, length=length, attempts=attempts)
 
     def _generate_task_id_from_existing(self, existing_ids: set[str], *, length: int, attempts: int) -> str:
@@ -166,18 +219,32 @@ class RedmineBackend:
         raise RuntimeError("Failed to generate a unique task id")
 
     def list_tasks(self) -> TaskList:
+        pending = self._pending_tasks()
         try:
             tasks = self._list_tasks_remote()
         except RedmineUnavailable:
             if not self.cache:
                 raise
-            return _ensure_task_list(self.cache.list_tasks(), label="cached tasks")
-        for task in tasks:
-            self._cache_task(task, dirty=False)
-        return tasks
+            tasks = _ensure_task_list(self.cache.list_tasks(), label="cached tasks")
+        else:
+            for task in tasks:
+                if str(task.get("id")) not in pending:
+                    self._cache_task(task, dirty=False)
+        return _overlay_pending(tasks, pending)
 
     def export_tasks_json(self, output_path: Path) -> None:
-        tasks = sorted(self._list_tasks_remote(), key=lambda item: str(item.get("id") or ""))
+        """Write tasks.json from the same view list_tasks() returns, queued writes included.
+
+        With the outbox on, a populated cache plus the queue is that view, so exporting never waits on Redmine.
+        """
+        pending = self._pending_tasks()
+        cached = _ensure_task_list(self.cache.list_tasks(), label="cached tasks") if self.outbox and self.cache else []
+        listing = _overlay_pending(cached, pending) if cached else self.list_tasks()
+        # "dirty" is the cache's sync bookkeeping, not task data; keep it out of the published snapshot.
+        tasks = sorted(
+            ({key: value for key, value in task.items() if key != "dirty"} for task in listing),
+            key=lambda item: str(item.get("id") or ""),
+        )
         payload: JsonDict = {"tasks": tasks}
         canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         payload["meta"] = {
@@ -189,6 +256,9 @@ class RedmineBackend:
         output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
     def get_task(self, task_id: str) -> TaskRecord | None:
+        queued = self._pending_tasks().get(str(task_id))
+        if queued is not None:
+            return queued
         try:
             issue = self._find_issue_by_task_id(task_id)
             if issue is None:
@@ -220,6 +290,14 @@ class RedmineBackend:
     def set_task_doc(self, task_id: str, doc: str) -> None:
         if not (isinstance(self.custom_fields, dict) and self.custom_fields.get("doc")):
             raise RuntimeError("Redmine backend requires custom_fields.doc to set task docs")
+        if self.outbox:
+            task = self.get_task(task_id)
+            if task is None:
+                raise KeyError(f"Unknown task id: {task_id}")
+            task["doc"] = doc
+            self._ensure_doc_metadata(task, force=True)
+            self._enqueue([task])
+            return
         try:
             issue = self._find_issue_by_task_id(task_id)
             if issue is None:
@@ -260,6 +338,13 @@ class RedmineBackend:
             self._cache_task(task, dirty=True)
 
     def touch_task_doc_metadata(self, task_id: str) -> None:
+        if self.outbox:
+            task = self.get_task(task_id)
+            if task is None:
+                raise KeyError(f"Unknown task id: {task_id}")
+            self._ensure_doc_metadata(task, force=True)
+            self._enqueue([task])
+            return
         try:
             issue = self._find_issue_by_task_id(task_id)
             if issue is None:
@@ -296,53 +381,244 @@ class RedmineBackend:
             self._cache_task(task, dirty=True)
 
     def write_task(self, task: dict[str, object]) -> None:
-        task_id = str(task.get("id") or "").strip()
-        if not task_id:
-            raise ValueError("task.id is required")
+        if self.outbox:
+            self._enqueue([task])
+            return
+        self._write_task(task, listed=None)
+
+    def write_tasks(self, tasks: list[dict[str, object]]) -> None:
+        if self.outbox:
+            self._enqueue(tasks)
+            return
+        for index, task in enumerate(tasks, start=1):
+            self.write_task(task)
+            self._pace_batch(index)
+
+    def import_tasks(
+        self, tasks: list[dict[str, object]], *, on_written: Callable[[TaskRecord], None] | None = None
+    ) -> None:
+        """Write many tasks after a single listing of the project, so each costs one POST or PUT.
+
+        on_written runs after every task that reached Redmine; tasks only cached as dirty while it is unreachable
+        are skipped.
+        """
+        listed: dict[str, JsonDict] | None = None
         try:
-            existing_issue: JsonDict | None = None
-            self._ensure_doc_metadata(task, force=False)
-            issue = self._find_issue_by_task_id(task_id)
-            issue_id = issue.get("id") if issue else None
-            existing_issue = issue
-            if issue_id and existing_issue is None:
-                existing_issue = self._issue_from_payload(self._request_json("GET", f"issues/{issue_id}.json"))
-            payload = self._task_to_issue_payload(task, existing_issue=existing_issue)
-            if issue_id:
-                self._request_json("PUT", f"issues/{issue_id}.json", payload={"issue": payload})
-            else:
-                payload["project_id"] = self.project_id
-                created = self._request_json("POST", "issues.json", payload={"issue": payload})
-                created_issue = self._issue_from_payload(created)
-                issue_id = created_issue.get("id") if created_issue else None
-                if issue_id:
-                    update_payload = dict(payload)
-                    update_payload.pop("project_id", None)
-                    self._request_json("PUT", f"issues/{issue_id}.json", payload={"issue": update_payload})
-                    existing_issue = self._issue_from_payload(self._request_json("GET", f"issues/{issue_id}.json"))
-            if issue_id:
-                existing_comments: list[dict[str, object]] = []
-                if isinstance(existing_issue, dict):
-                    comments_val = self._custom_field_value(existing_issue, self.custom_fields.get("comments"))
-                    existing_comments = self._normalize_comments(self._maybe_parse_json(comments_val))
-                desired_comments = self._normalize_comments(task.get("comments"))
-                self._append_comment_notes(
-                    issue_id, existing_comments=existing_comments, desired_comments=desired_comments
-                )
-            task["dirty"] = False
-            self._cache_task(task, dirty=False)
-            self._issue_cache = {}
+            self._list_tasks_remote()
+            listed = self._issue_cache
+        except RedmineUnavailable:
+            if not self.cache:
+                raise
+        try:
+            for index, task in enumerate(tasks, start=1):
+                self._write_task(task, listed=listed)
+                if on_written is not None and task.get("dirty") is not True:
+                    on_written(task)
+                self._pace_batch(index)
+        finally:
+            if listed is not None:
+                self._save_index()
+                self._issue_cache = {}
+
+    def _pace_batch(self, index: int) -> None:
+        if self.batch_pause and self.batch_size > 0 and index % self.batch_size == 0:
+            time.sleep(self.batch_pause)
+
+    def _write_task(self, task: dict[str, object], *, listed: dict[str, JsonDict] | None) -> None:
+        try:
+            self._push_task(task, listed=listed)
         except RedmineUnavailable:
             if not self.cache:
                 raise
             task["dirty"] = True
             self._cache_task(task, dirty=True)
 
-    def write_tasks(self, tasks: list[dict[str, object]]) -> None:
-        for index, task in enumerate(tasks, start=1):
-            self.write_task(task)
-            if self.batch_pause and self.batch_size > 0 and index % self.batch_size == 0:
-                time.sleep(self.batch_pause)
+    def _push_task(self, task: dict[str, object], *, listed: dict[str, JsonDict] | None) -> None:
+        """Create or update the task's issue; listed is a complete task id -> issue map from a fresh listing."""
+        task_id = str(task.get("id") or "").strip()
+        if not task_id:
+            raise ValueError("task.id is required")
+        self._ensure_doc_metadata(task, force=False)
+        # A cached "missing" must not lead straight to a POST: another writer may have created the issue since.
+        issue = listed.get(task_id) if listed is not None else self._find_issue_by_task_id(task_id, trust_missing=False)
+        issue_id = issue.get("id") if issue else None
+        if issue is not None and issue_id:
+            changes = self._payload_changes(self._task_to_issue_payload(task, existing_issue=issue), issue)
+            notes = self._comment_notes(issue, task)
+            if notes:
+                changes["notes"] = notes
+            if changes:
+                self._request_json("PUT", f"issues/{issue_id}.json", payload={"issue": changes})
+                self._apply_issue_changes(issue, changes)
+        else:
+            self._create_issue(task_id, self._task_to_issue_payload(task), save_index=listed is None)
+        task["dirty"] = False
+        self._cache_task(task, dirty=False)
+        if listed is None:
+            self._issue_cache = {}
+
+    def flush_outbox(self) -> dict[str, int]:
+        """Write queued tasks to Redmine, the last queued version of each task once, paced by flush_rate.
+
+        Failed writes stay queued with their attempt count and error until outbox_max_attempts, then move to
+        the dead-letter file (see dead_letters()); an unreachable Redmine ends the drain. Writes queued while
+        draining are kept for the next flush. Only one process drains at a time.
+        """
+        result = {"written": 0, "failed": 0, "dead": 0, "pending": 0, "busy": 0, "unavailable": 0}
+        with self._outbox_lock(".flush", blocking=False) as owner:
+            if not owner:
+                result["busy"] = 1
+                result["pending"] = len(self._pending_tasks())
+                return result
+            with self._outbox_lock():
+                entries, offset = self._read_outbox()
+            queued = self._coalesce_outbox(entries)
+            remaining: dict[str, JsonDict] = {}
+            dead: list[JsonDict] = []
+            interval = 1 / self.flush_rate if self.flush_rate > 0 else 0.0
+            next_at = 0.0
+            for task_id, entry in queued.items():
+                if result["unavailable"]:
+                    remaining[task_id] = entry
+                    continue
+                time.sleep(max(0.0, next_at - time.monotonic()))
+                next_at = time.monotonic() + interval
+                try:
+                    self._push_task(dict(cast(TaskRecord, entry["task"])), listed=None)
+                except RedmineUnavailable:
+                    result["unavailable"] = 1
+                    remaining[task_id] = entry
+                except (RuntimeError, ValueError, KeyError) as exc:
+                    result["failed"] += 1
+                    attempts = _coerce_int(entry.get("attempts"), 0) + 1
+                    failed = {**entry, "attempts": attempts, "last_error": str(exc)}
+                    if attempts >= self.outbox_max_attempts:
+                        dead.append({**failed, "dead_at": now_iso_utc()})
+                    else:
+                        remaining[task_id] = failed
+                else:
+                    result["written"] += 1
+            with self._outbox_lock():
+                # Keep what arrived during the drain, after the entries it supersedes.
+                tail, _ = self._read_outbox(offset)
+                if dead:
+                    with self.dead_letter_path.open("a", encoding="utf-8") as fh:
+                        fh.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in dead))
+                    result["dead"] = len(dead)
+                self._rewrite_outbox([*remaining.values(), *tail])
+                for task in self._coalesce_outbox(tail).values():
+                    self._cache_task(dict(cast(TaskRecord, task["task"])), dirty=True)
+            result["pending"] = len(self._coalesce_outbox([*remaining.values(), *tail]))
+        return result
+
+    def _enqueue(self, tasks: list[dict[str, object]]) -> None:
+        lines: list[str] = []
+        for task in tasks:
+            if not str(task.get("id") or "").strip():
+                raise ValueError("task.id is required")
+            self._ensure_doc_metadata(task, force=False)
+            task["dirty"] = True
+            lines.append(json.dumps({"task": task, "queued_at": now_iso_utc()}, ensure_ascii=False) + "\n")
+        with self._outbox_lock(), self.outbox_path.open("a", encoding="utf-8") as fh:
+            fh.write("".join(lines))
+        for task in tasks:
+            self._cache_task(task, dirty=True)
+
+    def _pending_tasks(self) -> dict[str, TaskRecord]:
+        """Queued, not yet flushed tasks by id (last queued version)."""
+        if not self.outbox and not self.outbox_path.exists():
+            return {}
+        entries, _ = self._read_outbox()
+        return {
+            task_id: dict(cast(TaskRecord, entry["task"])) for task_id, entry in self._coalesce_outbox(entries).items()
+        }
+
+    def dead_letters(self) -> list[JsonDict]:
+        """Queued writes dropped after outbox_max_attempts failures, oldest first; edit or delete the file to clear."""
+        try:
+            lines = self.dead_letter_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+        entries: list[JsonDict] = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("task"), dict):
+                entries.append(cast(JsonDict, entry))
+        return entries
+
+    def _read_outbox(self, offset: int = 0) -> tuple[list[JsonDict], int]:
+        """Entries from byte offset on, plus the offset just past the last complete line."""
+        try:
+            with self.outbox_path.open("rb") as fh:
+                fh.seek(offset)
+                raw = fh.read()
+        except OSError:
+            return [], offset
+        complete = raw[: raw.rfind(b"\n") + 1]
+        entries: list[JsonDict] = []
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("task"), dict):
+                entries.append(cast(JsonDict, entry))
+        return entries, offset + len(complete)
+
+    def _coalesce_outbox(self, entries: list[JsonDict]) -> dict[str, JsonDict]:
+        # Last write per task wins; a task keeps the queue position of its first entry.
+        queued: dict[str, JsonDict] = {}
+        for entry in entries:
+            task_id = str(cast(TaskRecord, entry["task"]).get("id") or "").strip()
+            if task_id:
+                queued[task_id] = entry
+        return queued
+
+    def _rewrite_outbox(self, entries: list[JsonDict]) -> None:
+        if not entries:
+            self.outbox_path.unlink(missing_ok=True)
+            return
+        tmp_path = self.outbox_path.with_name(f"{self.outbox_path.name}.{os.getpid()}.tmp")
+        lines = (json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        tmp_path.write_text("".join(lines), encoding="utf-8")
+        tmp_path.replace(self.outbox_path)
+
+    @contextlib.contextmanager
+    def _outbox_lock(self, suffix: str = "", *, blocking: bool = True) -> Iterator[bool]:
+        """Exclusive flock on <outbox>{suffix}.lock; yields False if blocking is off and another process holds it."""
+        self.outbox_path.parent.mkdir(parents=True, exist_ok=True)
+        if sys.platform == "win32":
+            yield True
+            return
+        fd = os.open(self.outbox_path.with_name(f"{self.outbox_path.name}{suffix}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+        finally:
+            os.close(fd)
+
+    def _create_issue(self, task_id: str, payload: JsonDict, *, save_index: bool) -> None:
+        created = self._request_json(
+            "POST", "issues.json", payload={"issue": {**payload, "project_id": self.project_id}}
+        )
+        created_issue = self._issue_from_payload(created)
+        issue_id = created_issue.get("id") if created_issue else None
+        if created_issue is None or not issue_id:
+            return
+        # Workflows can drop fields on create (e.g. a status new issues may not start in); set only those.
+        missing = self._payload_changes(payload, created_issue)
+        if missing:
+            self._request_json("PUT", f"issues/{issue_id}.json", payload={"issue": missing})
+        self._remember_issue(task_id, created_issue)
+        if save_index:
+            self._save_index()
 
     def sync(
         self,
@@ -358,6 +634,9 @@ class RedmineBackend:
         if direction == "pull":
             self._sync_pull(conflict=conflict, quiet=quiet)
             return
+        if direction == "flush":
+            self._sync_flush(quiet=quiet)
+            return
         raise ValueError(f"Unsupported direction: {direction}")
 
     def _sync_push(self, _conflict: str, quiet: bool, confirm: bool) -> None:
@@ -375,12 +654,35 @@ class RedmineBackend:
                 print(f"- pending push: {task_id}")
             raise RuntimeError("Refusing to push without --yes (preview above)")
         for index, task in enumerate(dirty, start=1):
-            self.write_task(task)
+            self._write_task(task, listed=None)
             if self.batch_pause and self.batch_size > 0 and index % self.batch_size == 0:
                 time.sleep(self.batch_pause)
         if not quiet:
             print(f"✅ pushed {len(dirty)} dirty task(s)")
 
+    def _sync_flush(self, *, quiet: bool) -> None:
+        result = self.flush_outbox()
+        if quiet:
+            return
+        if result["busy"]:
+            print(f"ℹ️ outbox is being flushed by another process ({result['pending']} task(s) queued)")
+            return
+        print(f"✅ flushed {result['written']} queued task write(s); {result['pending']} still queued")
+        retried = result["failed"] - result["dead"]
+        if retried:
+            print(f"⚠️ {retried} task write(s) failed and stay queued (see last_error in {self.outbox_path})")
+        if result["unavailable"]:
+            print("⚠️ Redmine unavailable; the remaining writes stay queued")
+        dead = self.dead_letters()
+        if dead:
+            print(
+                f"❌ {len(dead)} task write(s) gave up after {self.outbox_max_attempts} attempts "
+                f"(kept in {self.dead_letter_path}):"
+            )
+            for entry in dead:
+                task = cast(TaskRecord, entry["task"])
+                print(f"  {task.get('id')}: attempts={entry.get('attempts')} error={entry.get('last_error')}")
+
     def _sync_pull(self, conflict: str, quiet: bool) -> None:
         if not self.cache:
             raise RuntimeError("Redmine cache is disabled; sync pull is unavailable")
@@ -417,7 +719,7 @@ class RedmineBackend:
         conflict: str,
     ) -> None:
         if conflict == "prefer-local":
-            self.write_task(local_task)
+            self._write_task(local_task, listed=None)
             return
         if conflict == "prefer-remote":
             self._cache_task(remote_task, dirty=False)
@@ -458,34 +760,52 @@ class RedmineBackend:
                 return
         fields.append({"id": field_id, "value": value})
 
+    def _fetch_issue_page(self, params: JsonDict, offset: int) -> tuple[list[JsonDict], int, int]:
+        """One page of issues plus the total_count and the limit the server applied."""
+        payload = self._request_json("GET", "issues.json", params={**params, "offset": offset})
+        page_issues = payload.get("issues")
+        if not isinstance(page_issues, list):
+            return [], 0, self.page_size
+        issues = [cast(JsonDict, issue) for issue in page_issues if isinstance(issue, dict)]
+        limit = _coerce_int(payload.get("limit"), self.page_size)
+        return issues, _coerce_int(payload.get("total_count"), 0), limit if limit > 0 else self.page_size
+
+    def _fetch_issue_pages(self, filters: dict[str, object] | None = None) -> list[JsonDict]:
+        """All issues matching filters: page 0 gives total_count, the other offsets are fetched concurrently.
+
+        Pages are merged in offset order; an issue that shifted across a page boundary while paging is kept once.
+        """
+        params: JsonDict = {
+            "project_id": self.project_id,
+            "limit": self.page_size,
+            "status_id": "*",
+            "sort": "id",
+            **(filters or {}),
+        }
+        first, total, limit = self._fetch_issue_page(params, 0)
+        offsets = list(range(limit, total, limit)) if first else []
+        workers = min(self.fetch_workers, len(offsets))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="redmine-page") as pool:
+                pages = list(pool.map(lambda offset: self._fetch_issue_page(params, offset)[0], offsets))
+        else:
+            pages = [self._fetch_issue_page(params, offset)[0] for offset in offsets]
+        all_issues: list[JsonDict] = []
+        seen: set[object] = set()
+        for issue in (issue for page in [first, *pages] for issue in page):
+            issue_id = issue.get("id")
+            if issue_id is not None:
+                if issue_id in seen:
+                    continue
+                seen.add(issue_id)
+            all_issues.append(issue)
+        return all_issues
+
     def _list_tasks_remote(self) -> TaskList:
         tasks: TaskList = []
-        all_issues: list[JsonDict] = []
-        offset = 0
-        limit = 100
         task_id_field_id = self._task_id_field_id()
         self._issue_cache = {}
-        while True:
-            payload = self._request_json(
-                "GET",
-                "issues.json",
-                params={
-                    "project_id": self.project_id,
-                    "limit": limit,
-                    "offset": offset,
-                    "status_id": "*",
-                },
-            )
-            page_issues = payload.get("issues")
-            if not isinstance(page_issues, list):
-                break
-            page_issues = [cast(JsonDict, issue) for issue in page_issues if isinstance(issue, dict)]
-            all_issues.extend(page_issues)
-            total = payload.get("total_count")
-            total_int = _coerce_int(total, 0)
-            if total_int == 0 or offset + limit >= total_int:
-                break
-            offset += limit
+        all_issues = self._fetch_issue_pages()
         existing_ids: set[str] = set()
         duplicates: set[str] = set()
         for issue in all_issues:
@@ -509,13 +829,15 @@ class RedmineBackend:
             if task:
                 self._issue_cache[str(task.get("id"))] = issue
                 tasks.append(task)
+        self._rebuild_index(all_issues)
         return tasks
 
     def _issue_from_payload(self, payload: JsonDict) -> JsonDict | None:
         issue = payload.get("issue")
         return cast(JsonDict, issue) if isinstance(issue, dict) else None
 
-    def _find_issue_by_task_id(self, task_id: str) -> JsonDict | None:
+    def _find_issue_by_task_id(self, task_id: str, *, trust_missing: bool = True) -> JsonDict | None:
+        """Look up the task's issue; trust_missing=False skips the negative cache and always asks Redmine."""
         task_id_str = str(task_id or "").strip()
         if not task_id_str:
             return None
@@ -523,7 +845,17 @@ class RedmineBackend:
         if isinstance(cached, dict):
             return cached
 
+        self._load_index()
         task_field = self._task_id_field_id()
+        indexed_id = self._index_issues.get(task_id_str)
+        missing_at = self._index_missing.get(task_id_str, float("-inf"))
+        if indexed_id is not None:
+            issue = self._fetch_indexed_issue(task_id_str, indexed_id)
+            if issue is not None:
+                return issue
+        elif trust_missing and time.time() - missing_at < self.index_negative_ttl:
+            return None
+
         payload = self._request_json(
             "GET",
             "issues.json",
@@ -541,15 +873,115 @@ class RedmineBackend:
                     continue
                 val = self._custom_field_value(candidate_issue, task_field)
                 if val and str(val) == task_id_str:
-                    self._issue_cache[task_id_str] = candidate_issue
+                    self._remember_issue(task_id_str, candidate_issue)
+                    self._save_index()
                     return candidate_issue
 
-        self._list_tasks_remote()
+        self._refresh_index()
         cached = self._issue_cache.get(task_id_str)
         if isinstance(cached, dict):
             return cached
+        self._index_missing[task_id_str] = time.time()
+        self._save_index()
+        return None
+
+    def _fetch_indexed_issue(self, task_id: str, issue_id: int) -> JsonDict | None:
+        """Fetch an issue by its indexed id; drop the entry if it is gone or now belongs to another task."""
+        try:
+            issue = self._issue_from_payload(self._request_json("GET", f"issues/{issue_id}.json"))
+        except RedmineUnavailable:
+            raise
+        except RuntimeError:
+            issue = None
+        if issue is not None and self._custom_field_value(issue, self._task_id_field_id()) == task_id:
+            self._issue_cache[task_id] = issue
+            return issue
+        self._index_issues.pop(task_id, None)
         return None
 
+    def _refresh_index(self) -> None:
+        """Pull issues updated since the index watermark, or re-list everything once the index expires."""
+        if not self._index_watermark or time.time() - self._index_listed_at > self.index_ttl:
+            self._list_tasks_remote()
+            return
+        task_field = self._task_id_field_id()
+        issues = self._fetch_issue_pages({"updated_on": f">={self._index_watermark}", "sort": "updated_on"})
+        for issue in issues:
+            task_id = self._custom_field_value(issue, task_field)
+            if task_id and self._task_id_re.match(task_id):
+                self._remember_issue(task_id, issue)
+        updated = (str(issue.get("updated_on") or "") for issue in issues)
+        self._index_watermark = max([self._index_watermark, *updated])
+        self._save_index()
+
+    def _rebuild_index(self, issues: list[JsonDict]) -> None:
+        self._index_loaded = True
+        self._index_issues = {}
+        self._index_missing = {}
+        task_field = self._task_id_field_id()
+        for issue in issues:
+            task_id = self._custom_field_value(issue, task_field)
+            if task_id and self._task_id_re.match(task_id):
+                self._remember_issue(task_id, issue)
+        self._index_watermark = max((str(issue.get("updated_on") or "") for issue in issues), default="")
+        self._index_listed_at = time.time()
+        self._save_index()
+
+    def _remember_issue(self, task_id: str, issue: JsonDict) -> None:
+        self._issue_cache[task_id] = issue
+        issue_id = issue.get("id")
+        if isinstance(issue_id, int):
+            self._index_issues[task_id] = issue_id
+            self._index_missing.pop(task_id, None)
+
+    def reset_caches(self) -> None:
+        """Drop in-memory issues between commands of a long-lived process; the index is re-read from disk."""
+        self._issue_cache = {}
+        self._index_loaded = False
+
+    def _index_scope(self) -> JsonDict:
+        return {"url": self.base_url, "project_id": self.project_id, "task_id_field": self._task_id_field_id()}
+
+    def _load_index(self) -> None:
+        if self._index_loaded:
+            return
+        self._index_loaded = True
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        if data.get("scope") != self._index_scope():
+            return
+        issues = data.get("issues")
+        if isinstance(issues, dict):
+            self._index_issues = {str(key): value for key, value in issues.items() if isinstance(value, int)}
+        missing = data.get("missing")
+        if isinstance(missing, dict):
+            self._index_missing = {str(key): _coerce_float(value, 0.0) for key, value in missing.items()}
+        self._index_watermark = str(data.get("watermark") or "")
+        self._index_listed_at = _coerce_float(data.get("listed_at"), 0.0)
+
+    def _save_index(self) -> None:
+        # The index only saves HTTP calls; failing to persist it must not fail the operation.
+        cutoff = time.time() - self.index_negative_ttl
+        payload: JsonDict = {
+            "version": INDEX_VERSION,
+            "scope": self._index_scope(),
+            "watermark": self._index_watermark,
+            "listed_at": self._index_listed_at,
+            "issues": self._index_issues,
+            "missing": {key: value for key, value in self._index_missing.items() if value >= cutoff},
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+            tmp_path.replace(self.index_path)
+        except OSError:
+            return
+
     def _issue_to_task(
         self, issue: dict[str, object], *, task_id_override: str | None = None
     ) -> dict[str, object] | None:
@@ -696,28 +1128,52 @@ class RedmineBackend:
         body_text = body or ""
         return f"[comment] {author_text}: {body_text}".strip()
 
-    def _append_comment_notes(
-        self,
-        issue_id: object,
-        *,
-        existing_comments: list[dict[str, object]],
-        desired_comments: list[dict[str, object]],
-    ) -> None:
-        if not issue_id:
-            return
-        existing_pairs = self._comments_to_pairs(existing_comments)
-        desired_pairs = self._comments_to_pairs(desired_comments)
-        if not desired_pairs:
-            return
-        if len(desired_pairs) < len(existing_pairs):
-            return
+    def _apply_issue_changes(self, issue: JsonDict, changes: JsonDict) -> None:
+        """Mirror a successful PUT on the in-memory issue so later diffs in this process start from it."""
+        for key, value in changes.items():
+            if key == "custom_fields" and isinstance(value, list):
+                for field in cast(list[JsonDict], value):
+                    self._set_issue_custom_field_value(issue, field.get("id"), field.get("value"))
+            elif key.endswith("_id"):
+                issue[key.removesuffix("_id")] = {"id": value}
+            elif key != "notes":
+                issue[key] = value
+
+    def _comment_notes(self, issue: JsonDict, task: dict[str, object]) -> str:
+        """One journal note for the comments task appends to those stored on issue; empty if there are none."""
+        existing_value = self._custom_field_value(issue, self.custom_fields.get("comments"))
+        existing_pairs = self._comments_to_pairs(self._normalize_comments(self._maybe_parse_json(existing_value)))
+        desired_pairs = self._comments_to_pairs(self._normalize_comments(task.get("comments")))
+        if len(desired_pairs) <= len(existing_pairs):
+            return ""
         if existing_pairs and desired_pairs[: len(existing_pairs)] != existing_pairs:
-            return
-        new_pairs = desired_pairs[len(existing_pairs) :]
-        for author, body in new_pairs:
-            note = self._format_comment_note(author, body)
-            if note:
-                self._request_json("PUT", f"issues/{issue_id}.json", payload={"issue": {"notes": note}})
+            return ""
+        notes = (self._format_comment_note(author, body) for author, body in desired_pairs[len(existing_pairs) :])
+        return "\n\n".join(note for note in notes if note)
+
+    def _payload_changes(self, payload: JsonDict, issue: JsonDict) -> JsonDict:
+        """The part of an issue payload that issue does not already hold."""
+        changes: JsonDict = {}
+        for key, value in payload.items():
+            if key in {"project_id", "notes"}:
+                continue
+            if key == "custom_fields" and isinstance(value, list):
+                fields: list[JsonDict] = []
+                for field in cast(list[JsonDict], value):
+                    stored = self._custom_field_value(issue, field.get("id"))
+                    desired = "" if field.get("value") is None else str(field.get("value"))
+                    # Redmine returns values as strings, empty as "", and omits fields the tracker does not use.
+                    if stored != desired and (stored is not None or desired):
+                        fields.append(field)
+                if fields:
+                    changes[key] = fields
+            elif key.endswith("_id"):
+                current = issue.get(key.removesuffix("_id"))
+                if not isinstance(current, dict) or current.get("id") != value:
+                    changes[key] = value
+            elif issue.get(key) != value and not (value == "" and issue.get(key) is None):
+                changes[key] = value
+        return changes
 
     def _start_date_from_task_id(self, task_id: str) -> str | None:
         if not task_id or "-" not in task_id:
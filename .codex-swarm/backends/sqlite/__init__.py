@@ -0,0 +1 @@
+"""SQLite backend package marker."""
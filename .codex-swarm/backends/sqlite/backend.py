@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import secrets
+import sqlite3
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+JsonDict = dict[str, object]
+TaskRecord = dict[str, object]
+TaskList = list[TaskRecord]
+
+DEFAULT_DB_PATH = Path(".codex-swarm/tasks.sqlite3")
+SCHEMA_VERSION = 1
+# SQLite caps bound parameters per statement (999 on older builds).
+MAX_SQL_PARAMS = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    owner_key TEXT NOT NULL,
+    search_text TEXT NOT NULL,
+    search_lower TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_owner ON tasks(owner_key, id);
+CREATE TABLE IF NOT EXISTS tags (
+    task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (task_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag, task_id);
+CREATE TABLE IF NOT EXISTS dependencies (
+    task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    depends_on TEXT NOT NULL,
+    PRIMARY KEY (task_id, depends_on)
+);
+CREATE INDEX IF NOT EXISTS idx_dependencies_dep ON dependencies(depends_on);
+CREATE TABLE IF NOT EXISTS comments (
+    task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_id, seq)
+);
+CREATE TABLE IF NOT EXISTS docs (
+    task_id TEXT PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+    doc TEXT NOT NULL
+);
+"""
+
+
+def now_iso_utc() -> str:
+    return datetime.now(UTC).replace(microsecond=0).isoformat()
+
+
+def _load_local_backend_module() -> ModuleType:
+    local_path = Path(__file__).resolve().parents[1] / "local" / "backend.py"
+    spec = importlib.util.spec_from_file_location("local_backend", local_path)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load local backend from {local_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _str_list(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if isinstance(item, str) and item.strip()]
+
+
+def task_search_text(task: TaskRecord) -> str:
+    # Mirrors agentctl._task_text_blob() so pushed-down search matches the in-memory scan.
+    parts: list[str] = []
+    for key in ("id", "title", "description", "status", "priority", "owner"):
+        value = task.get(key)
+        if isinstance(value, str) and value.strip():
+            parts.append(value.strip())
+    parts.extend(_str_list(task.get("tags")))
+    comments = task.get("comments")
+    if isinstance(comments, list):
+        for comment in comments:
+            if not isinstance(comment, dict):
+                continue
+            for key in ("author", "body"):
+                value = comment.get(key)
+                if isinstance(value, str) and value.strip():
+                    parts.append(value.strip())
+    commit = task.get("commit")
+    if isinstance(commit, dict):
+        for key in ("hash", "message"):
+            value = commit.get(key)
+            if isinstance(value, str) and value.strip():
+                parts.append(value.strip())
+    return "\n".join(parts)
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    return value is not None and re.search(pattern, value, flags=re.IGNORECASE) is not None
+
+
+def _chunks(items: list[str], size: int = MAX_SQL_PARAMS) -> Iterable[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _placeholders(count: int) -> str:
+    """Bind-parameter list for an IN (...) clause; only "?" markers are ever interpolated into SQL."""
+    return ",".join("?" * count)
+
+
+class SqliteBackend:
+    """Tasks stored in a single SQLite database (WAL mode) with indexed status/owner/tag columns."""
+
+    def __init__(self, settings: dict[str, object] | None = None) -> None:
+        settings = settings if isinstance(settings, dict) else {}
+        raw_path = settings.get("path")
+        self.db_path = Path(str(raw_path)).resolve() if raw_path else DEFAULT_DB_PATH.resolve()
+        local_module = _load_local_backend_module()
+        self._task_digest = local_module.task_digest
+        self._validate_task_id = local_module.validate_task_id
+        self._task_conflict_error = cast(type[RuntimeError], local_module.TaskConflictError)
+        self._id_alphabet = str(getattr(local_module, "ID_ALPHABET", "0123456789ABCDEFGHJKMNPQRSTVWXYZ"))
+        self._doc_version = int(getattr(local_module, "DOC_VERSION", 2))
+        self._doc_updated_by = str(getattr(local_module, "DOC_UPDATED_BY", "agentctl"))
+        default_timeout = float(getattr(local_module, "DEFAULT_LOCK_TIMEOUT_SECONDS", 10.0))
+        raw_timeout = os.environ.get("CODEXSWARM_LOCK_TIMEOUT", "").strip() or str(settings.get("lock_timeout") or "")
+        try:
+            self.lock_timeout = float(raw_timeout) if raw_timeout.strip() else default_timeout
+        except ValueError:
+            self.lock_timeout = default_timeout
+        self._conn: sqlite3.Connection | None = None
+
+    # Connection / schema -----------------------------------------------
+
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode: write paths open explicit BEGIN IMMEDIATE transactions.
+            conn = sqlite3.connect(self.db_path, timeout=self.lock_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.create_function("regexp", 2, _regexp, deterministic=True)
+            conn.executescript(SCHEMA)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta(key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+            self._conn = conn
+        return self._conn
+
+    def _rows_to_tasks(
+        self, conn: sqlite3.Connection, rows: list[tuple[str, str]], *, include_doc: bool = True
+    ) -> TaskList:
+        if not rows:
+            return []
+        ids = [row[0] for row in rows]
+        comments: dict[str, list[object]] = {}
+        docs: dict[str, str] = {}
+        for chunk in _chunks(ids):
+            marks = _placeholders(len(chunk))
+            for task_id, data in conn.execute(
+                f"SELECT task_id, data FROM comments WHERE task_id IN ({marks}) ORDER BY task_id, seq",  # noqa: S608
+                chunk,
+            ):
+                comments.setdefault(task_id, []).append(json.loads(data))
+            if not include_doc:
+                continue
+            docs.update(conn.execute(f"SELECT task_id, doc FROM docs WHERE task_id IN ({marks})", chunk))  # noqa: S608
+        tasks: TaskList = []
+        for task_id, data in rows:
+            task = cast(TaskRecord, json.loads(data))
+            if task_id in comments and isinstance(task.get("comments"), list):
+                task["comments"] = comments[task_id]
+            if docs.get(task_id):
+                task["doc"] = docs[task_id]
+            tasks.append(task)
+        return tasks
+
+    def _fetch(self, conn: sqlite3.Connection, task_ids: list[str]) -> TaskList:
+        rows: list[tuple[str, str]] = []
+        for chunk in _chunks(task_ids):
+            marks = _placeholders(len(chunk))
+            rows.extend(conn.execute(f"SELECT id, data FROM tasks WHERE id IN ({marks})", chunk))  # noqa: S608
+        rows.sort(key=lambda row: row[0])
+        return self._rows_to_tasks(conn, rows)
+
+    def _prepare_task(self, conn: sqlite3.Connection, task: TaskRecord) -> tuple[str, TaskRecord]:
+        task_id = str(task.get("id") or "").strip()
+        if not task_id:
+            raise ValueError("Task id is required")
+        self._validate_task_id(task_id)
+        payload = dict(task)
+        existing = next(iter(self._fetch(conn, [task_id])), None) or {}
+        for key in ("doc_version", "doc_updated_at", "doc_updated_by"):
+            if key not in payload and key in existing:
+                payload[key] = existing[key]
+        if "doc" not in payload and "doc" in existing:
+            payload["doc"] = existing["doc"]
+        doc = payload.get("doc")
+        if existing and doc is not None and str(doc).strip() != str(existing.get("doc") or "").strip():
+            self._apply_doc_metadata(payload)
+        if payload.get("doc_version") != self._doc_version or not payload.get("doc_updated_at"):
+            self._apply_doc_metadata(payload)
+        return task_id, payload
+
+    def _apply_doc_metadata(self, task: TaskRecord, *, updated_by: str | None = None) -> None:
+        task["doc_version"] = self._doc_version
+        task["doc_updated_at"] = now_iso_utc()
+        task["doc_updated_by"] = updated_by or self._doc_updated_by
+
+    def _store(self, conn: sqlite3.Connection, task_id: str, task: TaskRecord) -> None:
+        data = {key: value for key, value in task.items() if key != "doc"}
+        if isinstance(data.get("comments"), list):
+            # Placeholder keeps the key (and its position); rows in `comments` fill it on read.
+            data["comments"] = []
+        search_text = task_search_text(task)
+        conn.execute(
+            "INSERT INTO tasks(id, status, owner_key, search_text, search_lower, data) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET status=excluded.status, owner_key=excluded.owner_key, "
+            "search_text=excluded.search_text, search_lower=excluded.search_lower, data=excluded.data",
+            (
+                task_id,
+                str(task.get("status") or "TODO").strip().upper(),
+                str(task.get("owner") or "").strip().upper(),
+                search_text,
+                search_text.lower(),
+                json.dumps(data, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+        conn.execute("DELETE FROM tags WHERE task_id = ?", (task_id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO tags(task_id, tag) VALUES (?, ?)",
+            [(task_id, tag) for tag in _str_list(task.get("tags"))],
+        )
+        conn.execute("DELETE FROM dependencies WHERE task_id = ?", (task_id,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO dependencies(task_id, depends_on) VALUES (?, ?)",
+            [(task_id, dep) for dep in _str_list(task.get("depends_on"))],
+        )
+        conn.execute("DELETE FROM comments WHERE task_id = ?", (task_id,))
+        comments = task.get("comments")
+        if isinstance(comments, list):
+            conn.executemany(
+                "INSERT INTO comments(task_id, seq, data) VALUES (?, ?, ?)",
+                [
+                    (task_id, seq, json.dumps(comment, ensure_ascii=False, separators=(",", ":")))
+                    for seq, comment in enumerate(comments)
+                ],
+            )
+        doc = str(task.get("doc") or "")
+        if doc.strip():
+            conn.execute(
+                "INSERT INTO docs(task_id, doc) VALUES (?, ?) ON CONFLICT(task_id) DO UPDATE SET doc=excluded.doc",
+                (task_id, doc),
+            )
+        else:
+            conn.execute("DELETE FROM docs WHERE task_id = ?", (task_id,))
+
+    # Backend protocol --------------------------------------------------
+
+    def generate_task_id(self, *, length: int = 6, attempts: int = 1000) -> str:
+        if length < 4:
+            raise ValueError("length must be >= 4")
+        conn = self.connection()
+        for _ in range(attempts):
+            timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M")
+            suffix = "".join(secrets.choice(self._id_alphabet) for _ in range(length))
+            task_id = f"{timestamp}-{suffix}"
+            if conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is None:
+                return task_id
+        raise RuntimeError("Failed to generate a unique task id")
+
+    def list_tasks(self) -> TaskList:
+        conn = self.connection()
+        rows = list(conn.execute("SELECT id, data FROM tasks ORDER BY id"))
+        return self._rows_to_tasks(conn, rows)
+
+    def change_stamp(self) -> str:
+        """mtime and size of the database and its WAL; a committed write changes at least one of them."""
+        parts: list[str] = []
+        for path in (self.db_path, self.db_path.with_name(f"{self.db_path.name}-wal")):
+            try:
+                stat = path.stat()
+            except OSError:
+                parts.append("-")
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "|".join(parts)
+
+    def list_task_headers(self) -> TaskList:
+        conn = self.connection()
+        rows = list(conn.execute("SELECT id, data FROM tasks ORDER BY id"))
+        return self._rows_to_tasks(conn, rows, include_doc=False)
+
+    def get_task(self, task_id: str) -> TaskRecord | None:
+        return next(iter(self._fetch(self.connection(), [task_id])), None)
+
+    def get_tasks(self, task_ids: list[str]) -> TaskList:
+        return self._fetch(self.connection(), sorted(set(task_ids)))
+
+    def query_tasks(
+        self,
+        *,
+        status: list[str] | None = None,
+        owner: list[str] | None = None,
+        tag: list[str] | None = None,
+        text: str | None = None,
+        regex: bool = False,
+    ) -> TaskList:
+        """Filter in SQL with `agentctl task list/next/search` semantics; results are sorted by id."""
+        clauses: list[str] = []
+        params: list[str] = []
+        for column, values in (("status", status), ("owner_key", owner)):
+            wanted = sorted({value.strip().upper() for value in values or [] if value.strip()})
+            if wanted:
+                clauses.append(f"{column} IN ({_placeholders(len(wanted))})")
+                params.extend(wanted)
+        tags = sorted({value.strip() for value in tag or [] if value.strip()})
+        if tags:
+            # Only "?" placeholders are interpolated; the tag values travel as bound parameters.
+            clauses.append(f"id IN (SELECT task_id FROM tags WHERE tag IN ({_placeholders(len(tags))}))")  # noqa: S608
+            params.extend(tags)
+        if text:
+            if regex:
+                clauses.append("search_text REGEXP ?")
+                params.append(text)
+            else:
+                clauses.append("instr(search_lower, ?) > 0")
+                params.append(text.lower())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self.connection()
+        rows = list(conn.execute(f"SELECT id, data FROM tasks{where} ORDER BY id", params))  # noqa: S608
+        return self._rows_to_tasks(conn, rows)
+
+    def get_task_doc(self, task_id: str) -> str:
+        conn = self.connection()
+        if conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is None:
+            raise FileNotFoundError(f"Unknown task id: {task_id}")
+        row = conn.execute("SELECT doc FROM docs WHERE task_id = ?", (task_id,)).fetchone()
+        return str(row[0]) if row else ""
+
+    def write_task(self, task: TaskRecord) -> None:
+        self.write_tasks([task])
+
+    def write_tasks(self, tasks: TaskList) -> None:
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for task in tasks:
+                task_id, payload = self._prepare_task(conn, task)
+                self._store(conn, task_id, payload)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def compare_and_write_task(self, task: TaskRecord, *, expected_digest: str | None) -> str:
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            task_id, payload = self._prepare_task(conn, task)
+            if expected_digest is not None:
+                current = next(iter(self._fetch(conn, [task_id])), None)
+                if current is None or self._task_digest(current) != expected_digest:
+                    raise self._task_conflict_error(f"{task_id} was modified by another writer")
+            self._store(conn, task_id, payload)
+            stored = next(iter(self._fetch(conn, [task_id])), None) or {}
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return str(self._task_digest(stored))
+
+    def set_task_doc(self, task_id: str, doc: str) -> None:
+        task = self.get_task(task_id)
+        if task is None:
+            raise FileNotFoundError(f"Unknown task id: {task_id}")
+        task["doc"] = str(doc or "")
+        self.write_task(task)
+
+    def touch_task_doc_metadata(self, task_id: str, *, updated_by: str | None = None) -> None:
+        task = self.get_task(task_id)
+        if task is None:
+            raise FileNotFoundError(f"Unknown task id: {task_id}")
+        self._apply_doc_metadata(task, updated_by=updated_by)
+        self.write_task(task)
+
+    def export_tasks_json(self, output_path: Path) -> None:
+        tasks = self.list_tasks()
+        payload: JsonDict = {"tasks": tasks}
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        payload["meta"] = {
+            "schema_version": 1,
+            "managed_by": "agentctl",
+            "checksum_algo": "sha256",
+            "checksum": hashlib.sha256(canonical).hexdigest(),
+        }
+        output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def normalize_tasks(self) -> int:
+        tasks = self.list_tasks()
+        self.write_tasks(tasks)
+        conn = self.connection()
+        conn.execute("PRAGMA optimize")
+        return len(tasks)
@@ -1,18 +1,27 @@
 #!/usr/bin/env python3
-"""Minimal local server for tasks.html with backend status updates."""
+"""Minimal local server for tasks.html with in-process backend status updates."""
 
 from __future__ import annotations
 
 import argparse
 import contextlib
+import functools
+import gzip
+import importlib.util
 import json
 import os
-import subprocess
 import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import cast
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, TypeVar, cast
+from urllib.parse import parse_qs, unquote, urlparse
+
+if TYPE_CHECKING:
+    from types import ModuleType
 
 
 def resolve_repo_root() -> Path:
@@ -31,23 +40,255 @@ AGENTS_DIR = REPO_ROOT / ".codex-swarm" / "agents"
 AGENTCTL = REPO_ROOT / ".codex-swarm" / "agentctl.py"
 
 STATUS_SET = {"TODO", "DOING", "BLOCKED", "DONE"}
+T = TypeVar("T")
+# Coalesce snapshot exports after bursts of board moves (drag & drop, batch updates).
+EXPORT_DEBOUNCE_SECONDS = 0.5
+# Backend outbox drain cadence; doubles (up to the max) while the remote tracker is unreachable.
+OUTBOX_FLUSH_SECONDS = 5.0
+OUTBOX_MAX_BACKOFF_SECONDS = 120.0
+# Derived fields that can be requested via `fields=` without shipping the full payload.
+SUMMARY_FIELDS = {"comments_count", "has_doc"}
+MAX_PAGE_LIMIT = 1000
+# Bodies smaller than this are not worth a gzip round-trip.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".json": "application/json",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+}
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    mtime_ns: int
+    size: int
+    body: bytes
+    gzip_body: bytes | None
+    etag: str
+    last_modified: str
+    content_type: str
 
 
-def run_agentctl(*args: str) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        [sys.executable, str(AGENTCTL), *args],
-        cwd=str(REPO_ROOT),
-        check=False,
-        capture_output=True,
-        text=True,
+_STATIC_CACHE: dict[Path, StaticAsset] = {}
+_STATIC_LOCK = threading.Lock()
+
+
+def load_static_asset(path: Path) -> StaticAsset:
+    """Return the cached asset for path, re-reading (and re-compressing) only when mtime/size change."""
+    stat = path.stat()
+    with _STATIC_LOCK:
+        cached = _STATIC_CACHE.get(path)
+    if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached
+    body = path.read_bytes()
+    content_type = CONTENT_TYPES.get(path.suffix, "application/octet-stream")
+    compressible = content_type.startswith(("text/", "application/json", "application/javascript", "image/svg"))
+    gzip_body = None
+    if compressible and len(body) >= GZIP_MIN_BYTES:
+        gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    asset = StaticAsset(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        body=body,
+        gzip_body=gzip_body,
+        etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        last_modified=formatdate(stat.st_mtime, usegmt=True),
+        content_type=content_type,
     )
+    with _STATIC_LOCK:
+        _STATIC_CACHE[path] = asset
+    return asset
+
+
+def accepts_gzip(header: str | None) -> bool:
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token.strip().lower() not in {"gzip", "*"}:
+            continue
+        qvalue = params.strip().lower()
+        if qvalue.startswith("q="):
+            try:
+                return float(qvalue[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def is_not_modified(asset: StaticAsset, if_none_match: str | None, if_modified_since: str | None) -> bool:
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return asset.etag in tags or "*" in tags
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(asset.mtime_ns // 1_000_000_000) <= int(since)
+    return False
+
+
+class StatusChangeError(Exception):
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+_AGENTCTL: ModuleType | None = None
+_AGENTCTL_LOCK = threading.Lock()
+# Serialises every mutation of the task store (and tasks.json exports) made by this server.
+_WRITE_LOCK = threading.Lock()
+_EXPORT_TIMER: threading.Timer | None = None
+# Backend change stamp taken just before the viewer's last export; None until the first one.
+_EXPORT_STAMP: str | None = None
+
+
+def load_agentctl() -> ModuleType:
+    """Import agentctl.py once so status changes reuse its backend and transition rules in-process."""
+    global _AGENTCTL
+    with _AGENTCTL_LOCK:
+        if _AGENTCTL is None:
+            spec = importlib.util.spec_from_file_location("codex_swarm_agentctl", AGENTCTL)
+            if spec is None or spec.loader is None:
+                raise RuntimeError(f"Unable to load {AGENTCTL}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _AGENTCTL = module
+        return _AGENTCTL
+
+
+def _run_agentctl_call(func: Callable[[], T]) -> T:
+    # agentctl reports failures through die(), whose exit carries the message; turn them into request errors.
+    try:
+        return func()
+    except SystemExit as exc:
+        message = str(getattr(exc, "message", "") or "").strip()
+        raise StatusChangeError(message or "Status update failed", status=500) from exc
+
+
+def backend_change_stamp() -> str | None:
+    """The backend's change stamp, or None when it cannot tell (e.g. Redmine) and every read must re-export."""
+    ctl = load_agentctl()
+    backend = ctl.backend_instance()
+    return backend.change_stamp() if ctl.supports_change_stamp(backend) else None
+
+
+def export_snapshot() -> None:
+    """Re-export tasks.json in-process from the backend; callers hold _WRITE_LOCK."""
+    global _EXPORT_STAMP
+    ctl = load_agentctl()
+    ctl.reset_command_state()
+    # Stamp first: a write landing during the export makes the next read export again.
+    stamp = backend_change_stamp()
+    _run_agentctl_call(functools.partial(ctl.export_tasks_snapshot, quiet=True))
+    _EXPORT_STAMP = stamp
+
 
+def refresh_snapshot(*, force: bool = False) -> None:
+    """Re-export tasks.json when it is missing or the backend changed since the viewer's last export.
 
-def export_tasks_json() -> tuple[bool, str]:
-    proc = run_agentctl("task", "export", "--format", "json", "--out", ".codex-swarm/tasks.json")
-    if proc.returncode != 0:
-        return False, (proc.stderr.strip() or "Failed to export tasks.json")
-    return True, ""
+    CLI commands such as `task add`, `task comment` and `task doc` write the backend without exporting.
+    """
+    if not force and _snapshot_current():
+        return
+    with _WRITE_LOCK:
+        # Another request may have exported while this one waited for the lock.
+        if force or not _snapshot_current():
+            export_snapshot()
+
+
+def _snapshot_current() -> bool:
+    stamp = backend_change_stamp()
+    return stamp is not None and stamp == _EXPORT_STAMP and TASKS_JSON.exists()
+
+
+def _export_snapshot_now() -> None:
+    global _EXPORT_TIMER
+    with _WRITE_LOCK:
+        _EXPORT_TIMER = None
+        try:
+            export_snapshot()
+        except StatusChangeError as exc:
+            sys.stderr.write(f"tasks.json export failed: {exc}\n")
+
+
+def schedule_snapshot_export() -> None:
+    global _EXPORT_TIMER
+    if _EXPORT_TIMER is not None:
+        _EXPORT_TIMER.cancel()
+    timer = threading.Timer(EXPORT_DEBOUNCE_SECONDS, _export_snapshot_now)
+    timer.daemon = True
+    _EXPORT_TIMER = timer
+    timer.start()
+
+
+def run_outbox_worker(stop: threading.Event, interval: float) -> None:
+    """Drain the backend's queued writes in the background (backends with an outbox, e.g. Redmine)."""
+    ctl = load_agentctl()
+    backend_cls = cast(Callable[[dict[str, object]], object] | None, ctl.BACKEND_CLASS)
+    if backend_cls is None:
+        return
+    # A private instance: draining must not share in-memory issue caches with request threads.
+    backend = backend_cls(ctl.backend_settings())
+    flush_outbox = cast(Callable[[], dict[str, int]] | None, getattr(backend, "flush_outbox", None))
+    if flush_outbox is None:
+        return
+    delay = interval
+    while not stop.wait(delay):
+        try:
+            result = flush_outbox()
+        except Exception as exc:  # pragma: no cover - keep the worker alive
+            sys.stderr.write(f"outbox flush failed: {exc}\n")
+            result = {"unavailable": 1}
+        if result.get("written"):
+            sys.stderr.write(f"outbox: flushed {result['written']} task write(s), {result.get('pending', 0)} queued\n")
+        if result.get("dead"):
+            sys.stderr.write(f"outbox: gave up on {result['dead']} task write(s); see `agentctl sync flush`\n")
+        delay = min(delay * 2, OUTBOX_MAX_BACKOFF_SECONDS) if result.get("unavailable") else interval
+
+
+def apply_status_changes(changes: list[tuple[str, str]]) -> list[dict[str, object]]:
+    """Apply status transitions after validating all of them: one invalid change means nothing is written.
+
+    Only validation is all-or-nothing. The save writes task by task (compare-and-swap per task on backends), so
+    a conflict or lock timeout partway through leaves the tasks saved before it written.
+    """
+    ctl = load_agentctl()
+    with _WRITE_LOCK:
+        # Other agentctl processes may have written since the last request; never trust the module caches.
+        ctl.reset_command_state()
+        _run_agentctl_call(ctl.require_tasks_json_write_context)
+        tasks, save = _run_agentctl_call(ctl.load_task_store)
+        tasks_by_id = {str(task.get("id") or ""): task for task in tasks}
+        updated: list[dict[str, object]] = []
+        for task_id, status in changes:
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                raise StatusChangeError(f"Unknown task id: {task_id}", status=404)
+            if status == "DONE":
+                raise StatusChangeError(
+                    f"{task_id}: use `python .codex-swarm/agentctl.py finish {task_id}` to mark DONE",
+                    status=409,
+                )
+            current = str(task.get("status") or "").strip().upper() or "TODO"
+            if not ctl.is_transition_allowed(current, status):
+                raise StatusChangeError(f"{task_id}: refusing status transition {current} -> {status}", status=409)
+            if status == "DOING" and current != "DOING":
+                ok, warnings = _run_agentctl_call(functools.partial(ctl.readiness, task_id))
+                if not ok:
+                    detail = "; ".join(warnings)
+                    raise StatusChangeError(f"Task is not ready: {task_id} ({detail})", status=409)
+            updated.append(task)
+        for task, (_, status) in zip(updated, changes, strict=True):
+            task["status"] = status
+        _run_agentctl_call(functools.partial(save, tasks))
+        if ctl.backend_instance() is not None:
+            schedule_snapshot_export()
+        return updated
 
 
 def load_tasks_json() -> dict[str, object]:
@@ -55,6 +296,138 @@ def load_tasks_json() -> dict[str, object]:
         return cast(dict[str, object], json.load(fh))
 
 
+_SNAPSHOT_CACHE: tuple[int, int, dict[str, object]] | None = None
+
+
+def load_tasks_snapshot() -> dict[str, object]:
+    """Return the parsed tasks.json, re-reading it only when mtime/size change; callers must not mutate it."""
+    global _SNAPSHOT_CACHE
+    stat = TASKS_JSON.stat()
+    with _STATIC_LOCK:
+        cached = _SNAPSHOT_CACHE
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    data = load_tasks_json()
+    with _STATIC_LOCK:
+        _SNAPSHOT_CACHE = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def _query_list(query: dict[str, list[str]], key: str) -> list[str]:
+    values: list[str] = []
+    for raw in query.get(key, []):
+        values.extend(item.strip() for item in raw.split(",") if item.strip())
+    return values
+
+
+def filter_tasks(tasks: list[dict[str, object]], query: dict[str, list[str]]) -> list[dict[str, object]]:
+    """Apply `status`/`owner`/`tag` filters with the same semantics as `agentctl task list`."""
+    statuses = {s.upper() for s in _query_list(query, "status")}
+    owners = {o.upper() for o in _query_list(query, "owner")}
+    tags = set(_query_list(query, "tag"))
+    result: list[dict[str, object]] = []
+    for task in tasks:
+        if statuses and str(task.get("status") or "TODO").strip().upper() not in statuses:
+            continue
+        if owners and str(task.get("owner") or "").strip().upper() not in owners:
+            continue
+        if tags:
+            task_tags = task.get("tags")
+            if not isinstance(task_tags, list) or not any(str(tag).strip() in tags for tag in task_tags):
+                continue
+        result.append(task)
+    return result
+
+
+def project_task(task: dict[str, object], fields: list[str]) -> dict[str, object]:
+    if not fields:
+        return task
+    out: dict[str, object] = {"id": task.get("id")}
+    for field in fields:
+        if field == "comments_count":
+            comments = task.get("comments")
+            out[field] = len(comments) if isinstance(comments, list) else 0
+        elif field == "has_doc":
+            out[field] = bool(str(task.get("doc") or "").strip())
+        elif field in task:
+            out[field] = task[field]
+    return out
+
+
+def paginate_tasks(
+    tasks: list[dict[str, object]], *, limit: int | None, cursor: str
+) -> tuple[list[dict[str, object]], str | None]:
+    """Page over tasks sorted by id; the cursor is the last id of the previous page."""
+    ordered = sorted(tasks, key=lambda t: str(t.get("id") or ""))
+    if cursor:
+        ordered = [t for t in ordered if str(t.get("id") or "") > cursor]
+    if limit is None or len(ordered) <= limit:
+        return ordered, None
+    page = ordered[:limit]
+    return page, str(page[-1].get("id") or "")
+
+
+def query_tasks(data: dict[str, object], query: dict[str, list[str]]) -> dict[str, object]:
+    meta_obj = data.get("meta")
+    meta = cast(dict[str, object], meta_obj) if isinstance(meta_obj, dict) else {}
+    since = (query.get("since") or [""])[0].strip()
+    if since and since == str(meta.get("checksum") or ""):
+        return {"unchanged": True, "meta": meta}
+    limit_raw = (query.get("limit") or [""])[0].strip()
+    limit: int | None = None
+    if limit_raw:
+        try:
+            limit = int(limit_raw)
+        except ValueError as exc:
+            raise ValueError(f"Invalid limit: {limit_raw}") from exc
+        if limit <= 0:
+            raise ValueError(f"Invalid limit: {limit_raw}")
+        limit = min(limit, MAX_PAGE_LIMIT)
+    tasks_obj = data.get("tasks")
+    raw_tasks = tasks_obj if isinstance(tasks_obj, list) else []
+    tasks = [cast(dict[str, object], t) for t in raw_tasks if isinstance(t, dict)]
+    filtered = filter_tasks(tasks, query)
+    page, next_cursor = paginate_tasks(filtered, limit=limit, cursor=(query.get("cursor") or [""])[0].strip())
+    fields = _query_list(query, "fields")
+    return {
+        "tasks": [project_task(task, fields) for task in page],
+        "meta": meta,
+        "total": len(filtered),
+        "next_cursor": next_cursor,
+    }
+
+
+def parse_status_updates(raw: object) -> list[tuple[str, str]]:
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("Invalid body: expected non-empty `updates` list")
+    changes: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for item in raw:
+        if not isinstance(item, dict):
+            raise TypeError("Invalid update: expected object with `id` and `status`")
+        task_id = str(item.get("id") or "").strip()
+        status = str(item.get("status") or "").upper().strip()
+        if not task_id:
+            raise ValueError("Invalid update: missing task id")
+        if status not in STATUS_SET:
+            raise ValueError(f"Invalid status: {status}")
+        if task_id in seen:
+            raise ValueError(f"Duplicate task id in updates: {task_id}")
+        seen.add(task_id)
+        changes.append((task_id, status))
+    return changes
+
+
+def find_task(data: dict[str, object], task_id: str) -> dict[str, object] | None:
+    tasks_obj = data.get("tasks")
+    if not isinstance(tasks_obj, list):
+        return None
+    for task in tasks_obj:
+        if isinstance(task, dict) and str(task.get("id") or "") == task_id:
+            return cast(dict[str, object], task)
+    return None
+
+
 def mask(value: str, keep: int = 4) -> str:
     if not value:
         return ""
@@ -71,17 +444,57 @@ class TasksHandler(BaseHTTPRequestHandler):
         message = fmt % args if args else fmt
         sys.stderr.write(f"{self.address_string()} - - [{self.log_date_time_string()}] {message}\n")
 
+    def _write_body(self, body: bytes) -> None:
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
     def _send_json(self, payload: dict[str, object], status: int = 200) -> None:
         body = json.dumps(payload).encode("utf-8")
+        gzipped = len(body) >= GZIP_MIN_BYTES and accepts_gzip(self.headers.get("Accept-Encoding"))
+        if gzipped:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Cache-Control", "no-store")
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
+        self._write_body(body)
+
+    def _send_static(self, path: Path) -> None:
         try:
-            self.wfile.write(body)
-        except (BrokenPipeError, ConnectionResetError):
+            asset = load_static_asset(path)
+        except OSError:
+            self._send_text("Not found", status=404)
+            return
+        if is_not_modified(asset, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")):
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Last-Modified", asset.last_modified)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
             return
+        body = asset.body
+        gzipped = asset.gzip_body is not None and accepts_gzip(self.headers.get("Accept-Encoding"))
+        if gzipped and asset.gzip_body is not None:
+            body = asset.gzip_body
+        self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("ETag", asset.etag)
+        self.send_header("Last-Modified", asset.last_modified)
+        # Always revalidate: the conditional request is cheap and edits to the viewer show up immediately.
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self._write_body(body)
 
     def _send_text(self, text: str, status: int = 200, content_type: str = "text/plain; charset=utf-8") -> None:
         body = text.encode("utf-8")
@@ -89,7 +502,7 @@ class TasksHandler(BaseHTTPRequestHandler):
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(body)
+        self._write_body(body)
 
     def _read_json(self) -> dict[str, object]:
         length = int(self.headers.get("Content-Length", "0"))
@@ -110,8 +523,7 @@ class TasksHandler(BaseHTTPRequestHandler):
             if not TASKS_HTML.exists():
                 self._send_text("tasks.html not found", status=404)
                 return
-            content = TASKS_HTML.read_text(encoding="utf-8")
-            self._send_text(content, content_type="text/html; charset=utf-8")
+            self._send_static(TASKS_HTML)
             return
         if parsed.path.startswith("/viewer/"):
             rel = parsed.path.replace("/viewer/", "", 1)
@@ -119,15 +531,7 @@ class TasksHandler(BaseHTTPRequestHandler):
             if not str(target).startswith(str(VIEWER_DIR.resolve())) or not target.exists():
                 self._send_text("Not found", status=404)
                 return
-            if target.suffix == ".html":
-                ctype = "text/html; charset=utf-8"
-            elif target.suffix == ".css":
-                ctype = "text/css; charset=utf-8"
-            elif target.suffix == ".js":
-                ctype = "application/javascript; charset=utf-8"
-            else:
-                ctype = "application/octet-stream"
-            self._send_text(target.read_text(encoding="utf-8"), content_type=ctype)
+            self._send_static(target)
             return
         if parsed.path == "/api/health":
             self._send_json({"ok": True})
@@ -155,21 +559,38 @@ class TasksHandler(BaseHTTPRequestHandler):
             }
             self._send_json(payload)
             return
+        if parsed.path.startswith("/api/tasks/"):
+            task_id = unquote(parsed.path.removeprefix("/api/tasks/")).strip("/")
+            try:
+                refresh_snapshot()
+                task = find_task(load_tasks_snapshot(), task_id) if task_id and "/" not in task_id else None
+            except (OSError, ValueError, StatusChangeError) as exc:
+                self._send_json({"error": str(exc)}, status=500)
+                return
+            if task is None:
+                self._send_json({"error": f"Unknown task id: {task_id}"}, status=404)
+                return
+            self._send_json({"ok": True, "task": task})
+            return
         if parsed.path == "/api/tasks":
+            query = parse_qs(parsed.query)
+            # `refresh=1` re-exports even when the backend reports no change.
+            refresh = query.pop("refresh", [""])[0] == "1"
             try:
-                ok, err = export_tasks_json()
-                if not ok and not TASKS_JSON.exists():
-                    raise RuntimeError(err)
-                data = load_tasks_json()
-                if not ok:
-                    meta_obj = data.get("meta")
-                    meta = cast(dict[str, object], meta_obj) if isinstance(meta_obj, dict) else {}
-                    meta["warning"] = err
-                    data["meta"] = meta
-            except Exception as exc:  # pragma: no cover - simple runtime guard
+                refresh_snapshot(force=refresh)
+                data = load_tasks_snapshot()
+            except (OSError, ValueError, StatusChangeError) as exc:
                 self._send_json({"error": str(exc)}, status=500)
                 return
-            self._send_json(data)
+            if not query:
+                self._send_json(data)
+                return
+            try:
+                result = query_tasks(data, query)
+            except ValueError as exc:
+                self._send_json({"error": str(exc)}, status=400)
+                return
+            self._send_json(result)
             return
         if parsed.path == "/api/agents":
             agents = []
@@ -181,14 +602,23 @@ class TasksHandler(BaseHTTPRequestHandler):
                             if "id" not in data:
                                 data["id"] = item.stem
                             agents.append(data)
-                    except Exception:
-                        pass
+                    except Exception as exc:
+                        sys.stderr.write(f"Skipping agent file {item.name}: {exc}\n")
             self._send_json({"ok": True, "agents": agents})
             return
         self._send_text("Not found", status=404)
 
     def do_POST(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
+        if parsed.path == "/api/tasks/status:batch":
+            try:
+                payload = self._read_json()
+                changes = parse_status_updates(payload.get("updates"))
+            except (ValueError, TypeError) as exc:
+                self._send_json({"error": str(exc)}, status=400)
+                return
+            self._apply_status_changes(changes)
+            return
         if parsed.path.startswith("/api/tasks/") and parsed.path.endswith("/status"):
             parts = parsed.path.strip("/").split("/")
             if len(parts) != 4:
@@ -197,39 +627,51 @@ class TasksHandler(BaseHTTPRequestHandler):
             _, _, task_id, _ = parts
             try:
                 payload = self._read_json()
-            except ValueError as exc:
+                changes = parse_status_updates([{"id": unquote(task_id), "status": payload.get("status")}])
+            except (ValueError, TypeError) as exc:
                 self._send_json({"error": str(exc)}, status=400)
                 return
-            status = str(payload.get("status", "")).upper().strip()
-            if status not in STATUS_SET:
-                self._send_json({"error": f"Invalid status: {status}"}, status=400)
-                return
-            proc = run_agentctl("task", "set-status", task_id, status)
-            if proc.returncode != 0:
-                self._send_json({"error": proc.stderr.strip() or "Status update failed"}, status=500)
-                return
-            try:
-                export_tasks_json()
-                data = load_tasks_json()
-            except Exception as exc:
-                self._send_json({"error": str(exc)}, status=500)
-                return
-            self._send_json({"ok": True, "data": data, "task_id": task_id, "status": status})
+            self._apply_status_changes(changes)
             return
         self._send_text("Not found", status=404)
 
+    def _apply_status_changes(self, changes: list[tuple[str, str]]) -> None:
+        try:
+            updated = apply_status_changes(changes)
+        except StatusChangeError as exc:
+            self._send_json({"error": str(exc)}, status=exc.status)
+            return
+        except Exception as exc:  # pragma: no cover - simple runtime guard
+            self._send_json({"error": str(exc)}, status=500)
+            return
+        if len(changes) == 1:
+            task_id, status = changes[0]
+            self._send_json({"ok": True, "task": updated[0], "task_id": task_id, "status": status})
+            return
+        self._send_json({"ok": True, "tasks": updated})
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Local tasks.html kanban server")
     parser.add_argument("--host", default="127.0.0.1", help="Bind host (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=5179, help="Bind port (default: 5179)")
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=OUTBOX_FLUSH_SECONDS,
+        help=f"Seconds between backend outbox flushes; 0 disables (default: {OUTBOX_FLUSH_SECONDS:g})",
+    )
     args = parser.parse_args()
 
     addr = f"http://{args.host}:{args.port}"
     print(f"Serving tasks.html at {addr} (Ctrl+C to stop)")
     httpd = ThreadingHTTPServer((args.host, args.port), TasksHandler)
+    stop = threading.Event()
+    if args.flush_interval > 0:
+        threading.Thread(target=run_outbox_worker, args=(stop, args.flush_interval), daemon=True).start()
     with contextlib.suppress(KeyboardInterrupt):
         httpd.serve_forever()
+    stop.set()
     return 0
 
 
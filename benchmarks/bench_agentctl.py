@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Time agentctl hot paths against synthetic task stores.
+
+For each requested size the harness builds a scratch repository (a copy of agentctl,
+its client, config and backends plus a generated local task store with frontmatter, comments,
+docs and a dependency DAG), then times:
+
+- in-process: backend list calls, dependency state, lint, export and the main
+  read-only commands through agentctl.main() (task caches reset before every run);
+- CLI: the same commands as `python agentctl.py ...` subprocesses, so interpreter
+  start-up and module import are included.
+
+With --check-loads the harness also runs write commands (comment, update, start, block,
+finish) in-process and fails when one scans the backend (list_tasks or list_task_headers)
+more often than its budget: single-task commands use point reads and writes and never scan,
+and finish shares a single store session across readiness, mutation, printing and export.
+
+Results are best-of-N wall-clock seconds. Store them with --output and compare a later
+run with --baseline; any scenario slower than the baseline by more than --threshold
+(and by more than --min-delta seconds) is reported and the exit status is 1.
+
+    python benchmarks/bench_agentctl.py --sizes 100,1000 --output /tmp/bench.json
+    python benchmarks/bench_agentctl.py --sizes 100,1000 --baseline /tmp/bench.json
+    python benchmarks/bench_agentctl.py --sizes 10000 --no-cli --repeat 3
+    python benchmarks/bench_agentctl.py --sizes 100 --no-cli --repeat 1 --check-loads
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SWARM_DIR = REPO_ROOT / ".codex-swarm"
+ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+DEFAULT_SIZES = "100,1000"
+OWNERS = ("CODER", "TESTER", "DOCS", "REVIEWER", "REDMINE")
+TAGS = ("code", "backend", "frontend", "docs", "workflow", "agentctl", "viewer", "perf", "redmine", "ci")
+STATUSES = (("DONE", 70), ("TODO", 15), ("DOING", 10), ("BLOCKED", 5))
+DOC_SECTIONS = ("Summary", "Context", "Scope", "Risks", "Verify Steps", "Rollback Plan", "Notes")
+# Command scenarios shared by the in-process and CLI runs.
+COMMANDS: dict[str, list[str]] = {
+    "task_list": ["task", "list"],
+    "task_next": ["task", "next", "--limit", "20"],
+    "task_search": ["task", "search", "verify"],
+    "task_show": ["task", "show", "{first_id}"],
+    "task_lint": ["task", "lint"],
+    "task_export": ["task", "export"],
+    "task_normalize": ["task", "normalize", "--force"],
+    "hook_commit_msg": ["hooks", "run", "commit-msg", "{commit_msg}"],
+}
+# Write commands run by --check-loads, in order: name -> (allowed backend scans, argv).
+# start and block patch tasks.json in place, which needs a current snapshot, so they run before the
+# commands that change the store without exporting.
+LOAD_CHECKS: dict[str, tuple[int, list[str]]] = {
+    "start": (0, ["start", "{todo_id}", "--author", "{todo_owner}", "--body", "Start: {note}"]),
+    "block": (0, ["block", "{todo_id}", "--author", "{todo_owner}", "--body", "Blocked: {note}"]),
+    "comment": (0, ["task", "comment", "{todo_id}", "--author", "{todo_owner}", "--body", "{note}"]),
+    "update": (0, ["task", "update", "{todo_id}", "--priority", "high"]),
+    # No --body: a comment would trigger finish_auto_status_commit and a real git commit.
+    "finish": (1, ["finish", "{todo_id}", "--commit", "HEAD", "--skip-verify", "--force"]),
+}
+
+
+def encode_suffix(index: int, width: int = 6) -> str:
+    chars: list[str] = []
+    for _ in range(width):
+        index, digit = divmod(index, len(ID_ALPHABET))
+        chars.append(ID_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def synthetic_task(
+    index: int, task_ids: list[str], statuses: list[str], rng: random.Random
+) -> tuple[dict[str, object], str]:
+    """Build one task; DONE/DOING tasks only depend on DONE tasks so the store passes `task lint`."""
+    status = statuses[index]
+    start = max(0, index - 50)
+    window = [
+        task_id
+        for task_id, dep_status in zip(task_ids[start:index], statuses[start:index], strict=True)
+        if status not in {"DONE", "DOING"} or dep_status == "DONE"
+    ]
+    depends_on = sorted(rng.sample(window, k=min(len(window), rng.randint(0, 3))))
+    comments: list[dict[str, object]] = [
+        {"author": rng.choice(OWNERS), "body": f"Note {n}: checked item {rng.randint(1, 999)}, see [log] {{ok}}."}
+        for n in range(rng.randint(0, 5))
+    ]
+    tags = sorted(rng.sample(TAGS, k=rng.randint(1, 3)))
+    frontmatter: dict[str, object] = {
+        "id": task_ids[index],
+        "title": f'Synthetic task {index}: update "component" {rng.randint(1, 500)}',
+        "status": status,
+        "priority": rng.choice(("low", "med", "high")),
+        "owner": rng.choice(OWNERS),
+        "depends_on": depends_on,
+        "tags": tags,
+        "verify": ["python -m compileall -q ."] if {"code", "backend", "frontend"} & set(tags) else [],
+    }
+    if status == "DONE":
+        frontmatter["commit"] = {"hash": f"{rng.getrandbits(160):040x}", "message": f"Finish task {index}"}
+        verified = "Verified: synthetic task checked end to end for the agentctl benchmark corpus."
+        comments.append({"author": "REVIEWER", "body": verified})
+    frontmatter.update(
+        {
+            "comments": comments,
+            "doc_version": 2,
+            "doc_updated_at": "2026-01-01T00:00:00+00:00",
+            "doc_updated_by": "agentctl",
+            "description": f"Synthetic description for task {index}.",
+        }
+    )
+    paragraph = "This section was generated for benchmarks and describes expected behaviour.\n"
+    doc = "\n\n".join(f"## {section}\n\n" + paragraph * rng.randint(1, 6) for section in DOC_SECTIONS)
+    if status == "DONE":
+        doc += "\n\n## Changes Summary (auto)\n\n" + "".join(f"- `src/module_{n}.py`\n" for n in range(10))
+    return frontmatter, doc
+
+
+def load_module(name: str, path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def git(workspace: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=workspace, check=True, capture_output=True)
+
+
+def build_workspace(root: Path, count: int, *, seed: int) -> dict[str, str]:
+    """Create a scratch repo with `count` synthetic tasks; return template values for COMMANDS."""
+    swarm = root / ".codex-swarm"
+    swarm.mkdir(parents=True)
+    shutil.copy2(SWARM_DIR / "agentctl.py", swarm / "agentctl.py")
+    shutil.copy2(SWARM_DIR / "agentctl_client.py", swarm / "agentctl_client.py")
+    shutil.copy2(SWARM_DIR / "config.json", swarm / "config.json")
+    shutil.copytree(SWARM_DIR / "backends", swarm / "backends", ignore=shutil.ignore_patterns("__pycache__"))
+    local = load_module(f"bench_local_backend_{count}", swarm / "backends" / "local" / "backend.py")
+    rng = random.Random(seed)  # noqa: S311
+    task_ids = [f"202601010000-{encode_suffix(index)}" for index in range(count)]
+    weights = [weight for _, weight in STATUSES]
+    statuses = [rng.choices([status for status, _ in STATUSES], weights=weights)[0] for _ in range(count)]
+    tasks_dir = swarm / "tasks"
+    for index in range(count):
+        frontmatter, doc = synthetic_task(index, task_ids, statuses, rng)
+        task_dir = tasks_dir / task_ids[index]
+        task_dir.mkdir(parents=True)
+        text = f"{local.format_frontmatter(frontmatter)}\n\n{doc}\n"
+        (task_dir / "README.md").write_text(text, encoding="utf-8")
+    commit_msg = root / "COMMIT_MSG"
+    commit_msg.write_text(f"{task_ids[-1].rsplit('-', 1)[1]} benchmark commit\n", encoding="utf-8")
+    git(root, "init", "-q", "-b", "main")
+    git(root, "config", "user.email", "bench@example.invalid")
+    git(root, "config", "user.name", "bench")
+    git(root, "add", ".codex-swarm/agentctl.py", ".codex-swarm/config.json")
+    git(root, "commit", "-q", "-m", "bench workspace")
+    return {"first_id": task_ids[0], "commit_msg": str(commit_msg)}
+
+
+def command_argv(name: str, values: dict[str, str]) -> list[str]:
+    return [part.format(**values) for part in COMMANDS[name]]
+
+
+def best_of(repeat: int, fn: Callable[[], object], *, before: Callable[[], object] | None = None) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@contextlib.contextmanager
+def inside(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_in_process(workspace: Path, values: dict[str, str], *, size: int, repeat: int) -> dict[str, float]:
+    with inside(workspace):
+        ctl = load_module(f"bench_agentctl_{size}", workspace / ".codex-swarm" / "agentctl.py")
+        backend = ctl.backend_instance()
+        backend_cls = type(backend)
+        settings = ctl.backend_settings()
+
+        def reset() -> None:
+            ctl._TASK_CACHE = None  # noqa: SLF001
+            ctl._TASK_HEADER_CACHE = None  # noqa: SLF001
+            ctl._TASK_INDEX_CACHE = None  # noqa: SLF001
+            ctl._TASK_DEP_CACHE = None  # noqa: SLF001
+
+        def main(argv: list[str]) -> None:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                try:
+                    ctl.main(["--quiet", *argv])
+                except SystemExit as exc:
+                    if exc.code not in (None, 0):
+                        raise RuntimeError(f"agentctl {' '.join(argv)} exited with {exc.code}") from exc
+
+        ctl.export_tasks_snapshot(quiet=True)
+        tasks = backend_cls(settings).list_tasks()
+        tasks_by_id, _ = ctl.index_tasks_by_id(tasks)
+        results = {
+            "backend.list_tasks": best_of(repeat, lambda: backend_cls(settings).list_tasks()),
+            "backend.list_task_headers": best_of(repeat, lambda: backend_cls(settings).list_task_headers()),
+            "compute_dependency_state": best_of(repeat, lambda: ctl.compute_dependency_state(tasks_by_id)),
+            "lint_tasks_json": best_of(repeat, ctl.lint_tasks_json),
+            "export_tasks_snapshot": best_of(repeat, lambda: ctl.export_tasks_snapshot(quiet=True), before=reset),
+        }
+        for name in COMMANDS:
+            argv = command_argv(name, values)
+            results[name] = best_of(repeat, lambda argv=argv: main(argv), before=reset)
+    return results
+
+
+def check_store_loads(workspace: Path, *, size: int) -> list[str]:
+    """Run LOAD_CHECKS against a TODO task whose dependencies are DONE; return budget violations."""
+    with inside(workspace):
+        ctl = load_module(f"bench_agentctl_loads_{size}", workspace / ".codex-swarm" / "agentctl.py")
+        backend = ctl.backend_instance()
+        tasks = backend.list_tasks()
+        tasks_by_id, _ = ctl.index_tasks_by_id(tasks)
+        dep_state, _ = ctl.compute_dependency_state(tasks_by_id)
+        todo = next(
+            (
+                task
+                for task_id, task in tasks_by_id.items()
+                if task.get("status") == "TODO" and not dep_state[task_id]["missing"] + dep_state[task_id]["incomplete"]
+            ),
+            None,
+        )
+        if todo is None:
+            return ["no ready TODO task in the corpus"]
+        values = {
+            "todo_id": str(todo["id"]),
+            "todo_owner": str(todo.get("owner") or "CODER"),
+            "note": "synthetic store-load check for the benchmark harness, no real work involved.",
+        }
+        calls = 0
+        list_tasks, list_task_headers = backend.list_tasks, backend.list_task_headers
+
+        def counting_list_tasks() -> list[dict[str, object]]:
+            nonlocal calls
+            calls += 1
+            return list_tasks()
+
+        def counting_list_task_headers() -> list[dict[str, object]]:
+            nonlocal calls
+            calls += 1
+            return list_task_headers()
+
+        backend.list_tasks = counting_list_tasks
+        backend.list_task_headers = counting_list_task_headers
+        violations: list[str] = []
+        for name, (budget, template) in LOAD_CHECKS.items():
+            ctl._TASK_CACHE = None  # noqa: SLF001
+            ctl._TASK_HEADER_CACHE = None  # noqa: SLF001
+            ctl._TASK_POINT_WRITES.clear()  # noqa: SLF001
+            calls = 0
+            argv = [part.format(**values) for part in template]
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                try:
+                    ctl.main(["--quiet", *argv])
+                except SystemExit as exc:
+                    if exc.code not in (None, 0):
+                        violations.append(f"{name}: exited with {exc.code}")
+                        continue
+            print(f"[{size}] {name}: backend scans x{calls}", file=sys.stderr)
+            if calls > budget:
+                violations.append(f"{name}: backend scanned {calls} times (budget {budget})")
+    return violations
+
+
+def run_cli(workspace: Path, values: dict[str, str], *, repeat: int) -> dict[str, float]:
+    agentctl = workspace / ".codex-swarm" / "agentctl.py"
+
+    def invoke(argv: list[str]) -> None:
+        subprocess.run(
+            [sys.executable, str(agentctl), "--quiet", *argv], cwd=workspace, check=True, capture_output=True
+        )
+
+    results = {"cli.startup": best_of(repeat, lambda: invoke(["--help"]))}
+    for name in COMMANDS:
+        argv = command_argv(name, values)
+        results[f"cli.{name}"] = best_of(repeat, lambda argv=argv: invoke(argv))
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    threshold: float,
+    min_delta: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for size, scenarios in results.items():
+        for scenario, seconds in scenarios.items():
+            before = baseline.get(size, {}).get(scenario)
+            if before is None or before <= 0:
+                continue
+            if seconds > before * (1 + threshold) and seconds - before > min_delta:
+                regressions.append(f"{size} {scenario}: {before:.4f}s -> {seconds:.4f}s (x{seconds / before:.2f})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark agentctl hot paths on synthetic task stores")
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help=f"Comma-separated task counts (default: {DEFAULT_SIZES})"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of repetitions per scenario (default: 5)")
+    parser.add_argument("--seed", type=int, default=1, help="Corpus RNG seed (default: 1)")
+    parser.add_argument("--no-cli", action="store_true", help="Skip subprocess (CLI) scenarios")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this path")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown ratio (default: 0.25)")
+    parser.add_argument("--min-delta", type=float, default=0.01, help="Ignore slowdowns under N seconds")
+    parser.add_argument(
+        "--check-loads", action="store_true", help="Fail if a write command scans the backend more than its budget"
+    )
+    args = parser.parse_args()
+
+    sizes = [int(part) for part in args.sizes.split(",") if part.strip()]
+    results: dict[str, dict[str, float]] = {}
+    load_violations: list[str] = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix=f"bench-agentctl-{size}-") as tmp:
+            workspace = Path(tmp)
+            started = time.perf_counter()
+            values = build_workspace(workspace, size, seed=args.seed)
+            print(f"[{size}] workspace ready in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            scenarios = run_in_process(workspace, values, size=size, repeat=args.repeat)
+            if not args.no_cli:
+                scenarios.update(run_cli(workspace, values, repeat=args.repeat))
+            results[str(size)] = scenarios
+            if args.check_loads:
+                load_violations.extend(f"{size} {line}" for line in check_store_loads(workspace, size=size))
+
+    report = {
+        "created_at": datetime.now(UTC).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    scenario_names = list(dict.fromkeys(name for scenarios in results.values() for name in scenarios))
+    print("scenario".ljust(28) + "".join(str(size).rjust(12) for size in sizes))
+    for name in scenario_names:
+        row = "".join(f"{results[str(size)][name]:12.4f}" if name in results[str(size)] else " " * 12 for size in sizes)
+        print(name.ljust(28) + row)
+    if load_violations:
+        print("Store load budget exceeded:")
+        for line in load_violations:
+            print(f"  {line}")
+        return 1
+    if not args.baseline:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")).get("results", {})
+    regressions = compare(results, baseline, threshold=args.threshold, min_delta=args.min_delta)
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
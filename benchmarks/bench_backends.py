@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Compare task backends on a synthetic corpus.
+
+Each backend gets a fresh temporary directory and runs the same workload:
+bulk create, status changes, comment appends, a cold list (new instance) and a
+tasks.json export. Timings are wall-clock seconds.
+
+    python benchmarks/bench_backends.py --tasks 2000 --updates 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol, cast
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BACKENDS_DIR = REPO_ROOT / ".codex-swarm" / "backends"
+# backend id -> (module path, class name, settings factory given a scratch dir)
+BACKENDS: dict[str, tuple[str, str, Callable[[Path], dict[str, object]]]] = {
+    "local": ("local/backend.py", "LocalBackend", lambda root: {"dir": str(root / "tasks")}),
+    "eventlog": ("eventlog/backend.py", "EventLogBackend", lambda root: {"dir": str(root / "eventlog")}),
+    "sqlite": ("sqlite/backend.py", "SqliteBackend", lambda root: {"path": str(root / "tasks.sqlite3")}),
+}
+
+
+class BenchBackend(Protocol):
+    def list_tasks(self) -> list[dict[str, object]]: ...
+
+    def get_task(self, task_id: str) -> dict[str, object] | None: ...
+
+    def write_task(self, task: dict[str, object]) -> None: ...
+
+    def write_tasks(self, tasks: list[dict[str, object]]) -> None: ...
+
+    def export_tasks_json(self, output_path: Path) -> None: ...
+
+
+BackendFactory = Callable[[dict[str, object]], BenchBackend]
+
+
+def load_backend_class(backend_id: str) -> BackendFactory:
+    rel_path, class_name, _ = BACKENDS[backend_id]
+    module_name = f"bench_backend_{backend_id}"
+    spec = importlib.util.spec_from_file_location(module_name, BACKENDS_DIR / rel_path)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load backend module: {rel_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return cast(BackendFactory, getattr(module, class_name))
+
+
+def synthetic_tasks(count: int) -> list[dict[str, object]]:
+    tasks: list[dict[str, object]] = []
+    for index in range(count):
+        task_id = f"202601010000-{index:06X}"
+        tasks.append(
+            {
+                "id": task_id,
+                "title": f"Synthetic task {index}",
+                "description": "Generated for backend benchmarks.",
+                "status": "TODO",
+                "priority": "med",
+                "owner": ("CODER", "TESTER", "DOCS")[index % 3],
+                "depends_on": [f"202601010000-{index - 1:06X}"] if index and index % 5 else [],
+                "tags": ["bench", f"group-{index % 10}"],
+                "verify": [],
+                "comments": [],
+                "doc": "## Summary\n\nSynthetic.\n",
+            }
+        )
+    return tasks
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_workload(backend_id: str, *, task_count: int, updates: int) -> dict[str, float]:
+    backend_cls = load_backend_class(backend_id)
+    settings_factory = BACKENDS[backend_id][2]
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix=f"bench-{backend_id}-") as tmp:
+        root = Path(tmp)
+        settings = settings_factory(root)
+        backend = backend_cls(settings)
+        tasks = synthetic_tasks(task_count)
+
+        results["create_all"] = timed(lambda: backend.write_tasks(tasks))
+
+        def status_changes() -> None:
+            for index in range(updates):
+                task = dict(tasks[index % task_count])
+                task["status"] = "DOING" if index % 2 == 0 else "BLOCKED"
+                backend.write_task(task)
+
+        def comment_appends() -> None:
+            for index in range(updates):
+                task = backend.get_task(str(tasks[index % task_count]["id"])) or {}
+                comments_value = task.get("comments")
+                comments = list(comments_value) if isinstance(comments_value, list) else []
+                comments.append({"author": "CODER", "body": f"Comment {index}"})
+                task["comments"] = comments
+                backend.write_task(task)
+
+        results["status_updates"] = timed(status_changes)
+        results["comment_appends"] = timed(comment_appends)
+        cold = backend_cls(settings)
+        results["cold_list"] = timed(lambda: cold.list_tasks())
+        results["warm_list"] = timed(lambda: cold.list_tasks())
+        results["export"] = timed(lambda: cold.export_tasks_json(root / "tasks.json"))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare task backend performance")
+    parser.add_argument("--tasks", type=int, default=1000, help="Synthetic task count (default: 1000)")
+    parser.add_argument("--updates", type=int, default=200, help="Status/comment updates per phase (default: 200)")
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS), help="Repeatable (default: all)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    backend_ids = args.backend or sorted(BACKENDS)
+    report = {
+        backend_id: run_workload(backend_id, task_count=args.tasks, updates=args.updates) for backend_id in backend_ids
+    }
+    if args.json:
+        print(json.dumps({"tasks": args.tasks, "updates": args.updates, "results": report}, indent=2))
+        return 0
+    phases = list(next(iter(report.values())))
+    print(f"tasks={args.tasks} updates={args.updates} (seconds)")
+    print("phase".ljust(18) + "".join(backend_id.rjust(12) for backend_id in backend_ids))
+    for phase in phases:
+        print(phase.ljust(18) + "".join(f"{report[b][phase]:12.4f}" for b in backend_ids))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Compare the local backend README parser with the previous splitlines-based parser.
+
+The legacy implementation is kept here verbatim so results stay comparable after the
+backend changes. Every corpus document is parsed by both implementations first and the
+run aborts if frontmatter, body or doc differ.
+
+    python benchmarks/bench_frontmatter.py --repeat 20
+    python benchmarks/bench_frontmatter.py --synthetic 2000 --comments 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+LOCAL_BACKEND = REPO_ROOT / ".codex-swarm" / "backends" / "local" / "backend.py"
+TASKS_DIR = REPO_ROOT / ".codex-swarm" / "tasks"
+
+
+def load_local_backend() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("bench_local_backend", LOCAL_BACKEND)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load backend module: {LOCAL_BACKEND}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- legacy parser -----------------------------------------------------------------------
+
+
+def legacy_split_top_level(value: str, sep: str = ",") -> list[str]:
+    parts: list[str] = []
+    buf: list[str] = []
+    depth = 0
+    quote: str | None = None
+    for ch in value:
+        if quote:
+            buf.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch in ('"', "'"):
+            buf.append(ch)
+            quote = ch
+            continue
+        if ch in "[{(":
+            depth += 1
+            buf.append(ch)
+            continue
+        if ch in "]})":
+            depth = max(0, depth - 1)
+            buf.append(ch)
+            continue
+        if ch == sep and depth == 0:
+            parts.append("".join(buf).strip())
+            buf = []
+            continue
+        buf.append(ch)
+    if buf:
+        parts.append("".join(buf).strip())
+    return [p for p in parts if p]
+
+
+def legacy_strip_quotes(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
+
+def legacy_parse_scalar(value: str) -> object:
+    raw = value.strip()
+    if not raw:
+        return ""
+    lowered = raw.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered in {"null", "none"}:
+        return None
+    if raw[0] in ('"', "'") and raw[-1] == raw[0]:
+        if raw[0] == '"':
+            try:
+                return json.loads(raw)
+            except json.JSONDecodeError:
+                return legacy_strip_quotes(raw)
+        return legacy_strip_quotes(raw)
+    if raw.isdigit():
+        return int(raw)
+    return raw
+
+
+def legacy_parse_inline_list(value: str) -> list[object]:
+    inner = value.strip()[1:-1].strip()
+    if not inner:
+        return []
+    return [legacy_parse_scalar(item) for item in legacy_split_top_level(inner)]
+
+
+def legacy_parse_inline_dict(value: str) -> dict[str, object]:
+    inner = value.strip()[1:-1].strip()
+    if not inner:
+        return {}
+    result: dict[str, object] = {}
+    for entry in legacy_split_top_level(inner):
+        if ":" not in entry:
+            continue
+        key, raw_val = entry.split(":", 1)
+        result[legacy_strip_quotes(key.strip())] = legacy_parse_value(raw_val.strip())
+    return result
+
+
+def legacy_parse_value(value: str) -> object:
+    raw = value.strip()
+    if raw.startswith("[") and raw.endswith("]"):
+        return legacy_parse_inline_list(raw)
+    if raw.startswith("{") and raw.endswith("}"):
+        return legacy_parse_inline_dict(raw)
+    return legacy_parse_scalar(raw)
+
+
+def legacy_parse_frontmatter_lines(lines: Iterable[str]) -> dict[str, object]:
+    data: dict[str, object] = {}
+    current_list_key: str | None = None
+    for raw_line in lines:
+        if not raw_line.strip():
+            continue
+        if raw_line.lstrip().startswith("#"):
+            continue
+        if raw_line.startswith("  - ") and current_list_key:
+            item_text = raw_line.strip()[2:].strip()
+            item: object
+            if item_text.startswith("{") and item_text.endswith("}"):
+                item = legacy_parse_inline_dict(item_text)
+            else:
+                item = legacy_parse_value(item_text)
+            current = data.get(current_list_key)
+            if isinstance(current, list):
+                current.append(item)
+            else:
+                data[current_list_key] = [item]
+            continue
+        current_list_key = None
+        if ":" not in raw_line:
+            continue
+        key, raw_val = raw_line.split(":", 1)
+        value = raw_val.strip()
+        if not value:
+            data[key.strip()] = []
+            current_list_key = key.strip()
+            continue
+        data[key.strip()] = legacy_parse_value(value)
+    return data
+
+
+def legacy_parse_frontmatter(text: str) -> tuple[dict[str, object], str]:
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+    end_idx = None
+    for idx in range(1, len(lines)):
+        if lines[idx].strip() == "---":
+            end_idx = idx
+            break
+    if end_idx is None:
+        return {}, text
+    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
+    return legacy_parse_frontmatter_lines(lines[1:end_idx]), body
+
+
+def legacy_extract_task_doc(body: str) -> str:
+    if not body:
+        return ""
+    lines = body.splitlines()
+    start_idx = None
+    for idx, line in enumerate(lines):
+        if line.strip() == "## Summary":
+            start_idx = idx
+            break
+    if start_idx is None:
+        return ""
+    end_idx = len(lines)
+    for idx in range(start_idx + 1, len(lines)):
+        if lines[idx].strip() == "## Changes Summary (auto)":
+            end_idx = idx
+            break
+    return "\n".join(lines[start_idx:end_idx]).rstrip()
+
+
+# --- corpus ------------------------------------------------------------------------------
+
+
+def repo_corpus() -> list[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(TASKS_DIR.glob("*/README.md"))]
+
+
+def synthetic_corpus(backend: ModuleType, count: int, comments: int) -> list[str]:
+    texts: list[str] = []
+    for index in range(count):
+        frontmatter: dict[str, object] = {
+            "id": f"202601010000-{index:06X}",
+            "title": f'Synthetic task {index} with "quotes", commas and a \\ backslash',
+            "status": "DONE",
+            "priority": "med",
+            "owner": "CODER",
+            "depends_on": [f"202601010000-{index - 1:06X}"] if index else [],
+            "tags": ["bench", f"group-{index % 10}", "a, b"],
+            "verify": ["python -m compileall -q ."],
+            "commit": {"hash": f"{index:040x}", "message": "Synthetic commit"},
+            "comments": [
+                {"author": "CODER", "body": f'Comment {n}: done, verified [ok] {{x}} — "quoted"'}
+                for n in range(comments)
+            ],
+            "doc_version": 2,
+            "doc_updated_at": "2026-01-01T00:00:00+00:00",
+            "doc_updated_by": "agentctl",
+        }
+        sections = "\n".join(f"### Section {n}\n\n" + "Verify notes line.\n" * 20 for n in range(10))
+        doc = f"## Summary\n\nSynthetic {index}.\n\n{sections}"
+        auto = "## Changes Summary (auto)\n\n" + "- file.py: changed\n" * 50
+        texts.append(f"{backend.format_frontmatter(frontmatter)}\n\n{doc}\n\n{auto}")
+    return texts
+
+
+# --- benchmark ---------------------------------------------------------------------------
+
+
+def legacy_parse(text: str) -> tuple[dict[str, object], str, str]:
+    frontmatter, body = legacy_parse_frontmatter(text)
+    return frontmatter, body, legacy_extract_task_doc(body)
+
+
+def check_equivalent(backend: ModuleType, corpus: list[str]) -> None:
+    for index, text in enumerate(corpus):
+        parsed = backend.parse_frontmatter(text)
+        current = (parsed.frontmatter, parsed.body, backend.extract_task_doc(parsed.body))
+        if current != legacy_parse(text):
+            raise SystemExit(f"Parser mismatch on corpus document {index}")
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(backend: ModuleType, corpus: list[str], *, repeat: int) -> dict[str, float]:
+    def current_full() -> None:
+        for text in corpus:
+            parsed = backend.parse_frontmatter(text)
+            backend.extract_task_doc(parsed.body)
+
+    def legacy_full() -> None:
+        for text in corpus:
+            legacy_parse(text)
+
+    results = {
+        "legacy_full": best_of(repeat, legacy_full),
+        "current_full": best_of(repeat, current_full),
+    }
+    with tempfile.TemporaryDirectory(prefix="bench-frontmatter-") as tmp:
+        paths: list[Path] = []
+        for index, text in enumerate(corpus):
+            path = Path(tmp) / f"{index}.md"
+            path.write_text(text, encoding="utf-8")
+            paths.append(path)
+
+        def legacy_files() -> None:
+            for path in paths:
+                legacy_parse_frontmatter(path.read_text(encoding="utf-8"))
+
+        def current_headers() -> None:
+            for path in paths:
+                backend.read_frontmatter(path)
+
+        results["legacy_file_frontmatter"] = best_of(repeat, legacy_files)
+        results["current_file_frontmatter"] = best_of(repeat, current_headers)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the local backend README parser")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N synthetic READMEs instead of repo tasks")
+    parser.add_argument("--comments", type=int, default=20, help="Comments per synthetic README (default: 20)")
+    parser.add_argument("--repeat", type=int, default=10, help="Best-of repetitions per phase (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    backend = load_local_backend()
+    corpus = synthetic_corpus(backend, args.synthetic, args.comments) if args.synthetic else repo_corpus()
+    if not corpus:
+        print("No READMEs to parse.", file=sys.stderr)
+        return 1
+    check_equivalent(backend, corpus)
+    results = run(backend, corpus, repeat=args.repeat)
+    if args.json:
+        print(json.dumps({"documents": len(corpus), "repeat": args.repeat, "results": results}, indent=2))
+        return 0
+    print(f"documents={len(corpus)} repeat={args.repeat} (best seconds)")
+    for phase, seconds in results.items():
+        print(f"{phase.ljust(26)}{seconds:10.4f}")
+    print(f"{'full speedup'.ljust(26)}{results['legacy_full'] / results['current_full']:9.2f}x")
+    print(
+        f"{'frontmatter speedup'.ljust(26)}"
+        f"{results['legacy_file_frontmatter'] / results['current_file_frontmatter']:9.2f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Measure the Redmine backend against an in-process fake Redmine.
+
+The fake serves the subset of the REST API the backend uses (issue listing with paging and
+`cf_<id>` filters, issue GET/POST/PUT with journals) and sleeps --latency-ms per request to stand
+in for a remote server. Each phase reports wall-clock seconds and the requests it sent: full
+listings, then --create new tasks written one by one and through import_tasks (`task migrate`),
+then a status change on each imported task, written directly and queued in the outbox (then flushed).
+
+    python benchmarks/bench_redmine.py --issues 5000 --latency-ms 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Protocol, cast
+from urllib.parse import parse_qs, urlparse
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+REDMINE_BACKEND = REPO_ROOT / ".codex-swarm" / "backends" / "redmine" / "backend.py"
+CUSTOM_FIELDS = {
+    "task_id": 1,
+    "verify": 2,
+    "commit": 3,
+    "doc": 4,
+    "comments": 5,
+    "doc_version": 6,
+    "doc_updated_at": 7,
+    "doc_updated_by": 8,
+}
+STATUS_MAP = {"TODO": 1, "DOING": 2, "BLOCKED": 3, "DONE": 4}
+MAX_LIMIT = 100
+
+JsonDict = dict[str, object]
+
+
+class BenchBackend(Protocol):
+    def list_tasks(self) -> list[dict[str, object]]: ...
+
+    def write_task(self, task: dict[str, object]) -> None: ...
+
+    def import_tasks(self, tasks: list[dict[str, object]]) -> None: ...
+
+    def flush_outbox(self) -> dict[str, int]: ...
+
+
+class FakeRedmine(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), FakeRedmineHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.issues: dict[int, JsonDict] = {}
+        self.requests: dict[str, int] = {}
+        self.bytes_sent = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests = {}
+            self.bytes_sent = 0
+
+    def seed(self, count: int) -> None:
+        for index in range(count):
+            self.create_issue({"subject": f"Seeded task {index}", "custom_fields": seed_fields(index)})
+
+    def create_issue(self, fields: JsonDict) -> JsonDict:
+        with self.lock:
+            issue_id = len(self.issues) + 1
+            issue: JsonDict = {"id": issue_id, "status": {"id": 1}, "custom_fields": [], "journals": []}
+            self.issues[issue_id] = issue
+        self.update_issue(issue, fields)
+        return issue
+
+    def update_issue(self, issue: JsonDict, fields: JsonDict) -> None:
+        with self.lock:
+            for key, value in fields.items():
+                if key == "custom_fields" and isinstance(value, list):
+                    current = {field["id"]: field for field in cast(list[JsonDict], issue["custom_fields"])}
+                    for field in cast(list[JsonDict], value):
+                        current[field["id"]] = {"id": field["id"], "value": field.get("value")}
+                    issue["custom_fields"] = list(current.values())
+                elif key == "status_id":
+                    issue["status"] = {"id": value}
+                elif key == "notes":
+                    cast(list[JsonDict], issue["journals"]).append({"notes": value})
+                elif key not in {"project_id", "uploads"}:
+                    issue[key] = value
+            issue["updated_on"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def seed_fields(index: int) -> list[JsonDict]:
+    return [
+        {"id": CUSTOM_FIELDS["task_id"], "value": f"202601010000-{index:06X}"},
+        {"id": CUSTOM_FIELDS["doc"], "value": "## Summary\n\nSeeded.\n"},
+        {"id": CUSTOM_FIELDS["comments"], "value": "[]"},
+    ]
+
+
+def new_tasks(prefix: str, count: int) -> list[JsonDict]:
+    return [
+        {
+            "id": f"202602010000-{prefix}{index:05X}",
+            "title": f"Migrated task {index}",
+            "status": "DONE" if index % 2 else "TODO",
+            "doc": "## Summary\n\nMigrated.\n",
+            "comments": [{"author": "CODER", "body": f"Note {n}"} for n in range(2)],
+        }
+        for index in range(count)
+    ]
+
+
+class FakeRedmineHandler(BaseHTTPRequestHandler):
+    server: FakeRedmine
+
+    def log_message(self, *_args: object) -> None:
+        return
+
+    def _reply(self, status: int, payload: JsonDict | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _begin(self) -> tuple[str, dict[str, list[str]], JsonDict]:
+        time.sleep(self.server.latency)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        with self.server.lock:
+            self.server.requests[self.command] = self.server.requests.get(self.command, 0) + 1
+            self.server.bytes_sent += len(raw)
+        parsed = urlparse(self.path)
+        body = json.loads(raw) if raw else {}
+        return parsed.path, parse_qs(parsed.query), body if isinstance(body, dict) else {}
+
+    def _issue(self, path: str) -> JsonDict | None:
+        raw_id = path.removeprefix("/issues/").removesuffix(".json")
+        return self.server.issues.get(int(raw_id)) if raw_id.isdigit() else None
+
+    def do_GET(self) -> None:  # noqa: N802
+        path, query, _ = self._begin()
+        if path == "/issues.json":
+            issues = sorted(self.server.issues.values(), key=lambda issue: cast(int, issue["id"]))
+            for key, values in query.items():
+                if key.startswith("cf_"):
+                    field_id = int(key[3:])
+                    issues = [issue for issue in issues if _field_value(issue, field_id) == values[0]]
+            offset = int(query.get("offset", ["0"])[0])
+            limit = min(MAX_LIMIT, int(query.get("limit", ["25"])[0]))
+            page = issues[offset : offset + limit]
+            self._reply(200, {"issues": page, "total_count": len(issues), "offset": offset, "limit": limit})
+            return
+        issue = self._issue(path)
+        self._reply(200, {"issue": issue}) if issue is not None else self._reply(404, {"errors": ["Not found"]})
+
+    def do_POST(self) -> None:  # noqa: N802
+        path, _, body = self._begin()
+        fields = body.get("issue")
+        if path != "/issues.json" or not isinstance(fields, dict):
+            self._reply(422, {"errors": ["Invalid issue"]})
+            return
+        self._reply(201, {"issue": self.server.create_issue(fields)})
+
+    def do_PUT(self) -> None:  # noqa: N802
+        path, _, body = self._begin()
+        issue = self._issue(path)
+        fields = body.get("issue")
+        if issue is None or not isinstance(fields, dict):
+            self._reply(404, {"errors": ["Not found"]})
+            return
+        self.server.update_issue(issue, fields)
+        self._reply(204)
+
+
+def _field_value(issue: JsonDict, field_id: int) -> object:
+    for field in cast(list[JsonDict], issue.get("custom_fields") or []):
+        if field.get("id") == field_id:
+            return field.get("value")
+    return None
+
+
+def load_backend_class() -> Callable[[JsonDict], BenchBackend]:
+    spec = importlib.util.spec_from_file_location("bench_redmine_backend", REDMINE_BACKEND)
+    if not spec or not spec.loader:
+        raise RuntimeError(f"Unable to load backend module: {REDMINE_BACKEND}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return cast(Callable[[JsonDict], BenchBackend], module.RedmineBackend)
+
+
+def measure(server: FakeRedmine, fn: Callable[[], object]) -> JsonDict:
+    server.reset_counters()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    with server.lock:
+        return {"seconds": seconds, "requests": dict(server.requests), "bytes_sent": server.bytes_sent}
+
+
+def run(args: argparse.Namespace) -> dict[str, JsonDict]:
+    backend_cls = load_backend_class()
+    server = FakeRedmine(args.latency_ms / 1000)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    results: dict[str, JsonDict] = {}
+    try:
+        server.seed(args.issues)
+        with tempfile.TemporaryDirectory(prefix="bench-redmine-") as tmp:
+
+            def backend(**overrides: object) -> BenchBackend:
+                settings: JsonDict = {
+                    "url": server.url,
+                    "api_key": "bench",
+                    "project_id": "bench",
+                    "status_map": STATUS_MAP,
+                    "custom_fields": CUSTOM_FIELDS,
+                    "index_path": str(Path(tmp) / "redmine-index.json"),
+                    "batch_pause": 0,
+                    **overrides,
+                }
+                return backend_cls(settings)
+
+            serial = backend(fetch_workers=1)
+            results["list_serial"] = measure(server, serial.list_tasks)
+            concurrent = backend(fetch_workers=args.workers)
+            results[f"list_workers_{args.workers}"] = measure(server, concurrent.list_tasks)
+            if args.create:
+                one_by_one = backend()
+
+                def write_one_by_one() -> None:
+                    for task in new_tasks("A", args.create):
+                        one_by_one.write_task(task)
+
+                results[f"write_task_new_{args.create}"] = measure(server, write_one_by_one)
+                results[f"import_new_{args.create}"] = measure(
+                    server, lambda: backend().import_tasks(new_tasks("B", args.create))
+                )
+                updater = backend()
+                imported = [task for task in updater.list_tasks() if str(task["id"]).split("-")[1].startswith("B")]
+
+                def flip_status() -> None:
+                    for task in imported:
+                        task["status"] = "DOING"
+                        updater.write_task(task)
+
+                results[f"status_flip_{args.create}"] = measure(server, flip_status)
+                queued = backend(outbox=True, outbox_path=str(Path(tmp) / "outbox.jsonl"), cache_dir=tmp, flush_rate=0)
+
+                def queue_status() -> None:
+                    for task in imported:
+                        task["status"] = "BLOCKED"
+                        queued.write_task(task)
+
+                results[f"outbox_status_flip_{args.create}"] = measure(server, queue_status)
+                results["outbox_flush"] = measure(server, queued.flush_outbox)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Redmine backend against a fake server")
+    parser.add_argument("--issues", type=int, default=2000, help="Issues seeded before listing (default: 2000)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay per request (default: 20)")
+    parser.add_argument("--workers", type=int, default=4, help="fetch_workers for the concurrent listing (default: 4)")
+    parser.add_argument("--create", type=int, default=200, help="New tasks written per create phase (default: 200)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        print(json.dumps({"issues": args.issues, "latency_ms": args.latency_ms, "results": results}, indent=2))
+        return 0
+    print(f"issues={args.issues} latency_ms={args.latency_ms:g}")
+    columns = "".join(label.rjust(7) for label in ("GET", "POST", "PUT"))
+    print("phase".ljust(22) + "seconds".rjust(10) + columns + "sent_kb".rjust(10))
+    for phase, result in results.items():
+        requests = cast(dict[str, int], result["requests"])
+        print(
+            phase.ljust(22)
+            + f"{cast(float, result['seconds']):10.3f}"
+            + "".join(f"{requests.get(method, 0):7d}" for method in ("GET", "POST", "PUT"))
+            + f"{cast(int, result['bytes_sent']) / 1024:10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())